@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+'''
+benchmark: how well does the server keep serving while many slow clients
+(eg. mobile uploads on a bad connection) are connected?
+
+Opens `--slow` connections that trickle a create_game request body at a few
+hundred bytes a second, and meanwhile makes ordinary `GET /api/games` requests
+from `--fast` clients, reporting their latency. Compare the two server modes:
+
+    # wsgi, sync workers
+    gunicorn --preload -w 4 -b 127.0.0.1:8000 dhoyu.wsgi:app
+
+    # asgi
+    uvicorn --port 8000 dhoyu.asgi:app
+
+    python bench/slow_clients.py --url http://127.0.0.1:8000 --username username1 --password password
+
+Only needs the standard library.
+'''
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from urllib.parse import urlsplit
+
+
+async def request(host, port, method, path, headers=None, body=b''):
+    reader, writer = await asyncio.open_connection(host, port)
+    head = '{} {} HTTP/1.1\r\nHost: {}\r\nConnection: close\r\nContent-Length: {}\r\n'.format(
+        method, path, host, len(body))
+    for name, value in (headers or {}).items():
+        head += '{}: {}\r\n'.format(name, value)
+    writer.write(head.encode('latin-1') + b'\r\n' + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    status = int(response.split(b' ', 2)[1])
+    return status, response.split(b'\r\n\r\n', 1)[1]
+
+
+async def get_token(host, port, username, password):
+    status, body = await request(host, port, 'POST', '/api/token',
+                                 {'Content-Type': 'application/json'},
+                                 json.dumps({'username': username, 'password': password}).encode())
+    if status != 200:
+        raise SystemExit('could not log in: {} {}'.format(status, body))
+    return json.loads(body.decode())['token']
+
+
+async def slow_client(host, port, token, size, rate, stop):
+    '''
+    send a create_game request a little at a time, until stopped
+    '''
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        return
+    head = ('POST /api/games HTTP/1.1\r\nHost: {}\r\nAuthorization: Bearer {}\r\n'
+            'Content-Type: application/json\r\nContent-Length: {}\r\n\r\n').format(host, token, size)
+    writer.write(head.encode('latin-1'))
+    sent = 0
+    try:
+        while sent < size and not stop.is_set():
+            chunk = min(rate, size - sent)
+            writer.write(b' ' * chunk)
+            await writer.drain()
+            sent += chunk
+            await asyncio.sleep(1)
+    except OSError:
+        pass
+    writer.close()
+
+
+async def fast_client(host, port, token, stop, latencies, errors):
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            status, _ = await asyncio.wait_for(
+                request(host, port, 'GET', '/api/games', {'Authorization': 'Bearer ' + token}),
+                timeout=30)
+        except (OSError, asyncio.TimeoutError):
+            status = None
+        if status == 200:
+            latencies.append(time.perf_counter() - start)
+        else:
+            errors.append(status)
+
+
+async def main(args):
+    url = urlsplit(args.url)
+    host, port = url.hostname, url.port or 80
+
+    token = await get_token(host, port, args.username, args.password)
+    stop = asyncio.Event()
+    latencies, errors = [], []
+
+    slow = [asyncio.ensure_future(slow_client(host, port, token, args.body_size, args.rate, stop))
+            for _ in range(args.slow)]
+    # give the slow clients time to connect and tie things up
+    await asyncio.sleep(2)
+
+    fast = [asyncio.ensure_future(fast_client(host, port, token, stop, latencies, errors))
+            for _ in range(args.fast)]
+    await asyncio.sleep(args.duration)
+    stop.set()
+    await asyncio.gather(*fast, *slow)
+
+    print('{} slow clients, {} fast clients, {}s'.format(args.slow, args.fast, args.duration))
+    print('fast requests: {} ok ({:.1f}/s), {} failed'.format(
+        len(latencies), len(latencies) / args.duration, len(errors)))
+    if latencies:
+        latencies.sort()
+        print('latency: median {:.1f}ms, p95 {:.1f}ms, max {:.1f}ms'.format(
+            statistics.median(latencies) * 1000,
+            latencies[int(len(latencies) * 0.95)] * 1000,
+            latencies[-1] * 1000))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--username', default='username1')
+    parser.add_argument('--password', default='password')
+    parser.add_argument('--slow', type=int, default=500, help='number of slow clients')
+    parser.add_argument('--fast', type=int, default=4, help='number of fast clients')
+    parser.add_argument('--body-size', type=int, default=200000,
+                        help='bytes in each slow request body')
+    parser.add_argument('--rate', type=int, default=500,
+                        help='bytes per second sent by each slow client')
+    parser.add_argument('--duration', type=float, default=10, help='seconds to measure for')
+    asyncio.get_event_loop().run_until_complete(main(parser.parse_args()))
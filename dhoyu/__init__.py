@@ -1,117 +1,123 @@
+import gc
 import os
 import sys
 import logging
 
-import click
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 
 from . import pmi
 
 
-# load the pmi engine
-with open('res/kriol.txt') as f:
-    pmi.init_pmi('rop', f)
-
-# create and configure the app
-app = Flask(__name__, instance_relative_config=True)
-
-app.config.from_mapping(
-    SECRET_KEY='dev',
-    SQLALCHEMY_DATABASE_URI='sqlite:///' + os.path.join(app.instance_path, 'db.sqlite3'),
-    SQLALCHEMY_TRACK_MODIFICATIONS=False,
-    # SQLALCHEMY_ECHO=True,
-)
-
-app.config.from_pyfile('config.py', silent=True)
-
-if 'gunicorn' in os.environ.get('SERVER_SOFTWARE', ''):
-    gunicorn_logger = logging.getLogger('gunicorn.error')
-    app.logger.handlers = gunicorn_logger.handlers
-    app.logger.setLevel(gunicorn_logger.level)
-
-# ensure the instance folder exists
-try:
-    os.makedirs(app.instance_path, exist_ok=True)
-except OSError as e:
-    app.logger.error(e)
-    sys.exit(1)
-
-
-# register the db instance
-db = SQLAlchemy(app)
-
-from .models import User, Game, Card, Audio, Image, Category, Language, Flag, Like
-
-from . import api
-app.register_blueprint(api.bp)
-
-# TODO, XXX: below is here for demo/marking purposes only. DO NOT ENABLE IN PRODUCTION
-# put `export DEMO=` in .env to enable this
-if 'DEMO' in os.environ:
-    from . import demo_views
-    app.register_blueprint(demo_views.bp)
-
-@click.command('db-up')
-def init_db_command():
-    db.create_all()
-    click.echo('Database inited.')
-
-@click.command('db-down')
-def wipe_db_command():
-    db.drop_all()
-    click.echo('Database tabled dropped.')
-
-def reset_db():
-    db.drop_all()
-    db.create_all()
-
-@click.command('db-demo')
-def demo_db_command():
-    click.echo('wiping db and creating some demo data')
-
-    reset_db()
-
-    # some users, one being admin
-    # TODO: remove this for security reasons
-    # TODO: provide flask command to add a new admin/user
-    admin1 = User('username1', 'password', admin=True)
-    user1 = User('username2', 'password')
-
-    kriol = Language('rop', 'Kriol')
-
-    # categories
-    cat1 = Category('Fruit', user1, kriol)
-    cat2 = Category('Random', user1, kriol)
-
-
-    # some games
-    game1 = Game('epul', user1, kriol, public=True)
-    # game1.audios.append(Audio('https://upload.wikimedia.org/wikipedia/commons/9/9a/En-us-apple.ogg'))
-    game1.images.append(Image('/9j/4AAQSkZJRgABAQEASABIAAD//gBXRmlsZSBzb3VyY2U6IGh0dHA6Ly9jb21tb25zLndpa2ltZWRpYS5vcmcvd2lraS9GaWxlOkFwcGxlX3JlZF9kZWxpY2l1c19mbG93ZXJfZW5kLmpwZ//bAEMABgQFBgUEBgYFBgcHBggKEAoKCQkKFA4PDBAXFBgYFxQWFhodJR8aGyMcFhYgLCAjJicpKikZHy0wLSgwJSgpKP/bAEMBBwcHCggKEwoKEygaFhooKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKP/AABEIAVoBSgMBIgACEQEDEQH/xAAbAAACAwEBAQAAAAAAAAAAAAAEBQIDBgEAB//EADsQAAICAQMCBQIDCAICAgIDAQECAxEABBIhMUEFEyJRYXGBMpGhBhQjQrHB0fDh8TNSFSQWQwdicqL/xAAbAQACAwEBAQAAAAAAAAAAAAADBAABAgUGB//EADERAAICAgICAQMDAwMEAwAAAAABAhEDIRIxBEEFEyJRMmFxgZGhFELRIyQzscHw8f/aAAwDAQACEQMRAD8AxmkBUCxi/wDaB6ga/bGwG1Qe+JfGGBVr74tLejaMZpEY64nkWfbN/wCEAiNQcyWlVf3g0OubLwxfQK74Jm4HvFPwdaznhsgeKj2yXigPlH6Ys8G1H8ZkPvlQfo1LsdQtsnHPfDvEkEulJA7Yr1DbZAwxtC3naMi+2K+QqdhcTtNM+S/tADDqWscX7Yrg1PrIbi+KOaf9tdMVlYi7vMTZ3d+t9Mb8apwA5NM0mkcOQeow2XTRypXv3rM/o9QydMc6bWBgN3t0wlcQZRBo3i1NqOPjGjpUQJH2y3T7JGB4POFTQBo+OmDmkbiJdMSswo96zaeEtuiW/bMhJpikvF3d0M1Pg4kWNA8bLfQVz+WCtRe2Gx4p5NRVhutBCkjM1qdYYpvV0B5Oa7yjODalIytiRh6TkdP+zWinDz6uMTbeoksDt0HAOCl5mKD7HYfE+Rk7jX8mUTVrqDSAv8KCctPhrzuEaNI2bp5jAX/zm28P8P0UkyjSRH0yFRDQ6cUSBwRzjxvDFGleTS6QaeVRy6LTLZri8Xn8k3qEToYvgox/8sr/AMHyzQ/swNW4abzEQk/+NbFXV7q/6xhpP2W04nkEKTyeUCxYygXX/qKF59Lf9nYn0TyhpY5EHpCGxt/ms++XQeC7ZIo3Q72A5JBLe30wEvKzPdnSh8f4cV+n+581PhUL7Yyzhu5+3Fe+CweAjSasHTTySOf/ANTpTGuTVZ9Ug8KlKtuRXi097EdLN3ZAN3d10wcaWteNfNp0JSU7Yt53NY5YkDA/63LF9m5fGeHktKH9mZzwvxGKJdmoSSNhY5APTO+IeIaPUxlYplZq5WiD+WGtoWbxGfVzg7J1kYGh78dPmhntPoWZXEwaJFIIRSFZz8H298LH5Gf+5C2b4HFV45Nf5PlnjkRaYtGwP3wFBKnQ2M+z6zwDTavSgNoYC4B9YSuL/WrzM6j9j1IkeORkQcqVW7+2OY/PxSrlaOVk+GzpPg0/8GEWWUEBhhULkimXG8/gOp0/LRPIlXYFGverxY6qrkL1HUHrnRxuGRXB2cnNiyYHWSLRx4RIOg+tYZ4TDFEwPAOB7jVMayaMUXNvHegHLZotRMnlgKwvMx4sxewpvJvPIb56ZSTfLWffK+iX9Qzz6SZpGIUnKn0c/wD6ZpxtU8rnmMdfX3zSg0a+qzKjSTD+Tn+mFaXTyhhu9POaAIhPAGSMKHp9cjg3pk+qL3DiPg/nixxOJSRd+9ZoGhHHXB3iW+nJyfSMxyULV1OrQ8XXtl41+prpJhYhBHA5z37ufbK+l+S/qfsb+WwDmW8em2Bs1sqgoe/GYf8AaRtrEZiTKihVoZ//ALQJIod83nhMymIc5868PUyagV1vPong2mbyV4zHvZraei7xKRPJPOZTSakR+JUG4J7ZrPFNMRCeBVZ888Qd9J4kp5Ft0GZj+ok26PoUgDwggYZ4TJa7OuLvC5hPpFPXjg4Ton2aiieuYzxtWExypoT/ALY6TzIXIBz5jJE6SFaY0avPtnjenEumYgE/fPnb6CSbXGGGJpHvoB0+uV40+FkzRblSM/p4JCR6fzOMINFPIf4Ss560ov8AXNZpv2ejji3S7tRI3pOziOJu192PX2xro9CpidX/AHkNQpIowFbn+b2ys/mxjpbOn4nw2bNvJpf5EnhPg+rPE80MFcm7c/kvT881eg/Z+GSNd2oeSm5cAhSK9uuGeG6HdpTWgDIaFl9pQkmuvJ4H0/TGKeGyEB0uORltWj2qe1fXOZm83I1+Dt4vhvHx/v8AyRg/ZiBYfMUJ5KmiyLYH1I5y9PBtH5heNdk0YG4K5HX8J5637g9cO8Gjm087JPIQ6MCJEUq4Pe74P98YamI6nYCP40JpZUXa4v3A97H1zmz8iT7Y9DH9N8UBweCNHpfKc/w5RYYte08Hv2ONtF4F+8aIiVSrAcc8D/P3wvwKSXUr5LxUsYDE1V9eQO3Tpj+DfFuWOMFvYnhr54yQbb2jGXJKOl2Zs+Cx6KbTtp0VxYPA53dK+h4NY2i0iaiKZJwTtJZTZLKtdPsa4w9VM+2QqQxXcL5BI5I+uWeXTlrAR13Ejj/emNJuheeVy77FQiOn1jrStGYwrnmiR/nDNNphIYvMj2oCQLHPXvlEKf8A2WZfwh7rrxjhX2Km0EuePbvmHN2ZzNrSBBoY5Z5iqKgrZYF7un5c5W3haJ6RFuUAkmgAP+qzR6WINztPXcTnRpmSJ1kobgTd8UThI4+Ttia8pxdWfOE8LWOBmlPoZqVehoc0Mu0Hh8cWmaUwXIlhVBoWObP34zTeMaMIYBW1Uuqrn2wGd/V5EaFkFKtn8THm+c1KKjo6a8l5I2vYjnimmifT6BSrM38U9FFjhQT1J6/QYrk8LmcumnG7abJ619T3zVhF0jiJnYsSAtGwWrj7/wCM4kZ0mmkmnJZpXBYEcBegF9+n64J40+gkcvHr+hk9L4QI0caiZHVnoSOPS1jtx7+2ZTxjwRtc/lvp032SksS0B9DVkfBz6F4h4VNqy2ofULG5UbLUsAb7Dt9sTn9nt7gPqJJI1IUq9rGRfQf9ZhTniemEksWWL+pv+h8m8Q8G1Wl3PsMkS9WXmvqMXUAB34rPq7+GaHTxumolgSgdhSFiwb2JHXMn474Hpi5k0U0aN7gEK/TrfQ/IzteH8opfbm/ueb874Svv8br8f8GVK8Dk+2QVBfJy/URSaeZ4tQhSROoP9Qe4+crA9u+dlNNWjzkk4umRKC8rZB7DLyvpsjkZEIcvoorAPHYZKyO2dcbQDX65wC+efvkoh52uro/GQoHr19s6e3PTrnAOB75CHlTkAHjtzlm1M8F6WOMKAjrlRf0yUQ1k1iJj+uYH9pHJc8c5vtYdsJIzCeLVJMQfzxOQZaFXgqkaoEg1fGfT/BZB5K9Kz55p1CTjaentmx8JlOwfleYdsuPY81214m4/LPmH7Uw/xbA4659G1DXFV5hf2lj5JrB3UrNPaGv7JT79Iq2emN5Ds1CsPfMh+yOp2yeUeO3PfNTq3aQL5HJLbN3bd7D5F4XK0o7JgxSyy4Q7GPiPiEKabygQ81cjsv1Pv8YHoNBLKr0ViDWxAXlsb+DeF6TSiOXWpJMx9W0WOL5q+OffHTPpYZFieCF4xYKrYo3x6u/btnNlOuz0/jeNHE7at/kT+H+FQItzuwP8u2gSfb4x74d4dpwATC013z5TOLPH+T9ecbaddX5CvHHoNLHxt9G9jfSvnrjLw7Qkqr6qYlr3KqoF57EA89LxPJJNnQWVUBQ+EqI2CiKUEcqykH7EHr9crl8F1MO9otPFtJLFSDIBfz+Yx3PqUguAHUAnimUFWPXrX9P1yiNo3ceVJ5crDcApaMjvZU8HF8k10gkMk+2BaKN0kR0lMcYLDYw37KFnr25xt+4Q61Y5W8uKcUQytVd6yCaiVQI9fp/PCniRVG4cXY9gcZaJYi+wFiL9Jcd/r0IxLJFt6MZW07F8KtD4orbfS5uRQnpJ/wDcexrHkQDTkUmxGANnkLfP+/GDTxvEVNbiCeCeg/xh+idGeJnX17ShJ7r/AHOE8d8XTYtmnatBOphWKeKRRuUjlgeMFn0iLLtWT0tZB7qcNKlHPmAunsDXOVhFEJRgzDtQ5I/4zpehSM2vYqWPyHUrVbiAT/fD4CZCu5eQtc11wbUKQ5j/ABjg8djkdBqgo5N2eAw+xGJylxlQzJOcb9mh0SgIVICi+a7/AFyJkmQepF3A8BWPT2ynTSOYDIQTutht5oCxlDanliqsWDA2bqq9saUmkjnLG3JlOrLzFzxvoD2288n8sCRIZHjRSWG01fRu93+WNJ1AYXL5ik9AOf8ArAl06wyqEIYk/Wh2ySbbGseRJUDyDbFKUoSt+QOCQaYSadptQ7EIb6X+WMp2AYxwdALY9bPe8R+IapumnHmPu2ADoB7jtfzmZzUQ8MjapEPFJA8g8t28qxQXqb6fbB5FJV3lIhjb0A7toHt+vPTCptO+oWJJWkjDdkc336n/AKyr9w0+m2vOqrFfpjC2CfkdLH64s28gSOS40JPwt6gkqv6d4WwRXUcfri7VajRyIVZikiigSpCX33Ajr85o9b500khWNodKvqDyClYDm/r9OlYi18MTEyQtPJPH6y3m8kG7+/8ATJxlHsexR+p2ZXxXQ6LX6dEAQkfhZJASvHYd8yOs0UujYCZQUb8Eg5Vv99s2+sdfNRdZ5oIIppDdL8nqcr1Wi0rwSpFqQymMkKsZdHPHYXtJvrj/AIfyM8L4y3ET+R+Eh5C5x1L8/wDJhVX6/GcK0KPXth2s0MmmlKqQUPQ7uD9DlD6eQ/y8fXPS4c0M0eUHZ4ryPGyeNN48qpgzJfN3nNl1Ry0xPuNmjnkiZz/bCgCgoPbPBL7YQYDuC3zlEsRRip/rkKOrQXkdPfJbz7n8sq6c5O/pkIa7xglYmBP658/8RkucnrWbr9oG9Le+fO/ERct2et13xGQZKyencmevy982XhFhBdZitAytItE5uPChUY5yja7GbklMy/7Rx0pPzmoNYo8UgWeWOJlLbuSO1D3+MDN0Gxwc3xXszH7M+G6mWYyKrL5hpB0sf+x9h7Z9Z8E8G02hEe6SB9QSAztzGl4t8E8PUJ58rA36fX0oDsOw7ZqNG8UywQIBChBYzBASxr/qsBlyOWzueNgjhjUf6lUWlrTiSR0WA2qJe4vR9utflnpysTRSwC35IkdeL6EqO/F40/dox5rlJJGBKgAj45Zu/X8/pg/kJpyq6lWkfb6Yozd+xLH5u8UnJNUdDGkyOg1zrpUD6qOIKR6YEO8i6+tfA98bHVQSFWhdi1EC4ixb6niuhxVpNz6pUOxG3WiB9gBHXp7fXHkerG2OPzg5LVt0y2COu2z9MDwXYy41VIHh1Q1BjQaqdZCeb0zKCSOOvFDjjLdNDPsJd1YKfx7GF38430y+b5h8qeMEf/uaxR7AfXsayL6cw+YIJTy1EKxU+wH364ll76MrM1pFGm1Tu3r0skTRsLMX8QfkOe2MDc4V/MWMUT+LcprtY6HAX85JAJFWNlIKurqrt16cUf8AnDZZ3h2u8qt5gKtuQAH4NcHAJ/kFNu/tDYlfzRFqrG6zYHVf7HOkiCdD/IvUX29s8ZJhHuVvQ5va3QX3H1/rkCjzou8+raQQerDpm5Rd6F+9sbKBH5bbweKurJOck/ho8hNKByx4A/PAdLMwjER4IN9bo1lPjEP/AMr4B4lo44o5TqNO4RXIK+ZVqCD05A+9Y/jlyVCktF3jZHkkqdrqObW/k4h0oR2UkhC5s0eKu7JHFmxxgul/aEQKmm8baSGCb0xazUgK8ZBI8ucjgE1w35++BarUt4froPD4tDqNRqdRqJYBHGdqpKgVyDYvkPY+Bg8+NtppBsXkRguLZqopCEDCyX9O7dQXn/bwnzGVhGCaAPe9x+uKvBdW+t8Pg1Go0i6WXZK3lEk7SGI9u4F3hei3vNGFibZGNwYA0Tttj9Oa+cErTokskXsZHd5DSMBu7jd2B98FSQksADz1r49so1MpSGAAfxHBLes1Z7V8YPqZ/IhCb9zMtWoo1h746F290D6ydpZWQqWBJ6cDaetn7Z1IBStJbNVhU4BH+PjKEK7lZ7JI5X3/AOMNgYEG2q+CQOTiksjcqbN8/wAFkPosMpAXpt9RP0GVaiYKVYIW/mtjZr5HbCFkZEI9MZbgO3b7fnlXnaSEkiTznNGm5J+nth49aGcVXdAbeIbFEI0bNExugNxB7nnF+odJpdkGmUmIBlLHYw9wPevrjyef96hMUrRoHN1Vbj2s4uklOihkRDpYGY2Szmz16cV3yZGkh/E0ulT/AJM34iIZU8t9AFmAIV16iuoroevX5zPf/GIZ/LiEoB9NqAHXoeR3+mbeaWaBS0zwc87AQNx9ge3Q/wDOCTabdqGG0gOWKkLuK8dQB1W8WUvdnTx5eKoxeri1EW6CWePUGxIQV2yAjoa+MzviIffLNEAwu5AFqvmv1zc+JwyiZ9RIYJ5DTbG4JPQjnr/XEMuh3rNK00keogIROKYg9QfoD1IN9Md8Xyp4J3H+wt53gYfNxcci36f4ZlXvbuJyET7WNHkjCZYvJlMU6kDqOK4zoj0/2989Zgyxzw5xPnfleNPxcjxZFtFEPqlJ/wBGD6r1Snj64c3kxIxQncf1xc9li1HCixEjjpznq/8A65xenAOTpPbIQf8AjxskG8w/iCjzTXbNh4/JtYg5itdKCWo2c503sOi3wtLk6Cib+mbfw5dqLQz5/wCE6q5dp6g++b/wxyYlu/tmno1DYdO6xRl34Recq8EgfWtLNIoWMjc7EfiA/Co+PjvgHizvrJxpYgTEhAko8luwzVaTRbFihQFgo9ZU0L9vriuSds7Pg4KXN9sO0iQbGk1SmlX0KGoFu31rD9DLNCV1RJggJdUcoLqqNdhV198Fh0q+iXVnZAvVe4AyvX6p53VobjRD/DReQvyfngYvN6Opjhbod63WCSMRxMNgAFVRPN2T3Pzgkjz+SY9wLS8mMHk0OpHUjBPDoGCl3dtnFAnqfejhr6+SJHEe5TL+JygtxZ5Ld+eOPbFmhzHFRpRD/D9Giyh54mWNV9Rc7Ru7H3zQ6fw3S+hp5QyoFKqW46e31PvizSGQ6QS66SpGLMFIHA4HSunWsNhmjdY1KuQKvgf0risxbWipuUtpl88icCPUlCGouUsn7dv94ySQwzEANJNsboXAo/NZS40jajhGFXW79fqcMEung03/ANdwLsfxOWA/z84DJG0Yl9qpXYPO2njl2HTqRyOfV+uDPotKKfSxoqluU3EAG/p8e2G6yjEL8sNQO+6J45sYFqJf3O3mZW7je2019MQkq2iRbrT2GaLUNErKwUru2BCvK89uaP8AvGGMQbEKskqn0qeKA9vf6HEUPiMLyNE0N8kj0MQR7bqw+CU6edlHqTuretaroG7YxCVtKQDLFr0A+I+Jnw+KbWbySkMjtuBZSFUkcDnr2HNHE3/5F4nJpEkh1Uegi1Ee7zxp1JRqv0Xu3HhuPaucI8fhnfR6iTRkSSqjuqufUt3Q46gccjM9+z+j0+o/ZrSeFRKj6eCKSEpJIGf+IW3Aqebs1fwMa5KCtCDXJtMdaVdN4vDr4dfqdRrZ5oDFK+pgjdaLH8KrtKgXV7eliz1xJqNV4z+z/jWnj0yo2pYMdBKXDprI0Q7IwTwHUrtN0RYBHc47xj9l/wBpT+3uk8ag8zw8B0KzNqDIFCcMeQKFKSVIrrn0TRaj/wDIP2W1SCSGKLUQrqEmnh8xVKniQL24PJB4HPbG3GcYp3af+GcqeROfejQP4rFD4b4f+5jUTLrdO80RkFOyglXEgPRgeHHv064f4d4qV05qNCqrQjVtp4rt379cSfsppZtNp/EfCPEdMoiin8/RPvVtqyVuUn2LKSK9Js9CKw6UKvmINPbD1v5dcc3f5VZyQxKrQCeaSlplh1nna6WRypEYraPcD3P54D50mp1Ae9xHAJF1Vn8hnNbFqCFhWJY4gSCWBZyP/wCxrgcivjLdJEYoNpYRu5NDvX+PnE88XyaH8OW0XRu+/wBQB6bQOWN9zlwkkhDO0ZG08ngnr7ZxCkRURl1A5PAHODanWIy7ULNz298WWJXY/iuT0ic+qLbHJsgXtYhUX69zlDaqVYCsMkUe49VAYN7cngYFqNQL2iFFLdTKvJ56DFc+sUrIJ3ZOhIo19uO2bba6OthwOQ7fxHURRoJBASzCpLsEcXW3PajUStG0gglMYG3fFtZgO52kXz7XifT6rdHUhhG1hvDRsrrdHtx84ZHOYHIRZokIoKZSVeulHqOfrg222OrFXoFhmikYp5m8NxtlXafpX9slCx0soaKeZCCAgVeCfY1dDDZ54JS5kkgmAHKaiMHeD7Af1wcxwyJKNGzlCPVE43VfsetdcHWtjKly7X/3+wt8SlRtUInjJjei0g6nr2HfF3iUhWXym4QqWWeNvxD5Psauuxxrq9scAeVIp4DYIP4r7Ue1YqfaPNGoldg8QEU8ltW0+qN6+/OaiXL016Eg0zTimlO3Y1Ee9ElfjM+NMbZGtHXqp6jNZ4hopIkedYCIpOALIKEgbSD0PQ4k1gl/dDK4VXiNFgKNex+PbOp8f5X0J76Zy/mfAXmYnKH6l1/wKTCSxHPHc5Sym679sPR0Ctuq/nBGALE56pO9nz2q0ykDpROT2r8/nkgtggjPWw/6yFFn7Ry07WbzEaiTfLxyPnNZ+0rHew73mNNh7BNf2xCG5DPoJ0UYGoQg019bzc6bU/u2h3j/AMh9K/X/AIzDaeYeePr2zWaYGVIyVsL0H/Hzg80mlsP4uL6k69DvwOEMUO31dfkn5+ubvw4RxAbgRfHl/iN/3zPfs/BtjkmkCikJrjvxQ/PH0EohQTy2JSCY+KHXnE5WkegitUGakGdBNqAsMZWlX39gPfJ6PyJWYJFCoNqljpwORfQn3+cBgm04Rm1YaRmHpAaq5sn75V4lrW3P5arCrUQqcCj2H9MHPQfHBy+1D7UeWdFHo1kW3NjsRz1+BYq8p8J0fkQtqd6vIp2oxqhfFgfX+uZ1tb5fl0iySoB6ySPUP5eDzWPfD9eWgijjVBKqASOPx9a6fJboMWSbGlinCNIb6cQxlt3nz6vab3dAfb9MZoJ/JMjcRAhSWG0Ka79OgxPJqWhjQEOZZLXYDz2o84Lq55NTJ5msd3jUFliVuAarkZai6NLG5MeqYpAzwMu1aHmAH197+fbCXZFjXyrmdupNWW9qzOJqhNpUQ7o47vrxxXQdumONC0iQuzAba9Kkct8/TMzj7Zc8bitsY6gSuq/hvyz63W+fYjucV6+Z1kQeUC1UCVI+47YVqddGtxQxPJOSAAOw+cF1HmTLEgSV03ernoTdrzi+THezGODT2hfNBGbl1kqL6fTukKjn37n6jLVimDNsJEaCwwN7hx+H4PznYdRHp5XiiDags3rNUEA6AnK3km1soEummYxlSfKWlAvgFuPzwLjToP8ATl76CBKsiPHpmlZkFObU0exA7H5HOTg8P0hjjnl0cX76zEmUjmU9fxdefbj6Zzy4tIC42o4UlVIBbn39+/5ZfpS82ic6gBpCC4ANlV+nv9M1hyOLtbRzvL8WOSLa0LPEtDBNDPG+jig8z/yCqDUKB59Kgcnp2+cUaZd/hPjei05UMfDJYwu2xZS157AsB196zT65NQ4WSNkZQCDQIIYD0GwCSDzY64B+z0B0mpaMKWR1G6ME0wBofp2+c7TkpQTieTy45YpOLFuneWT9kfGo4dkDaIFtCyguQjJHItk88MJBXQX2rDPCtZrtVpom8Rj0jqsaFX5Fg8Xt557H3POKYXh8PXWwCMvBqQ6TGNet7v5bsHrz9cM0SyRwCWSF9KdoZ0Ukb2HSgR/vfA3GF8i1illl9qHjeHrCzeqONg342Hq9q4PPuOOhypnSMW72WN+s7Qf9OQRPLgEcrbbSyoAJs++UPpkcxqhYOy7lAN8exHbOfknzl0drxPBS/UFN55VvSjLwbQ8f84E8qrOkbyvExAFOm0Kfb47ZPQTSRTL5kCGLf70eB1BH34w/U6LTSahZpfN/CQdrBgw4FUeh6Zaj+x18eBY3VCufRadwBKJLZLRkIdGH2yt9NBotJCxZSjWFQvtPI/XHumVYJAkB3OwPpK0bvm19uOowb91ji37ZvKWyPJJBU37qf84GSa2NY5VoS/8AxiOqSIZU9O0bYwy9e5X8snEHjilSZJ4gCqpLGTQ9+OeD/wC1dsZzsmjZjFviVwehsDpxX+M5qJmnRDp4mdiaOx9pbjkH+owXvQ0pya30KRMunVTMiy6Zl2hmXqPkjocOKaWYxvo3ESi3DKDVjt7+/GK/PfTSuQUMUhNITf2+vT61lum811Q6cAoBRjJIr6A9My2noZlj1yQ0m0iaiWaJ1Gx/wuHotQ6MvvyD24OY90n0XiEkWqhJhYGxZsg2OCOuPygnB8ubeyDeG2nce4o+9f0yiWWPxDSlNQgXV6Z2qRFslT7jtz17ZalT0BScexfC40unTT6pkaJb2yx8hTXAI6UexHviTxJTBJ5jRbomFPtujYFfl1+bxvLJtZlcM8bcNQAEig0TXuMAd/J1UegSUTQTU+nck33Xaw9wbGExtvYTiv7mR1EaxylVawOOeuVEjGHiOmMZkIpf5kv+b3UfPfAgoCDpWes+Oz/VxcX2jwPznifQ8jnHqW/6+yIuiclR/wDUZw2BXf4yQHA6Z0TigP7RwzSzN5S2L5IOZ46GVmO4G81ckxkNtfPe8HKrfSsWWGmE5iPR+HFJ4yeOemazw7TtLqQv4zu2iubPTjF8CebqUjUjk8muBjfQagRl1UAf+rXRB7ZzvJknPivR3fjsXHHzfbNYAI4lgUgylQDRvb9fnLdS0aM+xzJGnpDkVdewxVoXIjdmJY80O/A75yWdGdFnY+VuBcDuO449+n3wOjpRiMNPq4GJedtgHRaJ7df+MIg1Zln3kq7MhS9guiOw7GsSuskiyyrEUJN0eBGt9uepPH2yxZl0LbWX+LX4bvafnFck92dDFiVDtYokG9OoOwEj5rLzqooUgC2WY2F6b+epxRD4yP3Ip5cTSudqHyhcYsk89ydx5+nthPgLwmeZp4XkZRtLMxBQn8JFfc5j32MJNJuS6GqTah9WGka5ONqpY2V0+mFxyNEJN4Vi3BZuT1uxlHhrwQa2V3kDCKm9QBJIPPBwlAmpl3uQkIbqvqHU/lhIzT0Vauq0EaSJZI/N1Cqu40hboQPgdf8AjCNLM+oeR9zrCHCM10Ws/hvsOeaz2iVtRp23BRCiEr2quy/PzgYkJiSRy6MLaIKfSnJBNVV9h9MppvZm+djfUGHw8eVFGkc0q2Uvlfv/ADdslHqJk0rIis7ICSxULZPWgfriKBJNVriTs2VuLy9SQK5OO44YnigUuwXlpAw+eADfT64KvyW4KCSltlei8OQqRuAC0Tahu3b5PvjNoAsbbXB9NBz0+v8AzgHiM0UQ8rTSnzb/AJCeOnBOWzy6qbw3zy4jhsJsXiwePucDkg5IzJSlUm9M6wRNM6uyzuPSSVHPfEgWXT6h5NMHCbTZ7H3AvrWMHmjPlQaTfuDWA4vbwPfr0ymRHm16pOQAliuwHU/0xZriFjCk7LIfEokgC+V5m4LuXcAR055yY8QILkaWZXYEruZT1HY9uO2daKPz9xjQRRoQKO0sT81xi+PQTTLCdSZSCm7aSKUjlf74SHlZIqkznz8HDklyki/z6dK9AY3yBX3H1756Ty5TKsskUkpIVQeKJ7+933wvR+HihIQPMK7a61zZH0y3U+Fhw9KDE67mDgkgr0YfPXIskpOmDXj4ovQrmgjEfKnzhywsXfv+eR0xjcQ7o5PNC2XDbdh+O/fDfFNPGZI0YuV42AG/Vf0wSLTGYsqqzz36rNcV0vDY8d/cx3HjXG2OIIo5oNy16SUIBs3xz8Z6IIkLAo24cLt7+9398hoZXhSN2W41A9YPTtRyU/nFGk3Eeon1GrGETXRSjTp9AurUTabcQXpt24j1D6/70yhgfKYMxLLRDbd5I++GafUGSVdJ6rZTbhwCtf71wQoaEczhdptAv86nntwBlvGmhmGvtZV4jpzq408hy00IN993SlNCr5/ri/w/V/uzlHAVyRvVyTwLsgdO+M5Ini9S71Vht2gcXx96wWAuZgEIXcApuqI/zgX4zatB4SXBxe0VeIx6WZpNR4ZIFCrtdAARt78VYPTrlegmkZ1iZAs8lBGC8kccccc5DW+dp9b50SVxTK3qLjvfz0OGagJqIxqr/gOeNo288DoPnFcmN43suLXHj/8Aos8amMrpqNIDFqEovGyngjtz2wPVa7z1SZLSRWZU5qrNsrf5wrWK0bK2oJJZfxsL6isU6iZI9dKIkXyJQAYy+7twb97s/eswvYxBJpKrLtQY5Vhi1R2xeoNvWiG73XvVX9MQ/tJp3TWJqYSys1MK7tXuPfNBGjS6WXTzkNKsZYOtk7eKN+49vbBYvL1GlaGSlkVjwGIJ5B+lcfrm8c+DszfBvRltU41umR14ccH3sdD/AGwJhyKI5FkDse4wzWw/uPicipYikN2Rx7EYPPEUlVhTRyDcpHv0bO14GT6eVV0zh/PeOs3jOSXW0Un2yO2+bOWSbdwA4yFfB/LPSngCgDp9M9V9KB+tZIKK+fbKtUahK3yxrj2zE5cYtm4Rc5KP5PaZgkRYj1yG7voMZaGQO0iqu2G/wg9T2GLoIi8u0j8IHGNggj1a6WAliGCsF9V8/HXPPSm7PX4saUUg5pnj3AEoTx+eEaKEvOS61HEQSN+0kn/GdDJ/8kNhaoLZCnZjxZ/PIy6poo3iiJtgQ5AsBT/TByk6Goq+gjTOk2ql9VlK9XWuPnrgOqP7u+9pSzuTe4Cv+8u0yJBpSgILyPdEc8dAcX+Ial4vEz5DVJESNyUbI49PuK6YBW2PY47aRdCHLrHwpY8Fun3zUeGaTy/OijZCq7pS7NZIH17noBiTQwPBoTKAnmFRJRIsBTVAe4Jv/rHuk1hj0hNhd/IO0W/N2T8du2Uq7CZZuSqJe8kSuiuAXBDyBqax7H3vg1l+j1Kp5m8kIvqbb0LdhilS0+pkVOWbuTfN19K74z1pjivTQsJBGDbL3bq1fllxk6JSuh6SJkijcspJW4wfRz1569MCmMzSGKJF4rhOQR2N98u0DtJov3hl/gwqYzuNc+/H1AGQ8PmlJkIij2AjgAkA+9YSLMRVXXoZxRGF1Cowegv4TR+Pj/bzr/vBSkJLM1Io+D0F/XKVdpWaNpXd3f1qG4Zux/PCn04SLctt6qLMbLN9skv2LWnUuyhYCJ2O0bEamo3z/wB4yl0yyvAqFoiSaB5DGuTWV6GSPy2LMRfLX73+uTjYS6v94ksCiAqkggdBzmGrZnJKTf8ABdoNGiOdTe3YDW7r7H+mTAAj81oxcl9Vuh3ySK8sdE0m4Ag3yPjvnZNRG8nlk+lW2qB7Xxg5QTF25Se9nowoUOq3KgJo8kjJQIrxGRuQwoC8slipHqRhuAANCvpkfC+YA43FVBU104OY+nRhu4uRzUfw1goMJCOAegvLIWQ/johaque2QmnhKeZMAAWqu5Pz9sCiZI4WYl/MY7aoAAD298t496Ioco7LtRpWm82JrV9u1GK3tI5wXURnTlJY9uwKVNE++G6TULqGBXduYWw67T3yWpCMjKEKITzzwB8X7HNq0jcZOMqYu8wRtUpHkSgEXxSd/wBc4u+MyAcruvevP5j6Vk9fApjSPmiALYgkn4rtlaSp5MQdmGpFA2KWs2lYdbSaI+JRJJIoEZicgUqLYY/5N4LpxJHEYYwWRR6T1I9xWMzZmCkeiqJ6XnHR4XXzEr2NVeFirWy4zpKJ3wyRtvlADbfqQm6NdshqfDUIJ0sZRibo9/jL4WWPWeb5db02yKB79ePfGEcsUqiEIFkUelw34+vW++bUa6F55JQlyijJ6mF2jbzRVUCTdj/GAa7SvDBLG8iu0RLAJyAL4I+e+bvXwxLFIrqGMnUVyRmM8Vb/AMce4sqjy3ZeCCBS/p3xbPtMa8bO8j0KYWk1OjLmRTKtsBVbuPwn5xP4uYtYhZY/JZQW2KSQh60PY41fRajw/UanyNQhhZdhdWs/TjtffpijxG01McrMGEo3EDgc/wB7vnOdtPXZ0cdOVpkIvEnZkdwolhUR7RxfAF18jm/fAJ5fLl8yFmAkBtW4IN+/OS8aj8idJYk/hSeqJ6IHSmU9rvPalYzp9POiFuSGAAuwel37fGFUV3+QvGNKkDeN7ZlMigbRQ3V1+T/vbFqOX0Ei8F433LfWiCGGFPKkGtUOWOmeypPJF8j6+2DSQvFqtRzW0b9o/mHcD7c/bGsdxpf1Qn5GNSxuL6BCQVHI5F5Gj8/lkox6OR0Yjr85219znr4S5RUvyfLMkXCTg/TOIgAIPOB6x6lUDkqL++Gg30q8Xag3qWrmjWL+XLjjGvAhzzK/Qx8MNRsCB50siBXPYc3/AL8YfEX0U2omQgzkUnPS++BqY9PHp3MquyR7iK6PZ4/Kvzy0xzSrpn2M28FlUcm75Nfb9M4Em7s9XCKrZPTTSrIsa2QWBNfzEdAcYwCd0lMKlHYbDfFjveA/s+o/eZdTqHKwwCzXc/5xrHqEeCRY1ksAOAx9LDuLwc21QwtOkipHaNHJUCXbSAngHsT/AM4t0kO9Z3eQCQEbABe4m+b7VX3wl5JZ5ZCGoHtXPTgfplAMkmmYIxoMDyfYZhMdhZcdc51SvGq1t2bfe/b742leWHTKs9iSP0kOK2+y19cz2mj/AHidY6JVBfzV43DyhGY7nWwxYr6fjnKdLQdpJ0aLwiZYdK0i8OsRWYg2ST1A9h04wbVSFd87ktKSdoHSyaHGHaBI100UiFXVKZlBBJJ5FD6jk4HrVnl1bSlwoD3vUVTX0UfGVJfkBia5ui/wjUajVA6eScxxuTYY+nj4+o/PHIkEWiIJpuEBvr7nMr4ewh1DmVGZWsLfNWevzjh5JJRGCQoYFl6Xwa+3TDY22w8o7/YYeHyssxkXr2Pt84eJ5JFA3EbRt6cVi6FFjValv0hpNo/CfbHOkggbYZNzRp89D7nCT0wc5RW6D9Fp4l2LJQsccdLwmOKJJF2q3l11YfOASagb98bRkJ17c12y/Sa5WfbON4rjnoPbBJXsXnGctjZZNwCxKLHqLEcjAdfCsW4qLKAMW7c4fEQRGU9KlbI+PbA/FzHNEdlE7qq+g/0ZdXti2K1OkUvqSdJGhsswsH9fyy/SMsWi23sZ/k0cH0calF3R7kdwCRyVHfCJIamjdTUStxxdLma9BZ8f0lUukkOkdtiuG9Y3fyn4/LBNQ7p4bBYBLSEcfarxw0sgmWIu4QiiOOe2B6z+EWVGDOG3L0NDoR8ZKJjyO0n/ACR8O0wg1TJOWHQk9gP74dM2x2Lbm6BCp7cYP+MmpGZTxf26D5w6OCMwR27A/wDs44+uRK+gWWW+UhVrDtUs8rkn1KARx6uchNojKpmj5A53EdeMM8QgVnVWZPw7htHGS8Ndzp3h9ARfbthFFhFNxgpRBi9wr5jKR7cWPyGSiDzf+Ri6qKAbsM8yrFuAI3g7qqq+uWQyKZWZowFfigeCDx0wi6I3rRORmYiU+XxSUBRIHesgzpE0QQsHXvfft/TLdXUToUO5aDFjlGtQmOOaNyxJakI3UwPse3tm3LQNU0ix52k0ysXscsrX05Hf88w/iuqUq6PRflnPPv1Htm6eONdPGUDRR160LdyOg9+a6ZgvHoi/iQdHcIzUdvXpYFH6ViedtIa8JxtoG8G1EzxSw7yjMG8uwCCeL+2BeJLNLotwhEcdlSxJPIPVSe3+cY6LTxabUkzIzKVX1P6Ntiww+crOmZpNQkgkUMzrYYurULDD+uc6ScdnQU0pWjM+LbF0cBDSbJHJKEcKwHXrzYxXpmZRKgI6b1B9x/pwjXzERtHMGAJDBiOv+MEfUtAkW3baEkcAE3V2e/TG8afGh6KaiC61XeKN6baoHPWq+cYaDVLOVMyqzEbL6fi4OEaXTqXSF1tNQrAAAfiI44+uKdOzBPJev4e5RS0QSbu++ETUlX4FMy5aKFQxyOlcqaP24yRBvqPzzurUrOG7Ooa+95VYOen8KXPDFs+Y/KQ4eXNfv/7JKwU37YA6mNg5BJb1G+9nD3oA8YP4gA06qpUUFFHqbwXn/pQf4qP/AFGzkT759NG7AIzjcW/lHycN0+o3OdvG1Ni31q+n64p1Vxz7Sw3KSLHIxh4F/C1BkmW1YFQGHYirGciaSjZ6jVWGzSCFY9MCGWw0jDub6YyLiGB44eG/HTcHp0P3xZMUVhvUrJR+nTLSTvUWWCi2/riz2g0VdMksm6MJtp2G08/N5Vq5/KUrET6rJB7D/QMHlMsTRyEn1jcCRdjpY/XAyWkmY7mFtzx2zUcd7GsaVjvwqv3cPGCNxt2YihV1XfHfiRCaGFFK/wAQD8PHArn+n54u8CiGyB3AKvIQD120DyfbGOvgE00bEgqQF9PQD2H1vBy7ZOSeRfsGaINp/BmYKfNZLJPAodOcq1Eyywo0TMJWIVgxNi+/tlmvlQQxRBkO7jbRvj37f9ZVpo0jmDygmEEAUabn2+clbomN3977OeWBIQGYbFrdfP0xxHGoEZiUliu03/MfcfGAacKsrMwIDH03ySPnDtCw8xaBJB6f1xjGqCznoZ6CD1kyK5XdVChd8f6MYkAcNsUKo69TXT9cq0Wojid0h9ce7gyHbfHP+Ptg+qdWFxqB7kG6/wCPjLlYJNyey1dShdIi6x8+oqvS+9Yy0hV/4ZjViZBTg8ke1dK75lVl8qZ5QCy7thA6tjXwnVEKroG231Y/hrj7YGU1FUFnjtWjUT6jyxuO1gtcKbNdKFfODzsZXUtSnrRN88dMWrrK0zmMH1HcCvYX0r555y1Z5kijpBsJaqPQ9gfjrzkUlXYtHE4+h3poxHEVdRtFEE8Wb/6wSWU0EDE1z8dcoQvLp1aViQCoBq+e32yR1EcmoSOIilT1bj17n+2aVGFBptvYVGWldbUgDq45JyE8KDWNY5l5ocAHC4ZBJDG0aCMAj0K3F/1wXVps1BERqh1Auz/XLsHBtyroOjh3X69t0x47/wDOSO2TSyRyELweTRqsq0MjbhuIaOxtB4PORnkhTXsL3RtyLAy4tPYHi3KhermVIgTW3ofj65YrtF4lEVJCMeeOKwbTlBO6Ekqt8q1HCJtmoIWyrREjcp/Qj5zTasblV16D9dEYtRKxBDiixZvfBR645Nvqofr2ymeYyTghZCxWuT+PjoD34GS0ESSzlHn6iz2v4GU5W9A0uMLkEaFTqX8pwGQkk2ARXyD/AG9sLigHmFZEf0lqLHp8bv757wzTONVJ5UiqFb0NVGj8e/OOINE88om8szOL2UQCD8dRd8cjucuOxLyM6i3vQu1ul83QSy6c08bEFCoqh36cgde1/bPnvjSqslqrxyB23MeocdDZ6ixf3z6y2hDaASxbTqBsllRDRQcCvc96967Z8y//AJAcv4gzwfglQMwA4J2gEj2+e/T2wedfbYT43N9SbijOajUylg6OpDbkt/xHivy9vbA9PqVfRo8ju06gwMH9agV6W+3TLNDFJqZXi07sWKWu5gByaI/TELakaeNotsYtiXkBNupogV04r9c5qTlaPRRjFriuyPip8151sttsAv8AiJA7VxV3icTMkUciFllXdGenKkEf3xrJJGWU7g6sLDlau+2J9TEYtY0BU3VUDyD1xzD1Q3FLjQ20EodIRIWJUrtrrQ9v6/bA/F4v/vuASyyJuDDmz75OB3IicJYACEt0ur/tlpgadYZAOVBYKWrgWSLOUvslYtlSTsVyESQ6dqsqCpPvzldZONlPnIeisGAvswP/ABkfsM9N8c6wnzf5yNeW6/COzD+G3N/TFeplY+IEBRYqgMaynbGaonFAbZqDI11z265jzvRr4lbYQiCaSMX6jZYdLGGHUiElBa8AAg9KwLT2uplkIJVYx+Ryibc7UTRLD+ucpx5Omekhtjpj+8aqxKVjatwA6qOv06ZZqmQb/K3gbuFY811HPfKYTFHp5+qygUjCvpyDkBIQ4cq2xeUUnp7YJoLB7O6W5pfKkYL6uSTVZCLll28vYoHv/wA5QpLksSwPc+/uMYeFCPz1MxIVTY2kWD2y5KhpPjsaaDUeTEkdOVYbmVDQHufy4x5CBLADsKspBBPT3/OjinWROJTuiaIqxj2N1QD49zk9JrWcokjsNhuh79x98Vu7sH2rQdqxD51UzSBfbvV5LSbjMrPRCgEX1H0wbVyLGTJKgdGJbYxIHI+PbB9JqS2nZQFstVr3FdMuL0HhbQ8SQO26y3q+MY6RhHD5gUFmJAJ5+2IYHCrtjbp3+e4zRaUI8ZAAG3oOxONJpRLkqCtNzC/CrQ2njnIzBo403BrbsDxf1z0HCyAAnaa/FQB+uWzqqRq8u2xZu+9dxlSkqKi9gXi8qwx6fTjl9ptbsBiefzz3hFHROQ1Ne3nmh7DAdRCNZro4yAgJC+piBx7nGGouPTxLFGQLZaB4u/17Yk027Y2qUVD2Wo6/vYIkBdrQNwBx2/Lm8OjmWZUitfKHJa63Gj/XpiuKFoIpGUVOx8tgt1Xfk9efplnhUF6xQd6okhftT8f85c5JVRhpOLd9GkVJgjqCaCE+xX2yqFQNzlFBtQNtDcT1vJatjFHFO0u0XZ2gGx/6j+uLpZBOZFhJ8w+pfnsczGf5F4LkrG2i1TxExunXk1XAFe3XDZ5l1CM6kqwPJPFjpiJZFheMMy+htsqo18ng0emXrqU8tkiVxpyQpN3XqHUZuUzE8VvlFDvRTRsxVWBatwXuB9MXeKsUk3KqiNiRV8We1Z4PGddC8RKyv6XjLcbaP6515IXWWJlNKwNlAa44q/tm4yoDGPGXIEEypZbcelnbwR3yblV8QkaJhsJ4G7cena/Y/wBci0eyOy9b+OGqjfbOPC8lM1qQtBuLPz/3m+aDursYmIzQ71BE0Q3AL+L3I+cL8PiL61GCHcODD1Fheg9un9cX6HUzebHvIsvt2g0GJNVhMrnRSF1JVQb3FuF45+/54NzSFciluK9jp4Tp/FNM0D75LI/D0N9K9/8ABzRefDDNEkcsYdnDKy1uHuK+15h/GPHo5tQk2iG4SMJYyACy0ex4IANdRfOHazxXUavwyCFYvVp33FhRO8DYCao8iwOOR7ZqOaMLpnLy+JkyKDkq9M03jnjek0jCRtQTIONm1SGoV6mPazfFcjvnyP8AaIrPPOZwvmn0Rozn0L7/ABZB69a+MI8V8a1CsqahCkykPvY7mLC7AHY1X55mNQ8pmedAW2KgPlkEct1I79xeDy53kOn8d8evF/lkXSHwxo3BYiUENvXlbY7bPTmszHjcIBd1MZBYqQpFfb4x543Mk2igdNxC0gZiB2PQfbM9KQ8AAC7GBNd1Pt9K5wGNb5Hdw62WwmJtH4cHOz+G2/ryfMNHnj8NdPbAPGWI8eikUFkKLt9IF0Nvbr0GCmaSaYIzt5cYpVJ6D2HtzjUxJPp0JDB4yWBY0CMYa+nK37/+QlODts5rAglIS4k9J2huhKcnn5By3TIm5YXtvMHHxwf0vISjdqIw6AhVYC/f3wna0QBVraNVs9OSDxgnLSA5GlGjKQmyeKO2jz3Byzdk54RE4ND1bvt3yH2P5Z6r498sNr8nzv51/wDdt/sicoqIntinUApKGFm/yxxLRifnFmqshAOD0Nmx1yvNWkzPxb+5on4dtWDzdpYuNrA8c2f+PywdVKahX3DYrAk185ZprRQL4Auye+DvqnOmeBjSbzIBXIJ4/sM5qTbZ6TFa6Gmt/wDMEBUFjZFdSeBlOok8uFEblj6ePbL01J1TxSLQYKBxxZHFn5xZq5PNlcj8P4QD2wcI26foPjt0mFeeF0SG9zcXh3hZWYeb1Ibha4P37YgiJAA554+mNfChscK7MFY3Q4JGXlglF0NNfaabWhmdZDYWOnJetwND3zumLSTQsoCISdo9+LP+nO6oo0OnWR4yzNZBBPFdD25/tkE26TReawCsxADVfB+/teI/yDg/tLvFtYZyPJRVEPHABJB9zlPh0kcSzCU3IQAhB4Bvkn34vITwAw//AF5C6PZDHgkbupHbjtndSjRRDhQA1enJyp0M44rioobaL1dz6SW/PpjqDVlXVLB2EEn4r++IPCtQDoXDC9rcD3x5Coa1LKQQDsHLNZA5PYDn65uM30iZHT+4L1esd5UEjGIsi2oPNXwPsKy3UtOpO4COHafSrdR7n3OJddq2/fysrqxSgCo69zkdTqZm43EMLJ+PbJOVo1DHSQZGoSYyRq248kg9P+8YxwpK2+csiox2hBe6+t976c4DGzaeXbIQHX1LtYNzXUH6YX5i7AkbvsCG3Y2B/nvgXrsJJ30Vyal5H8stUcZoBvf4GMfC9TFFqd+oDMzAKpVqo82SO+IddOEkXy22+gVz3wiF2tV431uBomz7YKU6RqWPlGhxqNd+86oxsAVhJZFXk+xy9hp0icSRKNSi7UDPXWvufnMv4c3n+M+p3ADnzXoE/JAPB5rGniOpWaVGcAS7gu7+Vr9vjBt1sjx01BFvmt58aCI0Xsi+pBvGklrKJFNbQNwXigfYdzijRPFFrRECXXzNxUDrY6g42khTzZ3QGg1GjRU1/L3vM229mcrVpENPrmi8VjLqGYWp9uR+mMp3dvXIq/h5CE8N9K9+fviMbX8UXygigW4EhJNVV/njWBkMriSVdqsu0H6HjDcgGWKtSX4PRyiJX84+ayetioJI5rK9G/mAxqq034Dz+A88fGSmjlk86SI/jJ3KWqvy/wB5wWJ/Ilj/AHZ6DWXINAc109uMnPVFJJrXYdp5DBqA0rb0JvcFsn6j3BrHOoUxaaNNW0DyahNyNHakFf5TybNc9iB2OZfxbVLHqIZoedLMwXh7aqumvp9Pasj4P4oW86KbVJNAoGzzI7I7DgdOxvJz00ByYJZEpounvW6iQgoHSgOpb3G0HsRlDauXwyP93lVY3A2KRyCQebANEC/z6YTIQis4bfKu51aSP1AAgkGzdXfP0xN4xqBq5k1Ejh5SQpIB9Nt/TpgHJoYhHm6a0KfFNU+o1Cu6AIq1YBHDd6HAyieaKfTLtZ4pIwQzKPxDp0+ThGt06TJIzt/E4FK3FexHveLdLI2pnWImRZEa2odR7EHtkTb3+B2MI1r0R1Go83wSSKlMkbCmDVsUA2u2ubJ6/FYi02p2RzD0srIVO4XwT+n1xlYj1Wr0alATdSLybvmvbr+mZ8xPHABItE8EDt8HHMUU1TCwitkNQQkyMjgui+oV0PN440AYxyswVQ62CxsXtsD71mbZieD1xnp9aDpNPuNNp/QpKjpuJrpzyT1xnLjuJrInQwlYw6kLE62tN9iOMsE41GpYyBvVFRs3RFUfyGCS7pydQVOwkIGI4JA6flgyyGKYvuoqBww/EO4wKha/cXyNcbLNd61j5PDEKpH8u3BgD7ZyeUvEh7k0PoFr+uVbj7/pnpvjlWBHzf5ma/1cv6FpPBHx0wGflAPZumHkDn6YulW0cnscvzI3AH8dKp0ddlEcm0mlDbdw5xbZkPBsDufzy/WTKumXnlrJ+R0/tlOgliHMqb0s/wA1c1xnMjFpNnqMM9WHeHNuvcPT+IkdjgruiSOxjEm9GCkkjaezfbO+HyFjKqqQzLYrKC1NtPPwcijUmNQVtjDSxLtKkVwPV9cawaZlk3KVDBOCRx/vOL9CxKjkdK+lmgMv1Wol0ryxCxIpKMhHQ9K/32xefKTpBG23SDJtYJdWGT1qnAN3dcWMM8SlaSXT6chQdu82R3GKPBl8oxtIpIBNcdscJFBLrJpLCMCESIg88Hm+nHSvnF5pRlS9G1UWv2OtINkcRBCRtQvucs1yLFHpl6MV3DuK54/PIIFjkVZmBs/gKk1eW+KsW1i1xQ2kAUAR1r4wPsZx/qSQb4fGAI/La0jTcSFN7j8d8JbUOmoaQCljQvUNE0B8fXKNKvl6dXgKoysFj3GifnF04nDEK+yRiUMg4Ascr98zF2+zcVzbsO8JLazWASM2wndJJVlBfLV3xlrX/dnFEFSSFZr9fsfjjKPCYn0cAEiUXXzCysGHQVdf07HA/GJB+8hGBDjkkXXuPvkcrdBI/fk10M4ZxJHGt0W9II+uHaeZNMTvB22VF8j75lNJrJRNQk236V7j65p9VMggH/jj5IGwGrHcDMzbS2anHi1EEoTaiZnKoQC1G+a7Cst0QZ9Q7xllCKvra6U/5xZBI0srs5pb3N8ZZHNJ+9PGjuLb1Ad+Kr64N10G4Pqxr4VEsE80ryDeWPNWPfp74NqdSY9ax8kAkDzN5vnPaIRhImO/1sQ6uGIv2vgdMGdiusaKNybPLc8jB+yJJydjebV3rpZHBVuCKULuB9sZQ+I/vUpmZ6YoCxrbQAo/71zI6mSUakMzMbUNXYHof6ZqPCoX8nTEkWwLlK/GBYAv73kdg8uOMYqTCIJy2pc7VR25QjqVI6nJaTUfxmdldtvpckAiv+MpSl8QZJ9rRruO2jQ56f77ZyHVInilxAkWwKgGxXbnB72CddDHV+JrHC4WS2C+hh2HUfbEf/zJ1GtV5yroKoRjb0ugK6d8D8S3rPqJmikkhB2Dy+oJ5/OgfyxVBNtXfFYmRrQDuPnNwurNY8EKsbvqVkgbzI24KsQi9u45+gyGg1kaTBnsRBCzNvBY9geOnF9crZynEm9XcHgUdvF9RiSeUq0cu9ZEBJFr6W+2aguRtwTNuviGmmtHTZEFUAq5L0frZrp8Ysk1SLO5VdmxvwH1AgHtxyfnFMniL6mTRIUVNsaxDy123RNGh1NsbPfL9NBNPrdQS+4+Uzt16cDn2F5JR9GYY+KuWhlqtcJxEijZasI9gAbduB5oWR1+mZrUTzrqzqUkYSDpx17HLv3zyHXZGY0jNMas30IvtnUSLUaVgZVXdIP5SSOep49vbNRXF20FhFY11oWamatX521YgT69o7Grr7YJ4zrmllkTT1FpmkDGJSSNwXbuJPJJ5J+Scs8eGx2ETEpupTVWL65F44TowRRci65v647jqKUjWm1JgGr8ry4H20doBA4AwNvVJRYdbA/9s9qJrijRbNXd989GFbTXTFwefYD/ADjcVS2Sc/SHGhdjDZDMAwUbTVuRxx9spCvPqIx6RYYX7fXKfD4yGG4jqO2FaYeXPZ4U2wYCz0wDSUnQpmem2B0bWxwRa/T/AEZ3bnbLLGSbtBed3HtnpPFXHFFHzT5Can5WRv8AJ7dyen0xfrLVJOvB5+Rhu6umC67hGo8sPfCeRG4MH4c6yoWSoZIGBbmMkc+3Uf1zkGkbZGnOxgTY7Z3TMAZbogjvhuhbdDEg4V28sEmgWr3zkTco6R6fBOti5XaGSJoyQ60QQe95PVEvL5rWC/qNm7PfJyx7uGoEfib/ANclqYlMoeJi0ZQbSavgd8nJHRg0XaGYxOfV244vk5fqBumLMK3nbV/7zg08Tx6eGQcpKSwYEXQPcDpzkGnJdTd9T0wbjbtB47lyRo/BG/d1Vw8fwGXcAOmXtsM0QHoZ25K3ibQSgRozmpLO0nofrjPTks37yqlmRR3qj7/X2xLJBptmoqpWHxbhqojIjJtPqfII5bWszPuvm+/PGC6/XqojrlgTdDknO+E6rY7TEXW2g3vgeD48hmCajdGlmaOSOGMMoYNdFQTyB1Pfpxg2tCtJGjKCxLEWeorkmvplBlnSRZ26n8LeWO3HByt5VYsZAI2RSPTzY+T9MDT7LxwcSx9Z5QjSNVZlXbft84DNOzOwYs7HmyftlOnPmvudjwe/bIrC0mpZFs8WW7AYVQS7HYRUQnTC3As/YXj3St62jjB2kUC5+uIIlaGlb8R/3nHmjmQQFCkZbcKkN7lAHIH198DlRWWWrWz0EL6fTzsgLuxrkcD5/wAZX4eAfElhctushtpF17Z5tVNu3hpJBvAscLQ68ffB9JOT4uDvZfMkKMTXKnjvmVFuy0207NVPt02nEUcJEQLBR1uz39vgjAX08LrFJvKSyH8J44quD3PfGGleGeeQq59NAURX1/LAtT5v7taDzBCwYq45o3fGBe2LQnWl2A6tFi0lBNwVVskc0ffNB4Dq3bRRpJLKkZBCkDkDsPzGZrxCeImURFeQBZFD6C8cfs8/l6KZ5UIbZ/Drsb7+wrLppBc28ey6eJ5de0bzg72DEEjk/TA5dJNDr43jEmwycODxRu7Odm1J/eAdwaZeOP5aHXDSyTI2oj4i2gAr3P8AS+MFsjk40I/GpPL8QiXzZFgYgnn8PY853UaU+Yf3UqYyeFHUnj9O+BftC6BonDyHrTPYuxxjPw/UuqadkTdIUBcp6SVvkm/ywzTUItGraimjzaxQ0nmxpJO5WpSK2V1AHTnocz/iTlpfLW+TVgd8aeJzRy6pnRRsu667fYX9ME8ZUJDC6KUkq7I6jrZGExaki8f27rsoi1CpqkmZTaNewHphur1/lzrq4/SFO0oBVjFEmmnOlj1ysPJMvk7iwtm27qrrVd8Im8zUaKT0ElUsVQ4wssaTTN3Ge2VfvJn1LbAQtkmxZAOM4lMMCGDVEyTgiWNQbAsUCehur49sQ6dtiMOAboj3x3qLTSK0bBCwHUckdx8ZMippIzk3S9Crxrex3ybbrsQefb8sph1AbTPFIgS4tu4DpntRuliKgu+03we3fKown/xx2OA6sxO4gcD+t3wMYjH7UipdJCudKoi9vyMNiPojGwA7ep4GeRIptNI0kixtGLAIJLdOBX9+ODlLS+Zp1QfykizyasHGG+WjLdhmpkSOY+VaoxJVWayB2s1znGlBV2Rm2xx7Oe57/rgTyF9QBfJ4uqyxX/hvESaq7+byRxttJdnP8zKscXJ+i4N6RY7AD7DPen3GeBHbjIErZ/5z00I8Vx/B8zlJzk5fkhfqyqWynuc6LPf4zxtlOXJclRmEuLUhXqkCM3lsSCSBYokV7YJCTsaOyRYZcK8T42GuQelYPBIiahSx9PBNDkDOXOLR6fxcikrL0lKuwINfiByDNRbjb7gdMlqYjIY2gssy9AetC/8AODqxaEHp2OBST2dbHNdF7SsV2q528cXk4RcbVVgd8rk8oRxbH3OykuKI2m6r59/vlsUhEBUGuvPvlNaGYu+i/R7STvIArgHvjXSajyInaUI8JjKspHXnivY2OuLdDEJbTg3yffHUvh8ms0I8hfMlUABRyWI9h74rlkuVM3OUbpiaWR5PUzE2SaJuvjDfDpfLs9PUL9N8YvVSW22eMeaeIrp3RDtISz/fKytJUP8AJVQy1Gr8+GBEB4skA1ZJ+fb+mU66RYtM4hYlCgIIUC/fv73gEcwZDHGLZWst8fXAtTIxlA3WFFCsXji2ax40tIZaHVnT6lXj2kobAZQwPHcHrjDw2W5JjGQbpSp74lGukfRxRTSgpDfl8cizZ/XG2hgWvLdqRzYkqx81885nNFJbNvrZcA+r1DMGU2CxJPYfGX6BhHrNx/CQQAD3vANFOsJclWcWEYg8gXzt+ayzUSp5j+WHAslbPq29rrvWClB9ETbuI1jZSDLsVjCzNQB5PufjFvl7pS0ZWQDrfTnCvB7MMskrcgseG6njrlUUDPqiNlBzYRjxVdvzwa+1tFxkoNr8BvhmqOnVGDk7QeB/Mfr7Y30U0utglSTmRzwEQl+/AA6mhi3XeVFBEiOrrGvpcLtBHc17nBNNq2uVjvYqpChHqvnjvg3HlsG1zjzS2QjCPM77xxx7k4w0U24lJnVEK0eoF/8AWZyE7GAS9hPJvoMYamWmRBsu94B7ZuePdDMlaoeBTpZ4BKQXdQ9ht4AYcdPisIbUCNCSFbaRQbj46fTBfDvEoDp/JaHefLYqFfbXyeOQPbFviOqhjcrG5a9xF9vjAfTbdC6ub4yKf2h1Q1QQiPy/LAUkA89r59/jOx6lX8PjZVCy7QN6nqOePpiuHVPPbS8hSRuvk/Xtl8sqDR7FAB3BgB0rG3jpKAwo8UohnhcDTawIwZQV3fXDfEI2KyIhDFfSUCXwO9/li7wnWJHqE3Db6gBZ6ffNHqmSSS1SRIxGHl6WT3HHxWAyWpgcuSpmLSFiCpamHU9Oe+MdJP5Gmmh3K0c1K9qL2g2Oe3Pt1y2XTp5LlUCDsT1OAiFk0rSlbRjSkHvjHLkU3y0wdRsaRfT1tTjFgw0MOmjO4O+4Gup6VinUyDz+SACAenF+1YYNQ0ipxXFCv65uUXpl7Z1o30ul8S0jRbdShAJYkMhFhlr/AHpiSJW8pedu7vWNZI5F82RnUlhR7nFlcXb9Rd++Gx+6LVrsvi0xUIjIT5nq9Q6jKdNpykmohZ2TYrPdXZAtRx71WF6aQyTo0shKLtXcxJpewH+Mnr60zymvURwRzfbJzafEFPaEKuwmA4GFaRS0zsx3AcC8olj8t47Hrf1MSfn9MNgBCk/zMbP1zqeJj55L9I8v875PDFwT3IstSrAi26DKyov8H65MqbH0yOdc8YyjoOv5ZE0TwTnvg1nqN/GaROwHxJbjLffrix5P4dbVoGwe/wBMe6iIPGynnEGoTay2STZBFVieaGzrfH56VBDsG0i9zfX24yXh3rQoKIBuia5yEQU6Z1JAZebOS8NtC7pVhW9q5GJP9LPQQndNEp4wdWgU8EC+cInVYqADdqDDqPrlSHzJ9xUk3de2W6q6Jsm/UeMG3tIdhphOhmH74zxIscbWCtkgXdDGYmu1hkMe9QpocnnreKPCkPmpIW9AaiPt1/XLER4SrRnarErZwGSCcgumy9CBOQ3JSwRXP/Jx1o9Wrq504YhbIVl4Y18f7xmajlYsxNHnGvherOkSZwpXngdefbB5sdobatEoYf4pKkgvxt7YBqSUmb07QD+fzjgyCbTxNYVlWiQoXdX0+MU+U8mpRTZUuOvNAnKxu27DQyOr9hJTyFZUIYngkUwP3w/TsSqhY2pRVt75OYp6xTqQOARnoCQrcqNvHJ64CU+SNKVxtg5idpHMiOYi3DjtlrlixWyTfv1rG00xigi2uzAqQOBYHTj5+cVnXooMIijYAht4/EPj75iMpT9Ejlb9DPRyiPS26puLUwbpz2NfGQ0mqZZ5YTW1gA7bQWAHIr2y6DbLodzKtDlqNlSRYNe2LT6iTCwMoPJ3V/1goq27JGp2QaUeZKsrERqdoX3HsMv0szJLIyuqnbVOtD6Yr1LMmqMrL3v1Gx/385f4fKZUlNDgWpPUG+uHlD7bDyejkDldVJFVm9tV1wzY8gDUVFkWf6YDplZ9RIZFt6N2ebPfDpHVgBJ1I5I7ZU+9BHIjp3CyjzGbY1javX88G1Z3DYrF0J/7wpIisy+Uqk1Qv2yzWQFqZ6paBIFX85lSSlZNWA6AhPMWQE/ziv6Y10WnglKea2wSqNzD+X3/AExfAhjkMezkn8RHqH3ycUjJr49zAAGthFgDLn9zbQPI2+i2ZI4tQPLujx/jNO/l2ACsvmIp3RtYjsC+eLPYj7ZmdfKzOuypAWslehHbGUP8GKGpA7CPir2jnpz7E4GatJsWntqyK1C7pILoFuWv35wbxKSfVPCZJCYkQIg5pAOdo+BeXTMzzhdjsK3G6FiuayTamBmWGISNLzZuxZ5tR24oZI2tl2rWhU2jLa1G2ny0FtXGRjhdtfIqr6RbUAbrGmoMRXy6KqjFtx/GwA5+2eCvp55yu+OXbRA4NEfhP1HGb+o62b5VHQJIv/1n2biFBYgDpzX98zeoWvUCQnUZoNas0WjdV3gOdrVwGo3z+hxTJpxshlYxgS7iqb7YbTXI6j79cYwa2Vf5CvBnCurR35gpk4/m6A/GR1mqeXWmMJyqcq3NHufvnNEtMyhiE3EmuL6YAPVrZn5WJWLEXx9Dm1BSm2L55qKs4/8AF1TClAU9enbClNmsGgpVY1yeb+cnvPSqrPQ+Lj+njV9s+d/J+T9fO36ReTR65DePb9cgWvtnr+n5Y1o59Fdj5rIg1dHJsjiyAK+MrIPv1yijzNdc/lijxWLa28A0caEn25ynUx+bEVJ5+MxONoNhyOErFmlQywPRtgKrO6a4gxb+b0n4zmkLRSMORX9c9qJKlYjhW55GcySfJxPT+PkUophWkkUOUbgHgt8YWIfJY729Xa24OJIZSZOTz0HGNp9aJVEhC7w1UOMFkg09D0MnKqC4AkOkMiqQ1bipyGqZRQY2V44XpnZpv/obkcNuUXXY30ylQJIVkawBx72e2AS3bGsb/wBzIaQL+8r5kqxKbt2UsBwasDnrx98uZZBw6EFeoGSn08SuCkvmJQO5FIpq5FH26ZUzPKwBYmjwDxm272OY3e10NNJJs0iNwGDdSLHW/wDjJeHappdTchjVlQqoVAASSSL9zz1xUzMtbSRXQZZpSPMKtRDUSfvgXj0/3CcV2OdQZFhp3IfdVXf0OVxq+xWlY0xIVrHJHU/GVaqZhEHO0HsAeuCwTsHrt3wUYPibjbjobamR3FbwErrXT4xNKdt0evtzjMyFWUtSjmuOuVRQNEweMh5FAf2/LJjaijUZUP8Aw7f5ARXKrxd1z8Yn8RlOnVgVpiRsI9sL8J8Q3yMHVXUNuKSCt49vgH64s8TcNE5I7grR6fFHA48bU3ZUG1NpgZmkll9TEg/y3xjLRRvF5gA9DCuef9OKNOf4qnbuA5IrthkM5csAaNGrNjjGckdUhi9Ugzw7yb1HmzlZQRsj2Xuu7s9q4/PDtMPNi5O0Dofn3IzOxSMuo3D0uT+eONHJMP3mONQ3pDMStsoBux7f4wWaHuy6dXYzFfvUACEnYd1n8shq2JjDbSrFh06/ljHwrSIYElZwHaLnzGAF7vf6Yr8WlVZDEm1yjEGRWtSfg+2KR+6VL0CWRSlxRHVTPLIXll8zcxLFuSx9z9ch5LiOLVeSxgdyisRwWFWv2vBNU6+WaJa6pgeL98pjlfzwwLUp4F2LxhQ0R+qG+qdVZAErg1l0e7yd4D2ADtJ45+MB1MqyiNYx+AneT3wpZ1D8gBVADMewwLi0kZO6kOySgXyxoVnfC/Li1ayzF1UE26qGKj3qxf556QAeHxzFiEmsRmj6xdGj3ojER1hKkKu4Envm4QclRjkmtMc6aUPIa5RbFjkmzhCyEuN8YCJ0fd097xfEnkvAFYgFbJ7VXQfPXCl1GnMc4VXLyIdoD+kGx1+KvMSjb0XKRDxXUqunD8EEWtdLvoMUad2kMrOAQIy3qYKAALv/AI75DxfVyM0ccj7o0PoXsL6/mcp1P8IohNKAPvjePGoxS/JXJpaDIJo9PpnmkO5rsE8Ece2KYS0slba6se15KZjPMqElYgbY9crXhgVFXyMf8PBylbPO/Neb9OHCL2w125sVXUAZA/i45yvduLsB9h2zqL6K5vO1/B4xkwbvpYztj3GQ/mNgjteeyFLR4SyKQL5POQaWyCRkbHJAr5zx5HNjLopHt2685dHiumR29gePrkaPZshqtAmv07APqYpEVVA3AtRNmuPfApZlZVvkKK57Y42GT0sNwPGKtfo300uxwVUi1PYjFcsE3Y/4fkOP2gyC5to7i8OAKKN/4j/Kf64ue4pQW6j9Rh0c5bTGLd6Q24X7nrzi+SPVHc8bJtoMR1OkkBvcvA/TDdKsZhVZGUK6grXBBxGsxAYG6+MZ6CV/KjO0GxfyB/3iuSDSOhDInpMkFZHsHi+LOW0ZXR3ARb55/M4JI/lyG747Zas22LfVkDYQelEZhp9jyl+A7xFRFDFsKsrKGtGDCm9/n47YErA124yk6hnjEZZii9B2ySNS/wC3kUOKoLik/wAhMk5aJUatyng98gktMD26V8ZU7bubJ+ucA5ycUFT9I0U+pTUIjwosfpClEHAoVZBvrgxk8ldpG9APVu+vUZ7w/URrIjAjdx6WUMpPyPbKdZGDOEBLXZtu3+84sopOmVHviHaSFPNBEgjbbYZ24Ixd4kxfUyCk9LGmU2D9++dQMVv0qgs+nqcoUGNkZ0tetEdc1GNSuwkXttsjE0kQYo5UONrAGtw9j7jpnQ3XnnJFdysQpDLx1657TxWbI4HX6YW/yEi0uiyVXjWKVgAt0KN4x8IkEkruoBjU7ypaifi8S6gjcoWzQ5+uGeDMf3tUT/8AYCpBF/fB5IXAy56ZpPPV9FKwAWQWDx+mJhI0sxIUbeeTh0UUjHyyQCwuj2+TgXijHSFIomUqOBwDiuJJPijMZJdFUqAWEWnJJu+nzlsUP8JgxFryAOecoLSDmama7Bw2bVNJpIEmZdsSlEAAUkEk/f6nCyuqNObRSJ3vywvoHIrqfyyjxRpNPM2nbejIdsit1B61+uUQTeS7AMebyjUruKuZF3Pyet4SMEpAnJ2GJrHOkiiAoL6RR+5wPzN0zA9B0P071hWkR13Bey7q63XXKtGoaMsR6KIAXqfrmlSsrroarIZtQvqUMpFiuuX7hBI8Ys16Q5oD4xZ4YxLSOwHHt2/zjYREv/DV5JCSoA5YnsAPfFZri6Kcq7M3qiQ9tuJPY++ThrUzjcRUa7j8Vg+qNTMgtmXq1988xbSKuwjcwBPH6Y8ouSSXYp5PkxxQcpPSLNU9zBd4JAF10ziH0WDxeDKCT3LcG/jLlN1tJsgjj2zsYcSxR4o8H5XkS8jI8kixTte+vvWXFtyrR6ffKBwPv0wzTxLKLhNMB6oz1PyMNdCzVlVlenTPGRb565AMGNA1niD85Zniyu6HznrAP0znHz9M7wQefjNdko4RuF31zx6dP0z15ZChZ75IHOZsumH+GaPzTZHA5JyPikC6hikgB28jjpmi0ek/d/Ddx4dhZxDq7MhPPPzmGuWjSdbMh4jC8bDd2FcfplaOjQKApDL3vqce62JZEIaqrtiKaAxSbWpVYWGPH54CUK0zpeN5O/3ORkM5DcGuDhXhsjoZU3EDvRrF29g3yMIRuQQTdYKcLVHVwZU2rDtRqG1GoLyBVuuEFAfbOMWNj8sGkkO7cBnVcnv9sFx0dGGVL7QrSxSTyiOFS8hulHU8X/bOiSuB3ypTz/fOSGiDeYqxhTcVYaNrLdEZ0SGNGo1YrBI5QTWWM38MnpmHEYWVSjaCxOk2pLIscAP8q2VHHzzjrQwxNCs8sqLtYqRutunWqqvnMzAQxxrpJHSFlDHb7A1z/fA5oWtFxlKULTGEiII2dX28EBrH9cXTlwn8Ri18g9QcFmkVp2s2L7jplszp5e0MTXIA5zMcfEPF0j0FmUckm7F4w8MOlh1B/e1ldVJ3LG+3cK96P9MW6eXaTfSuhwpJON4jB7n3P/GXNPot/cqLfFoVDJKJYTuG0RqTuFAcntRvj6ZRoVZZkfYzIDZrjj65dLpmkMflRNRNFL6H4+MYywnSn91khAdCVddwPT5HH5YJzSio9lJpLi+yrW+IFnBYBO3HU/4wAN586qjxqHb8cnCrfHJ9sn4vKjsDHxtNUB2+uDaaCSZSwraDV3mscVGN9FxaS0MEheUlNPC03kq0jstmlHVvgYMz+e/I4UUCvvnNP/52WZiOwrvl8LL54ApAhsnp9sr9JhzaewVIpRqV3AqLo7hVZb4lpkheALLFIWQMTG17b7H59xnNTLc6ek+/J5JOCTJtkAJO747ZtW2mD5bsdacpD4XqZrADAqSDRJ9hlHh3lvphGOXskkdsrg02o1kUcCmkLFizHgZ6CEr6rIq1sD8WCaVNXsrkGaKSHTu6+XI+9KjpgNrWOWvqOvTBdVM7zyiN9iA+oqTkBqdQJ2XTuY/QYyU6lW4I++V6xxBGIARuHLfOXGH3X7YHJmUE5MEbbGd8le+0cc9hghdncyPySc7IXeRut37/AK5JAxS6NdDxxnZ8fDw+59nj/kfPl5MuK/Sv8kgTt73dXl0beqxV5SByADwMsiB5HH0xw5heLZTfNDOxMUkVg1FSCGAzgJAod86/Ir+2UUc1bB5RKnp3jcwHvlPmfOXIvmIVA5HP0rrlG1fY5pbKf8kjR6dc6K7HPEdO/OWi4xur7Xksh2OJUQvKQAOg98Y+GQebJHuFK3rI+B0xMWaeZAD1OajwpA0kpSqUBB9syy0M9bJugVFPFdsQ6qM0WP2rHMwpDyKrjF8gDLyKORKixDOCRwPti7VwK6EHg9jjrVgWeKHT64t1AsEg5HvRE2naM9NE0b7SKrkZCNit9xjXUQeZwRziyRChF8HAtVpnQwZ7/ksD2wrnLV4N0fnKY3iIO8OGrggiryxJCrkWCD1wMkdbDlXthBk4oDj+mdkAYDvlTNRHbmxhP708sEULyllj3bF49Nmz+uBarZ0oz5fazkS8e5z0l0FJoDtkIpikx3KGB989qLZbBA+BlU7Cc1wdei+MBSrdQfbDHpEV6W3WwFe657+30xZp5vTTHphkEu6lDBQTycHOLTGMWSMkuLKSxEh6nCl8o6beZT5+/b5Wzqtdd39s7OkahTGSQffv84MevGUnyNq10wxoxtUgc9PqcM0kEk0qxxgMzAlVA5NCzX2GJTId/Xplp1jrwSCAKFi8xLG2aeZVrRoInUFCjcnqPbITyICXLnb2BN0PY4o0+oc1suxxfWs7rPOUhZaCk9uLOBWH7qbJe7DCFlMvAKn8NGq+BhSBYotqttoGlJsj5wXQIv7qGLlWJPPfj2yuQ2xYkgMaNnI1botz/cqiYhrBBHYD3wqBQhDngjBNOqmRilkX1JxpKUhQbW8w1e4j+2XkfoFLIByMP3okKb9jnRE0052VZ6X2yG93dmKkrf3OW2QBwALyddA1kaGunaPTaScmZf3mgqL/ADG+4+mAmYom0kgiwAvW8HOqhha/U7fpgOo1hYkKPSOuVjwOT0hbP5ccUW5MImlERMrKQD6uT1OAlzqGZ3uuL+Mqa5HJdiD7j+2WqiHywaA6M3UkX1zq4PHUNvs8x5nyEvIfFaicC0B7/TLas8cAni+2eQDdRJod8uUbj19hjhziNEWqni+uTTij3yajqaIPtk1UWet+/fLIQP8ALssEr79TlgfkgrSnqoP9/rnGK0NoIN/i75y/SAw5uuMhRHq3YcdsiTJZqvzGSAJO2geOeM9sX/2yIq6JhQq7mNYLPIX9wB0OT1Uu80t7R0+cGbk0PbLRnrQX4YobUe5UXmr8EFaZyDZYk5l/CvT5z3wBQzUeEN/9Mc2TeZfZqIRILQjqRycW6xtjRm+DweffDGl3MViG4H+bsMX6xN4e+K5HPtllg88XPII4sc4BNGHNCzjDd5sKP7j3wSUkMSSchBbKtCwOcXatKShwBjSYDmrOLNddA1weoyqsuxUaVjt7dicuD3zZ/LKJFN/rkIncFq5UAsee2YlAaxeS49hvn3ViyPfIvJTWpoewwcSKRak/Q5evrjBux2OCcOJ0I+S8mrLRJbBibBwrTupIDc+wwKIDbTZdGnPWhWBnFHQ8fNLsNl0/luQy0fg5UGCH2zkWoaLjbuUjm87rZopZGbTwmJDyELbq++CSd0x15or9PZYk4exR+OclI4YAigfpgMRJugb654OO9j65bx70ReX9q5ewtXBPpIP1z0zs11364MAocfxAAcK1PlRybIpklAF7lur++U40zSzqSak6CNCSjqxHHSvfCtTrZEDJSJtUpW0OSDx1P9cVxajqO2dlnF+kUcG8dytoI80ONhMUrFAAxqq656Zjts3Z7dMo0xd2LbfQO5HGU6iUvIRfAy1C5A5+SlG2w+JXegWrnqTfXDJ7GnREBUs20EmuO+KYtekRVgFpf/bqfgZTP4k2olLlAT0UDgAZPoTlLoUy+dhh3I0Wn1EMdBiGC8E12wPXeKrK9RgIg/Cdtk4mMk0wANhegUDLoowo5U33vtm4eIou5dnN8j5a9Y0e3M553BOw9/rk4FFiwAPY5JYyOeuXBTVcgdarHYQSOPkyzyu5uyUYJBAWiASTeSVSaC2eeK5655ABQOWBSp4HNdfb6YZAyITk8H25GERAeqyeVoV752JGeyVPp5LfGXwJAu5p3YkdEj7/AFJyyFKgk7VBY9qw06HySp1sqQDtH1c/b/Oe/fCCRpol06Hj0Xu6dzgg9ZYtyxrm/wCuVtlfwHSNodrNHp9S6+7yBQffgZDfoCKk0cij3jmN/rlCobNC675F73cjpkoov1GjRIG1mkkE2lDBH3Da8R7bl9j79MBIBN7v0GF6LUto9R5ijcssbRyow4dDwQf0PwRno0iCKD5poDnnM3RGm+hSx7G8rYlb5AH1yXb75Ei2H2whXoO8NoRSH3x94WS2nCOSFHJHfM/oup++OvBCdsn1yn2aQzIpa6e1YFMDW7i7wt+o+uDTfzZCULovTvjPO1uPocrkBDcjcPbpl0n48rf8JyGLAJRdmj0wHVxqQATz3xnqOi4LOBkLfQk1MTKVHNda9sCKEMDXX37Y5nAo8dxgUoG7oO2UaT0ATw+WjKRZ3EWOhAykMycq3OHaoDyNOaFmMX+ZwTv+eRbLTPCd15Iv2y2PV0bPPGDntke2U4Jho58kemMF1ULg+a7rQ42i+ciupUMakv2wBsmn/iH/APs/0zP00F/1mRuxrFqBW5WQG65Yc/bK5pkJ3Fg14sIHPAyWnVTqIgVBBYWCMz9JJ2bfyGRri0MDIqoCyMoPQkdcgNQob3Hxhf7RuzeMSRsxMabQik8KK7DtiyvUMkYpqzL8zJ6C01qBSCABd9Lzj6pTe1TfxlUyhdUyqAAHPA+uG6ZVOj1hKiwEANdPUcn04rZH52ZqrBv3mcrtW9o5on+2cp2ILkkHsDhCgGrHtnkFbK/9hlpJdIBLNklpskmn5JCjj9cuihCEEgnnmsnEfT+eF/zx/wD+RkqwZBI1u16DkEZb5ZsE9SevT887ABvP0y9OSLy0kUcWN0ZlHUelqNg85wxi6y1SQrUTyBfzznZerffNohHYQ1DnjLbO1FIAIslh1P1+mcQ8H5FH5wggbRx3yEIFR0LA/TvnCAE6EtfJJy6QDk1zeDv1I7VlmX2SSjwfvl8SrsPBsniu31ype2FaUAlrH8oP/wD0MhF2cVRGbJ+hvrlEjFupHHOXT9UweXIQrdRwTx3OeXX6hFCpIQo4HpHTIkny2Fmry0ol/hX8spbLS2f/2Q=='))
-    # game1.images.append(Image('https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Honeycrisp.jpg/330px-Honeycrisp.jpg'))
-    # game1.images.append(Image('https://upload.wikimedia.org/wikipedia/commons/thumb/a/a3/Discovery_apples.jpg/180px-Discovery_apples.jpg'))
-
-    game2 = Game('binana', admin1, kriol, public=True)
-    # game2.audios.append(Audio('https://upload.wikimedia.org/wikipedia/commons/6/61/En-us-banana.ogg'))
-    game2.images.append(Image('/9j/4QtkaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wLwA8P3hwYWNrZXQgYmVnaW49J++7vycgaWQ9J1c1TTBNcENlaGlIenJlU3pOVGN6a2M5ZCc/Pgo8eDp4bXBtZXRhIHhtbG5zOng9J2Fkb2JlOm5zOm1ldGEvJyB4OnhtcHRrPSdJbWFnZTo6RXhpZlRvb2wgOS43NCc+CjxyZGY6UkRGIHhtbG5zOnJkZj0naHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyc+CgogPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9JycKICB4bWxuczpkYz0naHR0cDovL3B1cmwub3JnL2RjL2VsZW1lbnRzLzEuMS8nPgogIDxkYzpkZXNjcmlwdGlvbj4KICAgPHJkZjpBbHQ+CiAgICA8cmRmOmxpIHhtbDpsYW5nPSd4LWRlZmF1bHQnPk9MWU1QVVMgRElHSVRBTCBDQU1FUkE8L3JkZjpsaT4KICAgPC9yZGY6QWx0PgogIDwvZGM6ZGVzY3JpcHRpb24+CiA8L3JkZjpEZXNjcmlwdGlvbj4KPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKPD94cGFja2V0IGVuZD0ndyc/Pv/iAhxJQ0NfUFJPRklMRQABAQAAAgxsY21zAhAAAG1udHJSR0IgWFlaIAfcAAEAGQADACkAOWFjc3BBUFBMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD21gABAAAAANMtbGNtcwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACmRlc2MAAAD8AAAAXmNwcnQAAAFcAAAAC3d0cHQAAAFoAAAAFGJrcHQAAAF8AAAAFHJYWVoAAAGQAAAAFGdYWVoAAAGkAAAAFGJYWVoAAAG4AAAAFHJUUkMAAAHMAAAAQGdUUkMAAAHMAAAAQGJUUkMAAAHMAAAAQGRlc2MAAAAAAAAAA2MyAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHRleHQAAAAARkIAAFhZWiAAAAAAAAD21gABAAAAANMtWFlaIAAAAAAAAAMWAAADMwAAAqRYWVogAAAAAAAAb6IAADj1AAADkFhZWiAAAAAAAABimQAAt4UAABjaWFlaIAAAAAAAACSgAAAPhAAAts9jdXJ2AAAAAAAAABoAAADLAckDYwWSCGsL9hA/FVEbNCHxKZAyGDuSRgVRd13ta3B6BYmxmnysab9908PpMP///9sAQwAEAwMEAwMEBAMEBQQEBQYKBwYGBgYNCQoICg8NEBAPDQ8OERMYFBESFxIODxUcFRcZGRsbGxAUHR8dGh8YGhsa/9sAQwEEBQUGBQYMBwcMGhEPERoaGhoaGhoaGhoaGhoaGhoaGhoaGhoaGhoaGhoaGhoaGhoaGhoaGhoaGhoaGhoaGhoa/8AAEQgAvAFJAwEiAAIRAQMRAf/EAB0AAAAHAQEBAAAAAAAAAAAAAAIDBAUGBwgBAAn/xABLEAACAQIEAwYDBQYCBwUJAQABAgMEEQAFEiEGMUEHEyJRYXEygZEIFEKhsRUjUmLB0ZLwFiQzQ1Ny4Rc0Y4LxJTVEVFVzk6Kywv/EABsBAAEFAQEAAAAAAAAAAAAAAAIAAQMEBQYH/8QAMREAAQQBAwIDBwQDAQEAAAAAAQACAxEEEiExBUETUWEUIiNxsdHwgZGhwTLh8TNS/9oADAMBAAIRAxEAPwDQs1ItUED97pW5sjlQfe3PB9PlFNCH7uCMawA2rxFgOV73whPEuWDaOoapPlDEz3+YFsc/0kdgfuuV1TgDnKUiH5m/5YDUmpP0dIkQ8AVPRVthTHGgt8R9ziLnN83lsEgo6ZSL3ZnlI/8A5GBq2aTE9/mkirz008SR7e9ifzw2pNSl6IwB+Jk8jyGEtTmdDRIfvVXTw26NKL/S+I0MqSc6qtp6k/8Ajzu/5XthdTZdT09hFSwx36rEB+fPD3adF1s1JnDAQK0yKwbXoIQn0J5/LlgMUBvubA+XnheyB2Knaw3OOiMq4ABsBsLbXw9pUie6WOMkr4RysOWE6xA2JUjfC4wM25ve3n+VsdEIU2A03HQYFOkBp428XdhmPmBjscbEklQOvywuFNq0lrEqbg22GBCKxOxYadwOuHSRMEajxMPERyPlhyp6QVBNxdT4WBuBY/rgiKG4BItbkD0xJMjEJWXv/FbcD++CATEpozGgamCIwFgNgvTbCKmiKupNr39sP+ayLOoCAXXYAHmPfDXHGFa7Hf3w6FLaMbksBYHwgdBh4Vdai46efLDXTnQL87nqMOKTLpF/e2HTHlJZYWs97gnnY8sI2pwoIO+/4j1w6vL3ikmwv+eEMigv5gjl5euGIStJdJYkavK1jtgt11WKm364OsA5VRpNhuMA8LXKnltsOWGRIgkA6Q12PI4KeQ6lAHiPMX3GFKxqg8ICjywAJYKXFieV/PC3SVYdsfFdXwxw+UyuaeiqqgG1dEgYwBRc2BBuTjDPEc2drmn7drc0/ac9W5K1iOWEhFvzseXvjVX2j+LkrqWXhGicKpjvXTADWpJBVUPS4BBPrbFCcI5XXVeSrl0eUiYR1gSCSrjvCQzb69wRbFKaZsbrLtgrkcRc0e6tM/Z/4rzjiXhSWLP4ZS9EIxBM4NyhB8Bb8RFufOxGLbI1Aix6WLYrPsRzdWySvyDMKWmy/MMuqZD91gY+KAkBZBfcjFpFWUeaDpbcDFpjw9ocDYKquGlxFUiWj1WucJmTW5uxBAsQp64cNALAm3pguSPmTuw5bYMoEhKIqm3LzHPHEVAxOrxNubnCoRKqFlUgHc7YAYta2JuD587YSZJ2QkbWt52vglYXjSx0sfMC2FJiKE92wPK+rc2x5gS3gFx19MOmpI2TfcdN7YJdD1Fum2EmZcS0GVlknmWWVeaQAuf+hwxS8cRhmlTJ67uwN3ZkW487XxVfl48RpzwFM2CVwsNKfpojcNp1MLgAeWCwg3vewsLn9cR8douSd2Xf70Jf+F3F2J8hY4jOddomYSQTxZNSpQS2/dy1UfeG3npFgPrgHZmOwatQRNx5HmqVhGIk6t9IHTlhKO7mb906ybfhYHGfMhzjMc6kr5+JM1qcwrFcxNeYrDGAbqqoptuN98SGqzn9jZPUTw08cctOnfRsvhcOouu45gnmML2tpOwR+yu81cMiFSu2x5nCbTJ5jAOGc6h4u4ayvOYI2hjr6dJtBO6E81v6EHDn92/lOLvPCqDcJakViBpNuhGFMUK89Gktzx7uNQO5BYW2ODaWlZGBvYdd+ZxESbUqPjjUDzwdFCqsW0jUeZtzx1YyGQkArfnfe/TbCpEvuAfLD7JIKjSBpU36b2wZFBpXmSPLoMGxQ2uT4id/bByKGNuv54fbukiQltrWHS2B90CfDttzA54U9wOq3PPfHdBZRe6n1w6SR93senryx0Rnc8h09ffB8sZBGlNYtawFzhrlzvLo6uPL3zOhGYSEkUz1Kd6fZL3+WEkjqlWUBA2lTzPU4Ag0ixBfxcxyFvPCh4XLXIILc+htjv3YjTYmw53w1J0ESEex6E8jg6nqJIn8Mtjfmq/ljiRFrg6VYchz2wcsRKi/hPT1wSBC75rBVWwA523viL8b9oGU9n2VjMM7EjCXUIoo7anIF+vIch88SmOMi4Niw5i/LGY/tVTL+2eG0INvuspW42vq54F7xG0u8kcUfiyBnmisq+1ZncubSNU5DQ/stpPBT96VnSP0bkx67jGiOCO0TJOPKWWXJJ3SeEAz0k6aZoh5kdV9Rtj5+U1NCzpLGrGVbG9+vXE14fzevybMKbNsmmejraSTwOh5jyPoeRB54zY8/U6nBbkvTGafc2K39cFPL2wnkDAgpt6Yi3Z1x7TcecPx1cAWGristVB/A3mP5T+R2xLZNiLEW98aoIcLCwC0sNHlIZkbSNBuwa/lgMo1bg7H5jbCiQaTcgsL2UX3wU0JLFi1gRYLfkcMkk7gkbqtz4diTgmsqqfL4Jamukjp6eMXlkkNgPn/AGwtUaIhYCK25DcgOu+M68c8VZhxpxlR5dlTFclpCzOlvDL0DH8/yxTysluLHqPPZWseA5D9I4HKbM8quFK7jueoSimMcnjgepiOiaUjbuzyF/4Sb7YcM7ySDKZeIKaEKrUlNEG09JgAWH+Lb5Yf8yghpcnCMihwAUFr2I3uPniI/sulzHM6LMpUMmY12tppy7XdVPUXsd2544iTNE4eXDcn9K9FviIsrSdgmOds1o+IMn4nycac2oQVWO5C1KN8UT+hG3pz6Y0Lw5xjSZ33VPUwSZXmLi/3Wdw2o9QrjZvbnisM2olSjGwGl1Pyv/Y4FAVzKhqYAWNXQuBrU2YdVYHzHn6YsYfVJ8ZoYRbR2+yqzYjZjqOx8/urw0Ecjp32HngEcXh2a4PQ/wB8NXCOby8Q5DBPLtVRloqna15B19Lix+eJBFDvv4Au1gdsduxwkaHN4KwnAsJB7JvVTHqWwVr2O+2OlGbkoY9GvheYed+R57YR5jX0uU0UtXVzCKCEXba5J6ADqT5YKw0WTsmAvYJHX1MVBTy1FbKsMKixJF2+nUnyxBK/OK3O2ZKZXo6Q7FQbO482P9Mcqquq4krxU1imKnX/ALvBfZB5nzY9Th8oMrBACLjjOo9WMjjHCab5+a28bDDBqfymOg4fQEFk68rbYdpsng+7tDMoCMpBttzxIo6dKWME2vbEbz2uQo2qwUc78sc455WkWqs8yRMqzJ4MvyyWpqpSVjWKPW7n36D1w0Z/wnm9TCRn1etBUSp+6yyhIeTfkZXOyj/IxLM1qs3oqKpnopTSd5c/u7CRx0BY8h6DDVlbirhjTL0eWunbSVcku8nUknn743MWeIRjSNT/AF4HyHdZ8jHlxJNNVV5lkQ4UdXR+9jUgyoW/2h/v5Y5nGeQyZZOkYlkDwFhaM3F+luR5/li7OJeAqDLOEa+pzWKOszRksjve0TMbAIP64heUcLU9ZXZdRvHcSTJGSeoHM/QHGk/xcTQx5tzv4UbZGvBcNgFYfZPl0uXdnHDtNMpTRS3jVlIcIWJUMD+Kx3xMe7/mOFPdhT3cZ0xoAo9PIY991XzOOqHCxEqWNtgpW5PUdMLI4rkmxFjjwaxA5EC9vPCgEAC5tfoOeACNASyswO5XYnkBfphaqrbY/PBALlmGwuLgYLzbNafIssq8xrA3c00ZdgBu3kB6k4EHzSTiIgoAUkkdCb4NW2wFzbyFrYpLL/tA0z1n/tPLI6PL3lCNNHOWeLe2ogizW62xdcMmoBg6sjDUGvta1738rYihmjyAfDN0ncC3lH31KLAXI2vhl4l4tynhSkM+dVSwEj93EBqklPkq/wBeWK4477ZVoZZqHhDu55FGl65xdFa+/dj8R9Tt5XxRuZ5lU5lUvV5lPLWVUhu0krFif7Yq5GcyL3Wbn+EFk8Kc8b9s2a5xFLHlznJstsQe7b966/zP/RfzxQWY0lXmNX3yOaGmLA2j2ml9S/MfriSKf2vVSAg93A/doPOTqfly+uLK7O+yuXimpFZXK1LlEbaXcfFMRzVPS/NsZ0b5pn3dn8/ZGAGq1ewasqKzs4ywVkksstPNPEHmdnd1D+Elm3OxxZhjF77g8/bCagy+ny6lho6Knjp6WFAscaCwUDy/vhWpYWuDe1yNYNv7nHRMBa0A7pE6jYUd4x4yyXgTKJs04kq0poY1Jji1DvJm6Ki82JPXkOuKlyL7WfCeY1MUOa5ZmeVq2zS2WdFPqF3t64g/2qslq5+MsqrJSzUk1EI4r8lKsdQHlzxSceQsFMsakIhGsj15fXFXIyhCdNLVwun+1M1uOy+hmTcRZPxLSrW8P5jTZnT7FmpnDFR/MvxD5jFMfaiyE1uRZZmiJ+8pHdbjc25/pq+mM9ZNPmnCtZHm3DtZNQ1cADCSJrED1HJh5g7Y1Bw5xfl/bpwHmeVVIjp+Ioobz0g+HUPhlj66G5W6E28sKKdmS3TxaGfCkwXCVpsA/lrI8H7sLIg1ADcW5f3w9JMQloGYAgXW+xtiNhJcvr6vL6gFKijmaJweYsdvyth0y6qEMqaxqCncH/PLGBKwxv8AULqWVK0PbvasLs448qOC+KKeqQkU8xCVEV9nB5/M/rbG1KOtgr6SCsopRNTToHRx+JT1x89M90d4stOCI2W4/wDX0xp37OHHf7Zyp8jrHvLCDJASev40/wD9D3ONjByNY0lc71HG2EzR81eJXY2F97c9745qsD3iGw5nng9LP1A32sb4JlCKTJI4SOME36ADmT6Y1CsJVr2xcaw8L5AKZZEhqK5Xuxa3dwgeJielzYfXFR9neXvXQtmT64YZZFdAxKswvdfkR08rXwbxPmycY8R5pmk0Jlp0Qx0iut00i4VbHqefucSuiaPJMsy6CX9yCqoQBc6yOXpjh+r5HiuNdtgunw4/BjA7nlQ3tLz5ct++1Uk3dtS0bLBGG+I82PzYouEHAeYSZnDl0JIM9BQiKTSLDW73v9FB+eIL2uVSZtUU0UUxP3uoszHYJHGbsvuXtfFi9nFB90lqO6ZGeUKNQBK3VBtf0DDGYIw2IE8q+4AMKnebrGcqqnWPvGiTWo87eWGHL3+6caOjsqUtTQyd6T0dCpH5E4V1dEmZ5dWGmzCQu0gWQxbKQHBtY+gOEKzoeML3sqUc5brvYWsBzxCKad1GAp1wFmAp+K6+gR9MFVT61HTvE3uPdSfpi0Bo0+Hf2xR2R1UsHGeTyBdNOalUSoBH7wSKwbboQbYvPQLKreJvPrjtujSF+IG//JI/v+1zvUI9M/zCJqZY6eKSaokWGGMFndjsAOuKozXNZOKsyWZwUoItqWI9f529T+WHHjzPWzLMBktA6pTwt/rT9Xk6IPO3M+uC8qy/4TuT1Jxj9Y6kXuOPGdhz9lcwsbSPEdz2SzLqHWRcbe2JEsS06C3LqcBpoRCnr1w3ZpXabqpBUf53xyhK16SbNc0WNHLOEiQEkk2FvM4YcuhfNWFXUKywXvCj7E/zEfoMIoy/EddKrAHK4XtrV95XG/LoP/XEvgRYo1RRsqgDqbYhc60zxp+aTT5bT1EJSoQOp6eeGuiyuioM5grJFWGGljkctb4Rpt/UC3rh9dtTEHphuFOKzMWZt4KYaQPwmTmSfb9b4t4kxx5Wyc1uqz4vEYWqLcZ1WbZn93eOmjiymFtZge+tvJmPK48umI7wfWBuKcukqKOSngFSUV3sQxKkAj0ucWs8cNTBLydV2PXELzqCKBVaNQmggi3ocaXt8j52vfubCgMDRGWNVk6Nvg31Ha2CO7n/AIf/ANx/bDivjiR7bsob6jBdvR/oMejhc4jTGe8UhRqHU+WFESdTueuCgtxoQ6W9sKY1FjYfiN74jHKNCVSHJD+E8wentiqO3Ti2OgyhchpWvV1VpZiD8EYOw9yfyGJxxjxfScH5S1XVlHqGBWnpj8Ur/wBFHU4yXneY12f5lUV+YzGapncs7cvkB0HS3ljNzskRM0N5P0TcqK55M1PSLEXIcsZAD5Wxo/irjKrpeEOH+HKeV0qmymlOZyX8QvEpEV/UWJ+Q88Z4yrLBnvHNHTVV/uSPrqP/ALEY7x/qFt88WJmGYTZlUVVbUG81TI0jW6Enl7AWA9sYwkOPCSNi78P9I3HUKKQTtcXFgBsPbDfORGruD8Kkg9DYYcnQmyjkBa1sJcyp1+7sn4SoGMovukKUdnHDpzevy/LUY65ZNMjnmLm7n9cbAoqany2mgpaSLuKeJAkagWUADYYz32EUa1XEk9Uw8NNTuwsPxMQo/U4v/NK6lynLqnMc0nWnoKOJpppHFwqqLkn5fnbHaYTCI77oXEd05xFSupL28ztgbMAVW9ieRxQkH2reEmeCeqybPIIJNSpIO7ewvzKA9R88Whwh2l8L8aQiTI86pamZ/hppD3Mq26aGsb+18XtYurReG8N1EbKt/tNZVNW8PZbWQxG1LK41g87gG35HGcaVkqIhsLsBjcnHXDg4n4arMtK3qSuuEEf7wchbyO4+eMF1cj5RnlZl1WDHLE50q2xt5fL++MvqMJcBIF0fRMgNJid8wpBJHelDxKPACJdrk4Zsmz/MODeIaXOcglMNTTSak1HZ16xvbmpGx/6YcKSrdxdDv1H8QwkzKjjkZhCPCdwPL0xhQvMRpdK6DVYIsFLe2M5fW59lXHnDy93k/EqFKqG+9LWp8cTeoJBHmGBxIey3skre0MPXS1P7NylH7vv9GtpZP4UHXFWZhUVKZFmmSsveUlayS6TzSdPgkXyNiVPmD6DGm/s08VNxF2Zw5Rlrww5rlTmCuXWqSxqST3gLfhYbG24577jHQsjjyzrPPlwuWyJZ+nRmJnF7H0UH7Seyus4EgPd1keb5Z3giaRbaqeUi+hwNgSDzGIV2f8S1fBnE0FRDKy3kUi5t4hyHzFx8xjTna6ck4a7P8woi6z5jmISNW3vLIp2Ki+yqL74yfmVIGUSJfcb7dcVchrMOYCPhW8Avzsd3ijfi/NfQnJs2pc8yekrssOqGpjV0FvgJ5j5G+Iv2w8RjIOFmpInEdVmh+7xW5iMbu1vbb54qv7NfactaJuEczk012lpqEnlIQPGnvbf5HC/tVzaPMu0afLq53jjoaSJUCE/jGokHob9fQYt5GR4eMZAsRmKW5Phv7KK5HSzyIsqRRrEpvCJASwI5bDYee9zfAqzMXo6cUn3iRpSvO5Ygk3Bt/FhZlGfUEMkdDQtJOE2BZ77EbE3/AM74W8B8EPmnG9M9bO9XSUs7ZjUFjtcW0Rj+XVbbyGONbE7InEThV8fdbZlY1hf5KC9q2RpknFXA+XVkMZqDl7VFQrfCJ5pr7gc7BQPcYlnAFDJTZdL+97yRZ5ZACb82NlJ+WFHbiUTteyWokfR93ykSOSlwV1Pe3rfA+Ae+fIpaiIL3kkrtpZtiT0J+eLHUAGTOY3gUE8Di/HaT33T80ndO0Eioha0jRggqi/Ic74juWy9/xNU1JYCSKDSqqRtcgE39bYfs4T9mtRpSwqI55tLgfguCSfXEHfNRScYUdPoB70DUyg2+IgfrjE3LlbaL4UmrK5RmGTVcMqyR02bU6s4PO0gVgfYk4ufjHPxw3k09VEQ1XK3c0o/ikbkfYC5+WKSzCQjOcoQSRrD+0oleJU5sHB3J68sSXjzNY804wajidVpMsulybBpiRrb5eFfrjoMXM9jwJHg73Q+ZCycmDxslg7V/aT5FR2JEpEk19TOwubnnf1xOcvpljUG3thhymjVCSFUFjuVXc+/niTaxFH7DHK3fK0UXmFYtPG29ha5I6YhecyPWmno0LIazxNbpCvP2udvrh7lJr6vuWk7uBFaSeQ8kjUXZvkMRzJqqXPMxqM3ECQ0tSAlKCSXEKmyAdALb+ZJOLHh6YfEd32H9n9PqfRNq97SO3Kk1FTxwxqqKFUbAAWwpfYk3AA544mkKB5DBc5Ro5O+HeKq6gii5NvIYqAWUj7xSeoqxSUb1CESs5AgA/EzbKPrgMNLNR0yQa0ddFmJ2ZnJJZr4JnKz19MCNNNSoZSCLeK1ht6C/54NoJKeraSekmEsE1pQxck7jyPwiwFhicRlrgCnvZNaZkafiBMngsVhomq6puZ1M2lB+ROGnO7SHuxuWNsOdFSqlRmWZuP32YSA3PSNBZB9Ln54Rww/tDOqWAbl5VB9r3P5DFmNniTta1QyHSwlWbCpEESkFSqgG/tjmh/4h9MKmAa5B54BYfxY9TGwXJUuRRKBdbW6Yb+IuJKXhfK3q6wapDcQxA2Mjf28zhyCC1r92tt7G3zxnrtDz5+IsxlPeMKYSCKFQeUanf62xQy8j2aIuHKMCymDPM0rOJcxmzLNpu8LbIvJUXyUdB6YaGplLeAeG174cHDLGNK6r22A5YPSBTc89uXrjiXzPcS5x3KVUoJw8fumf5wkm00sJiQfyl1LfkPzxKpAQtxyFsRenonpOLp9crSB4pHBboCwsPlyxKpxKTAsKjuy95GPQDyxLPLrDR6JIYAK3Ub4R5irNTsU3OnDg0Qa6gbEYLlgPd6TyIIxSaUKtL7O1MDl2bVRG5eOI/mT/AExG/tfLnUeQ8PzUdVJHkX3hhV0ybK8wAKM/mAL2HK++JR9nqZVpc+om+NJ4pdPuCP6DFn8bcN0vGHCeaZTmkAdJomMW1yrqLqfr+uPQ8Mh8AI7oH7OB8qXzoyalepa/eOQTy5++JGuRylQ4lc6et7FRhlpZjkmYVNPL4FjlMb/yNfY+xFsTqgqUlQOviYfh8/8ApjCy5JI30u+w2xOhBAUr7P8Atu4h4Bnioc+mnz3h4nT3cj6p6cecTnfb+A3B9Me+0dw7RZ3l+XdpHA06VtBUuRVNChGh+uodD5g8jfzGIVmdMspdkSwbe3Qe2BcJ8Z1HBk9bR1cTZnw3ma91meWl7CVD+NCdkkXmG+R2xPjZZI0v3Cr5nTxYlhFPH8qP8PZslZDHKhuT8S+R8sStUSRgzrrUfEt8VXmpp+EeJ6mPKav77lEra6eQLpLRncal/Cw5EYnGT5mJY0ZW1IwuCOoxTyoPCd7vBWnhZXjso7HuEfnWVDulZLm/JrbHEWy7PM44Fzk53w1UNTVRXRUoNxKnnbzGLGQioQRTMBCQQNuRPXDDnfDzmnVlA1AcwNyPbA42Q6F25QZMUcw0SBK6niuu4xePMc0rZK2Qr4Wc/CPIDA0pxNE3UHyxAKGeTI6xkIP3Z28S/wAJ8x6YnuWVKvpkiOuNuYwpdRfqJu1Yja1seloqkzLV1vDWc0ebZO5gr6CZZ6d/J1N7H0PI+hxqHjLLW7T+Hcj7S+BaZ6qeSl7rMqGLd/DsygdSjXBHUWOKTz3hg1eWCspl1qRzHTE1+y1xy3DPFFZwnmcxSgzZ+9pQx2jqQLbeWobH1AxoY/vAwycOWB1Bmtvjx8t5+SM4J4Jq6ypcxZLmLys9440glUL/AMztYD19saX4P4Xj4by3upVDVkpDzuu9iBsqnqBv7knEmvIzC7uUN7qxPP54691uLXPMDzxow4ccT9e5PG/l6Lm5J3SDTVBZw7c6TvOM6WZj3enKQe8ZSChUufD62PL0wLs7ET5JAkMauixoV083JG535b74lnbPlitmGT18m0MiNTuxA+IHUB6XBP0xTNDxHJwoKunoJYpKmkk/exv4rwEeGRRffkAT5gjHM9QgkkynMbyaK2sWZox232VncXQxwiCSSojQ0iNNKmrcqdr+2IVwJDHneW/tiphemqqhnCrLu8aBzYYR9mVPm/EddmlbUSSZrV508RhnlGlTCoNyR0Vb8rWxMuMOB894SiH+jdDPm1D3g7s0sWtgCblSg5EEmx5EeuKTumZG+gXVC/qpvbY2j1Kj/GlecrWkqkAkamnRolHWUMNP5jD3kdIZV72qPeTSsZJCd9TE3J+pOA5rwLV0fDVBmHFa93mNRWIYaRT/ALEAaiX/AJrC1twMO2UxKNri4HLGVmwTY5bFJ86U0MrZhrHyUky68RJkIVP6+WFGYVAggZnNgo38sAoSBGbcsI82ZpNEMe7SsEA9SbD9cVmsLiAEd1umvNzJDw6sNMbVmeuQNW2mmTn/AImsPrhTkkNRHTRGsWHvVTx9zcKD5AHp64R5pUwZhxRVCCYGHLwtHTqtj4IxZj83J+mHmJu7pwAQCRtcbX6Yu5hBl8NvDdh+nJ/UqKK9Go8nf8/RHu+hbkkAC5wko4KiZ+7lJQyGynXqK7k3uOlhe3vjskgD6mcaV2seh/z0x6edqfL535PUsKaE8jZhqkNvRRb54HGha5418Dc/IffhJ7i0bclIkzBnmnNJSzTO7oFOjwIhuFJJtewFyOe+FbIYBUtHtJOwX4QATaxI6nbzx5kYU8ccM3cNqB+EMWUbkAHzwKedGaMkED8N1I3I/LETnl7i88lSAUAAkFbIiRhVsABZRy2wbwTR/ec6nqCNqeIkeWpth+V8NmZVSySGNArCPZmvup6DE04Fou4yczyKQ9VIWB/lGw/rja6LB4mSHHsqGc/RFXmn48ibb3sPXANQ9f8ADhSy6TtgFz5nHfLn0y8TVZy/h3MqhT4lgYKfU7D9cZnr0ZZY/Fdbkj6Y0P2iuY+EK3TazNGG9tQxn/MRshHRuWOb6w4htImnYoCrcJ0AN8HBdanQbXwCO1hf3wcW0DnuTyxyhshIqKZqn3fiKja1u9gdB8rHD5ENSC3X9cNnFSlVoa621PUgMf5W8J/UYcaFrgDn1w7j7rUAS1EDJzO+1j0x4jUunnfA4rB7EbHBk0QDCw67e2Aad0k79nXEEfCnGlK9Uxjo8wH3Wob8KEkaGP8A5rfXGnRGSTe1jt88ZAkSHMKdlKlka6G6kXtti8eyrtBGY08HD/Ec18yiAjo6h/8A4tANlP8A4gH+IC/PHUdJzWs+A8/L7JiL4WU/tC8Cz8EcdVdVHEWy2vbWpI2ZW3H9R7jEJ4fzf7u0cMkmqJv9hKf/AOT6jH0C7Uezql7ReGp6CojQ1UYJpidr+aE9L7WPQgHHzr4jyCt4JzmpyvNIpDGHYeIaSQDb5MOuNfNxw8ahweVv9JzQz4T+3HyVnx2rEOi2sLdhfn6jDXVZd96cJFGZJW5Kq3J+QxHclz/QYoaqTUrbRT/0b1xrb7PuW5O2Q1Ga1ApEzI1Dx/eJQC6L0Cg7X22vYXa+MbFxHyS6LXQ5uY3Eg8Sr8ljziThaeJe7rqWemb4kEkZRh6i43xH8mzOfIanuau7UrHmPw+o/tj6SZtlP/aAXoq7KqaTJYlbvxVJ41BF76xuJL7gDbzFsYr7WuzaPg3iusyymkNTS6RLCzfEFP4W9RjXlxjFCC42D57ELGw88Zk1AaX/wUZllalREhjcOhAsQdrYlFEyysiVSB05l2J59B+uKTy+sreHZv3F5qa+8Z6e2LP4Z4ko84ULDIFl/FG2zD5Ywnw0fMLo3fGbR2KL4r4Yp5k76lN3c/AF5YhtNWVHDlYiVF3pG5MBfSP8APTGm+AsgyLiaqky7iOsGWJLCe6qNII1dBc7D54rDtL7O34cmljWaOuoWJ7uqhBCSWPOx3BxMIXxx6uQqbMhvieETv9VJeDc+yufL/wDXqkCilQhig1FTbYj52B67m2Kz4mqJeFeJqLNICt6eVKmBoX1a1vf/ACOdxiunqq3JK1hltXLTI27WbwH3HI4S5pmOazNA9dBIyTreOQKdLi/T/pjTjGprSOyoS6Y3u1GgV9WMg4lyribKaHNclzOjraStVe6limUhnK3Kc76ufh57HbDpZiWuw0m1gFtb59cfMThzL5cuWjrnaSLTIsyqkpW0lvC4tyYfxY232M9uVN2ilskzlRTcT09OZmMY8FVGtg0gH4WBPiX1uNuWkyZrzp7rmpscxCwbCtXM8pos5opKPNaaOrpJfijk5HyIPQjzGK7rPs/8DV9fHVVVHWPJEulF+9nwg7WBtq68r4tIKeu/W/T6Y6FEa2Tle+5xKWg70qwcRwVHOHODMn4PoDS5HSrTRXDO7Ssztv8Aic7kDy5Yf0i0alHwHnv/AJ2wZoIQB2DEDxEjY++BWF7nDBoHCVk8qr+1tjbJ4jvYyyWH/lH9cRbL4tEYKAa2tc23xL+1CIPmOV3N1NPJb/GuI5lydCL2x591sH2wk+n0XSYP/gE5UN1it1vsPTCOarWizSOpm3SkSSpI8+7QsPzAwvogdUyG9lO30xFeNalqbTGi3NSO4IHkSCfyU/XGTjSCORrz23/ZXHsLgW+aTZTQotNSPKP9YALsQbXdt2J89ycSgSKhA5dMR3Kaj7zT082wDAEgG4Bw8sJAxIZRHpOoW3v0N/LBNFt3TOO69KYpg6yKsiHZhz5eeC8wtNWxQix+4waRqNh3rjU5J/wgn0wjSqMNWwMYEe7Fjtra1xbz5EHHqWCWtpnLztDJUMzyuqgt4udr7DEznhkZZ3Nft/2kAFuBPZOOTymroYjUGF2CldcD6kPmVa5NvzwTms4UPGWeMFSAynxcunrhXTxCjRIIEVYI4woNwDfysB88R3iLRNGFkDXDqUZeasDsfl+l8RtaC6kRKRwd5VKgRS0s8gWNm+KQbBT6/PF20lGKKkpqaLZIIwmx52H98Vr2f5aa/O4ZZy0iUKd4Wtzfkt/nc/LFs6ABYtfzvzx2/Rsfw4S891hZ0uqTSOySNGN9sF6F8hg6RztpViD1OAXXzGN9ZqhPHpNRwhmRS2lFR7nc2DDp0xQmZkLSs9/hscaPzyl+/wCR5jSKL97TOo97bYzfIFqqQq/4lsffHPdVjsC0bN7CIia6q3l+mFaxJJpewZ1FgfTDVRse67tt2TY+tsO0TAAdFPljkNwaS4SbMqAV1DNTPbS6FT6eRwxcP1MksCpN/wB4hYxyjlZl2P8Af54lYJvuOe2I1mVKMpzT7+m1PUlY5/JX5K3z5H5YeiWlqHupCqggX59MHBO/TSSVYHbCelfvE53OFe4IZRZv1xWaU6LEblQJRpcet8Blp9QFyVYWIZTYgjcEHofXC1AZR4tnGANC7s9ygjsLW53xMCkrV4C7XQyxZXxpJoqB4YMybwpL5LL/AAt01cj1tgrtv7FqTtJymTMMqiCZwiarAWM9hsR/OBy6MNvI4qdoJACrgMp2IIxLuEe0POeEdFNERmeUqf8Auczm8Y/8N+a+24x0uD1jT8Ofcef3TEb2NisZ5rlddwvmc+XZnEyMpN1IsGF7ahfr/wChxYPZd2tZn2f1waFvveWy+GaFwGBHkQdvkcaS7Tuzzhjt5yx67haoSh4siXX90mtHLK1vLkW6XFw3XffGLa3Ka/h3OKnKs4gajzGncpJFIpW9j642XfD+PAbaugw8lmY32ecb/X1C2rD9oqiq8ojiyXLjTmw7uNAEhQ+dh/19LWxVHEcFXxLmtVmlVLHNNUMCyqLKgtYKvoPXFKZbmVRQzA0chp3PxRyfCfbFj5Dxoq93HWxENcL4N1PtjNypZ8oVe3kP9kla8GBHhnXDz6pLXcJd6bGGxtzIxFK/g+WmfvYC8TryYbW+eL2pmy7PacGnqkDggMAdLqR74cx2b1ua5ezRUz1MQbwTabGx87eRxTiZkcNUrsxrT8QUqGyftE4g4UcR1P8Ar1OP4zZ7ehw75l2qU/FDBKiKpHLXGTe1vQEA4X8X9n5yx5DOrpb+K1uWKnOTs+YogLfFfUOYvyxdjcSdDwmfod8Rm6mPFObZFLloTLaCRKk7ue60qT5gEm2Ifw/QPmVfSEHTGS5UF9107E26f1wqzXLpaPSZ5JXANgBffEl4J4JrcxrkeQRwI0hQyGTfw8wAOfv640SQBay5rAAr+0bXXy+nWPaVYyAqbHc9APzxNvs5ZDm2edp9DXcPuInoZhUVVU92VacGzqbc9dyoHLa+LOg+ylnmZvSVEudZZS0ssSswkikllXULnbZdr2tf3xojs/7Oss7OMiGU5G0joW7yaVwoaV7W6CwUdBixDC4HURSxZ8hpGkbqTBdJUAjrsT0x4ra5sWG2wwcqWFmNzz3tfHDGbi1rdb4uLPRZTVva/pbHSgYEE2PTBunULHY9bY8FYJ47XPO2EnCr/tRpGWhy7MAt0ppjDNbmEksA3tqAv74idCqgg7Yuiuy6nzGinoq1DNTVEbRSKeqn1/MeoGKJ4gpK/gmc0maBpISbUlYBZKhegv8AhkHVT7i+ON69hyO+PGL81tYM7Wgscnynnj790JAJGIhxcRJmNMpOoK4IHrY4rfN+26jyPOZaX7vJUPGbTeLQEPQb88SXL89j4wynLeJaRWSnmzJ6MI29mWK7fQ2+uObb0/K0a3NoUtVuSzVRO6lMMLPAVQEEDw9N8PSxd5Thm2LL9MEU2lYbnoMNU/GGT5XN90zLNKKjnb4I5ZgrWPK4xGGuugLRWDuV6dXiQ/iG99XTbC7Lm0xrYclwlzCZEpJJGIvp8JG+q/K3ngmhRKqOnaUSxsjCTRrI8VuTW5+2He6yE7RsSnmd2FmV7IAdS6fi+eInV5jT18euCW+hxfSbEG9txiQOkjNIYpQ6HwmPY2bqb/0wx1lFHAHlCKsmka2tbUB5/XFrHoyUVE/YKzuzXLhT5C9XbxVcpsb/AIV2H53xL2Ci/mfM4bOEoxHwrlKxmw+6q3pvuf1w5yLqW0qhvbHpMLBHG1o7Bcq92t5KTvpJUowta9gb3vgruk8z9cGle7uSFAA5+mCfvMPmn+LE+yBM6y2FwLgfnjOnEWXnKOIc0oCpREmLR3/gbxL+R/LGh0Xa1sVp2uZCxhpc9p0uacCCrt/wyfC/ybb2OM/NhMsO3I3SBo2qmkQQy60FlPPCuBu82J3A6YJcLIpDcjzwlyx5aYLFVMC63Ab+IX2OODnj0usKVO4/ealIIK+uOz08VdTvT1CB0dSrX6g4ORVddQNm6YCd7H4XHQYgJs2EBUXyyolybMBleYOzEgmmlb/ep5X/AIh19LHEuhcMFtyPl0w25lllPnlP93q1KspDxyKbMjDkynoRhPllfUZfOtBnOkTcopwLLMP6N5j6YF4v3m890Q3UoRRfcYVQRKV02v53wmglVgCCL4cacqxF1AxG0+aVIh6G4/TDdNTlJCg2k5gEc8SmOEHl16Y4+WLM+p0VnA8Nxy9jiXRfCZQ9102MqkEcmGxB9CNxiOdoHDT9oFJTiuqxJmFLtBWSIGmC9EaTmw/5rkeeLCqsq0v3WpS7bqhG9sNE2SzREsNvTyxNHPPiklhpONt1nHMuGc54dIizqiNVTj4amC7C3r1GOZdKrC9HUgb/AASf3xohi0YKTqG9xzxFs57MMnz0PPQMcrrNz3kQ8JP8y/2xoQ5jZTThRXQ4vV3MAbMLHmobkueZhk9bFVw5fTVUiAhel7+3PliyKHtyz2nheKbI5FjfmsU4A9beWKgbI+IsrrxRrQVFbqbTG1OhOvy25jEmouFuM6iRIhwpnpkbkDl8gv8AljXiOQ4fDsj03Wu5/TsinvcP3r+0t4n4vzDif/a5T3VuRefVb++GXg7gHPOLeJUy3hiOWWsmIkla+mOEDYsx6L+uLc4T7AeN8/njOa0H7BpDbXLVsA1vRBvfGo+BOz3Kez/KPuWUxnvnINRVEfvKhvM+g6DGhjY8uvXIK+qzc/NxI4/DgNn+Pz5LOOWfZKzOqqJnznMKGKWJ7QS1Aeo7wDm4jUgAHpqN/TFucA9hVLwqFnzutizatV9u4pu4iKDkCpudjvYED3xbiqY2bvLbm4bz9COmDChFuVut/wCmNQRs8lzL8iWT/J1ovSfP39RgQUG9uY9cdY6Fvtz38hjiJpvbdutrYMlQomOBIHNmYlrfE3lgbp3h8D2ANvCeeBMsUkixyaXIOpQdzcf2wIr41Fho+u/lhqT90SFfvBctYGx1WAPqP0wYsQBuLkk8yb3wYUDNbqADy5euCzGEZQD8Q8VzyA8hywqpK7RgB3sQPW2E9dl8GZ0k1FXwRVNLMmmWOZQ6v7g/rhQln+E+FTbb0x1grBhcr7bWwxFhEDSoDin7J3C+fZlLX0OZVmWyykeEIJdNugYm/Ta97Ym9d2UZXl/Z6vC/CEaUTUcgqqN5TqL1I3LSHmde4J8j6Yshl1i48R5jHFCul05X5n0xD4TNJZWxUniOLg4ncLMC5xIwmo54Ho8zp9qiil2dD5j+JfJhcYzBxpl+djivOZ9bySzy3S6A6120gX2sBt05Y+jnFHBGScYJFHnuXxVEkV+7qUvHPD5aXXcDEOTsF4bEwapr89q4xv3T1wtb3C6j9cY8HTXYsxkjIN+f/Crz8psjKdazf2fUPEtVwrR1ufyuKH9p9xRxFSPhiu9v5Q1rDpbFjKklEDNTrNPPPKiCMElQeQuOi9Tiye0jJqPJsl4co8tgWmoqeseNI0vZbxNbnvvbmcRmiijCguL2OoY5zrGO2HIsDn6rTw5S+KivRUPdENqOwJYdGPUnDPmgRmaGQX1xk8tiL254lasrwStcWtzxHs3uTGIiujfVf2/vjKhdvYVh26sXgGV5eE6ANYiHXEN+Wljb8sP8rKukWuTtiOcBRmn4VpNSH988kouLDSW2P0GHtmUvcsGvcqBtb1x6jCSYmk80Fyj61mvMoFQqMdLHc3sMI/uw/wDlIPpg6QAyxlGLHe9zcAYHqPmMTVaDhMaDYczjlRTQ1lPLTVkQmhnRkkjtcMpFiDjqX6kY80yowVgxJta3XCPCHnZZu4j4en4Szd8unZpqdgXo6hv97Ffkf5l5Eex64YMxhknpW+7v3c6+KJ/JvI+mNO8W8KUvF+TvQ1Td1Mp7ymqFG8MnQ+o6EdRjNuZUtXk2Y1GV5xCaetpz40/Cynk6nqp6H+uOY6hh+GdbR7p/hEx29FAyLNmrqdWljMEy+GaJuasOY9fQ4fokV7EE36E4jK2SQSoPFyv6YeaSrBCkH3GOWlYWOvspDvwljwSJLdbafLCWsooMwp2gq1DKfPp7eWFq1F/I+Xpjz6JbW974jF3smTBRy1vD3gqtdfl9/DMvikiH8w/EPUfMYl2X5jDVxq8EqyoRcFTfDTFCyk3BKE+LfkPTBIoI6WXv8uHcy23A5N74d1O3RX5qa0852YNceWHekq1YgMMV9R8QgSCnrlNNNa4uDpPz5YlFHJrCsr6weRG+CaSzlPSkppYZnEjBWYcjbcY7LlsUqXtpOEUM9xZ7HC8VIK7YsBzSN0NJmrOHy6MY1B8jhjbK5IJLi6m/QYmrVQ0N09cM9VOtibi+GLY9iEyJpPu1VCYsxpdemyiRCLj388KMr4tzzh+V48izeoFIht93qG76Mj/lbl8rYa4ZxD3rO72cWUDrhC4Mi30Er198aDMl2htchNSs6g7cq6Fe7zbKaesAsNdPMYnPrZrj88PTdvOS01G09blGbAxRl20CNuQ35NiinLFyIiuu26na2HWFo+4CSprJFjtfFpvUcpgG9qVjA7laX4I41yTtCyCnzzhWr+95fISjAxFHRwASjA8iL74khj2sthcfi88VB9m3JoMn4FzVaBmFLPn1W8SnkgGlSAeouDi5LADc46+N2tgce6rPGlxARaR6E0jf3xxQNbFdz1On8r483dyKW1XXcHSTgSghQdVkt1HTBpkAqgcEizm4B6j2x4nTIFbkRsT5jpjqM7HdLAG253+WAB2uytH4hubm/tY4ZOukNGHZmLId7W3X2wVEZL/vUTWWIO9rD+uB6STG+4a2yM2w8/c48psTchha+stt7HDJ14DbUR+8O5C++O96rbX9xzOCWMqSm8l4nN9huvz8sCkKk9QbixB5H0w1pco3YkE9RsP+mBAm/K/thOrM++p1Uddrn3xxhrQqJGKk877+wwk6P1hthYnr5YLu2ndl35bdMB0p4fCOltscZbyDb4b2OFR7p1Du1DLqjNODquTLozNW0LJWwqo+NozcqPddQxSs/GNDQZI+cCTvaFYDKunckdF977e+NMFNrkXJ57YpDjL7PozWsqqnhPORk0dYxepopoO9py5+JlA3W/UcsY3UennLALVfxchsWzlnjMO27PJ46ienqIaCmSQAU0UKysV8mJNyfOwtbFk9l1Zmfa9Vireiqspy2i1QVcjf7KYmx/dnqbC3pc4d8m+yJlEbpJxPnc1boYlYaOEQrY8xqNzi+spyaiyHLKXLMrp1p6OljEcUY3CgYli6XjCiWAV+b+ajlzJDsx356LixdzCkcShY0UKi202AGwwRLZyAiDUQfERsPT/phwdQNzywmcqCCTtbYWxr0qNpHIFRgzfF8I87f2x3T6jHZXjUawg1bchY4D3q4fhJMEWpdmBYnmQdhgxJVaVl5aBvdf64CmoSqEVdB3J5W/vg9wSEVRszWO9hiNP3Rlm0ju7H0I6YinHPAdJx3QRo7mhzWkGqlq9N9N+aN5oTzHMc8S5Y7oQ5J1DexsPl5YPhQDcrYkDYm9sItDhRQLIGZZZW5FmU2V5zA1JXw7shN1dejo34lPn9cJhN3cgsSCD7Y1ZxZwTlHGWXfdc1hKOl2p6mHaWBv4lP6g7HGbOM+DM34Eq1iz5O/oJH00uZQr+6k8lYfgf0Ox6HHMZvTXMt0Ytvl5Imv7FFUlSkrbmzDffDnFJqfwgriKd8YmBU3HQjC2lzoxyKsqM6FrXX8J8/bHMOic07cKVStIbk36jljzQi9h4cI4c4pe8VTPGHZggBbfUeQt54d47FbGxxDV8pUkTw/uykih0PPCGLLpaKMDJKp6Ur8KOdaH3B3w/NCrL4b79MIpoXIOkFTy5csI6h8kuExSdoeY5BJo4mylxBey1VMdcbf29jh5oe07Ia5QY55F9NN8D0kqO9XVYi3viYZFn3DlVGYONeF8rzC66Ur46JBMvq6qBr9xvi7jezSnTK4t9eR/pNbjx9kwf6X5dOg7qaV/QIcEpmklZMI6CklnB52O/0AJxoTIeEeA8xgSp4YyfJK0EgnRGCVHUkHdT7jE0oaGmy1dFDBDSgHlFEqFt/IAY6WLo8BpxfY/RAXOG1LN9JwNxdnWl6TJno4rbM6hNvdz/TDtH9nLMczmgqc8zpF7s60jWSWRQfPSNIv9caIjRIxZF63v774F1DX5AnTb88bEeDBFw1R6neapA/Z0odIlfOX1eYoxy+bE4JrPs3iaQCmz5Y4xsz/dmVx7Waxxe9xpJF7HpgGq5MYBJAve/LyxOMeEG9IThzhwUhybJaLhvKKLK8shWKhpIxHGLcgOp8yTck+Zw5E3B1BbdeuCyrFiZPELWsANsBWIqAsbMF535/LfE+6ZDBBGwQHbkNrY4wDqLHwn5gjHmDKL2uR+IY5FG3d+BlGo3B09Pbzwyf1QQFdR3bEIBYdCPY4DGTJGG/eLddtVr+9vPBkMbIXRrOF6288GrG1vhANthe9sMEVpNrsBpUnbnbljpQsRq03bZttmwdGl18IIRdgLYH3VwCwttex6YdJJtBJKuVIOwXTzxxYyjMCxsdxfa3nvhYENwdtFtvPAZY1K+LYr4hfphUmtIyrixiZpuQI1DbzN+uBIllsDcAnl+mD2kTQCpGk2IOCpKlUDW2A68/ywqCRK73e2Auo1Dfc8hfCaXMoo1JZwB64RzZsigaWHzPTBUknE7XuR6emCXkW1w1x6HDBVcRJER4kKW3JO98MVdxfTwkE1Kqq81BAucLYJUVMZJ47hmsG3AucJJa1ASTYeuK4ru0CljuWkG3LcfXEWr+06MKe6ufK2FYRaSrfqM3jXVvy8zhlq+I1hViSpsNlDXLemKLzXtUERtLPFHe99cgFvlzxBc27ZIYqhIVepqZJOQp4SVX3Y2AxGXgIwwrSVbxVTqC2pQ3Pfphu/04pv8Ajr9MZF4j7aaiml+70FE1RUEcpJDt8hiPf9rXFX/0qH/8cmB8QItFL6DXKR35ty26nBu8S6jd2uBtv18umCUK6lRwAzAso58sHhnJcae7XkGY8z52wVqFKVsCSzbevTAkAlbUoAUfiP8AnlhNGkveFw4kFwNJPwj++FenvVViumxuL2ufLCspI9DY2VS3mfLA6mjp8xpZqWugjqaaVdMkUyBlceRU7Y8C1gVAv5E46zEsoiO9zcA/mfPBcIKBVG8a/Z+mUTVnZ3VJHzb9l1TeH2ikPL/lbbyIxSUkFXSTyUma0smXZnCxEtNKpV19bHmPUXGNzqXUhVAYWwy8TcI5DxfTxU/E2WQ1oUlYpXJEsbEfgkB1D64zcrp8OQL/AMT5pgXN43CxUlQ1PMksiKzowYSBd7gWv74eKrj1stiiL0M1a7EDTABcDqxxZPF/2bMwoe8q+CM3NQrHUaPMHswHksttJ/8AMB74qvN8gzThqXuOK8rqsoe+0k0REbeocXU/I452fpssRtzdQHl+WFK2Rvf+VOqXM4KtIminCFgDpbY+2HHvdhff3GKyj8ceqGRJQR4d+eD8nnzHKkf968zSNqYO2pQfIDoMYboa4KksEKeSBJWGg6WHIjAQrLuLHfe+GFOJjAmqrpGAHMoN8KqbibL51BLyQE8u9UjEBif5Jk6xyT0tSlTRVEtLOhuJIWKP9RicZP2v8TZb3cdTPBnES/hq47Nb0dbH63xXVNXJUgmJ1kjb4WB3HvhizvMjSZoHWVkZF7mOO1g7Nve+LeI+dj6jcQpGgu2WruFO2LIM7kWmzF5MmrHbZalw0TE9Fk5D2NsWUgDKHU+Ft725j3xhWGSbNqEn7vqMagO6j9MXP9nXjGrqM6qeFa+oepokoWqaQVDEvGUdVZQTzFmBt0+eOvws6R7xFKP1QujG9LQLfuLuzFtR+FV5+uDGpjIEDNyYMxAsWtyGFYCryAHtjglVX0E+K1/LG4odPmi1XWoZTcHcEYMEYtzsMc75N/1wWatFvvh9ylTQjTCCN9/TzwX3LMzAgBSbgnf3wRJmca7axfCGXN0iZQpBXe5Y7g4VFKx2Cd1jWJzuSrb2LXC+2Ou0YOoWDgbEjliM1PEUKjeQbG/PDNV8aUkAIEoFhfnfnhUBylZPZTiWqIT91a55HmMJp6yKaMCW63sSNVtx02xWFd2i00YN5Nr7YYK3tMvcREk4Xup6KuSbNY0bdxvhunz6KEbP+K/PlfFA5p2mmlDyVFRFBfcmSQL+pxX+c9uWUQk97nEcjL+GAGQ+222BMjRyUYiceAtR1HFdLTgkyXKk2Grl7DEeruP6RWF5LFG1XD9cZFzPt+p3ZloKSsq2PIyMIx9NziOVHajxVmpIy3LoqdTybu2c/VtsRGZp4UghPfZa6ru0uJVKQEm3K2Ilm/ar3KMZamOmHnJIF/XGY5W4xzf/AN4ZpJBG34RJpH0XHIuD0ZtdfXSTMedv7nAmVx4CLw2Dkq4827aqEah+0u9PlApf8+WIDXdtxq6hoMqoKmse/wAckgVb/K5x7LeDsopqc1VfAXiHwrI3xfLA7UsZtR0sNNGNlSNALDAkvPJSGgcBIpOL+J8yN6amSmUjmEvb5thJLQZ7XeLMszdV6qHP6C2HkzWuxOOKxZtT/F0A6Yar5KWoplg4XKuS8u56kXOJBl3B1M6CWrZzEPlq9sO2XZaCBNU7JzCefv6YXTVOohQLKOQGCDAgLiU30OQZZlzl6WigSQm5kKXa/ucOXeDyX6YID6jgW/riThCtURltvEvr74MJ3sAAFYElr2t/fCSMDvXWwsAGGF6ooYi1wRcg74l5Ua7LM0ITQmq7AGw5DCstdQbMpuOZ04TSAB4PCCS9rn2wsjclcKtyhQ4QJDqs9nHO+22FIhbvUIIEYBBW3PywXToInaNPhU7emF0QF+WHATHleSPfflg1IBrZwdmFiLdfPA1A0nzwcigE2AFzc2HM4OrQoCU5DWX4LcueBS0a1FO8EuloXFjG8asv+E7HBq2UHSAN8C1Ny1Eb88Kk3Kgmc9ifAeduz1fDdLTTOf8AaUDtTOT1NkIH5Yj1R9mzhcljQZrnlGANh96SVRb/AJl/ri2ncx308xtc7nBEs7rMiXGhxci3UHEb42P/AM2g/MA/VMGDtt/Cplvs0Usqq1JxXmkEhF7VNFFIF+lsN1V9m/M4hGtPxXRTyPsFqMrYLf1ZG2xeqyuUV3OthcgnphNU1s8aqyyG5te/XFY4mM4WYx+w/pFRvlZurvs+caURYwU+TZoL7fdq9oW/wuoH54hud9nXEtAt864XztIo7kSJT/eFX1BjLY1tW101LEqo2uzbF9zhJLmtSI9nsbcxtiB3TcVx2aW/I/e0QL2nY/n6UsYTZ5Dl1MsMs89KsV1AkgMRHpuBvi0PstZDxDNxDWcb8VRzUOWigNJlqyRmIVHeMGLoOqBUHiPMn0xcWY5tUSK6zCOYHc97GHufnhgr+Iq9VYiQbeG1tre2Hx8CHGdqFk+ql1vIpXFJxBFE5BkAUC4Pl7nDfU8WU6Bl76wIO4bl7Youp4gr5R45sNc+aVUh8Up3ONG0OlXjVcd0sTbzgm1h5+uGSs7SIEvpkxnXPuKq7L6aWWMRSujEAyAn9CMUvnHbHxTJNJFTz01IoJsYYBf6tfFZ2QGqwzGLt1tOq7SWN+71H1xE837VUpbmrr6emF/95OFsPO198YuruLc+zXUa/N62YH8PfFR9BbHsrymHMZFNS8pLczqH9RgPGc7gIzCxnJWl827d8ipywbN/vDDpBG0l/nyxCcz+0HTOSMvy+sqT0MsgjB+QucRSj4NylFVnheU/zuTh2gy2jpNqelhj9kGES/uUwLBwEjqe1nizNTbLcshgHRu6aQ/U7YbZ6jjrObmuzWanRuarKIx9FxJS5ta+2Asxta+B0jvun8Q9tlEV4Fad9eZ5i8xO5Iux+pwth4RyinILRvOw/wCI+30w8yMbXvhM7HffDgAcBMSTyV2Kmo6UWpqaGMDqEF8HfeegPLCEuSTv0wDUbfLDWkEvNSB1v6YcMviVwait8NOm+/4jhkolE9UiSfCSL264V5nUyNN3V7RoPCo5YQKb0SyuzNqyQFjaNdlXyGEpmVQPPy88N4c2JxxXYjUTc3thJFOKyFm3NyeX/TD/AJfSJAglqRqkO6qeQ98NeVQoIu9I1OGsCemF0k767X6nBgICnWWr6X3wQJCxvffCEMb4PXY4NCl0ZsQcKNX+bYQoTYYNw4SX/9k='))
-    # game2.images.append(Image('https://upload.wikimedia.org/wikipedia/commons/thumb/9/94/Banana_farm_Chinawal.jpg/255px-Banana_farm_Chinawal.jpg'))
-    # game2.images.append(Image('https://upload.wikimedia.org/wikipedia/commons/thumb/9/92/Cavendish_DS.jpg/405px-Cavendish_DS.jpg'))
-
-
-    # add the games to categories
-    cat1.games.append(game1)
-    cat1.games.append(game2)
-
-    cat2.games.append(game2)
-
-    # add and commit to session so they're all saved
-    db.session.add(admin1)
-    db.session.add(cat1)
-    db.session.commit()
-
-
-
-app.cli.add_command(init_db_command)
-app.cli.add_command(wipe_db_command)
-app.cli.add_command(demo_db_command)
+# the db instance, bound to an app by create_app
+db = SQLAlchemy()
+
+
+def create_app(config=None):
+    '''
+    create and configure the app
+
+    `config` is a mapping of config values. If given, it's used instead of
+    `instance/config.py` (eg. for testing).
+
+    Nothing expensive happens here: the PMI models are trained on first use,
+    or up front by `preload`.
+    '''
+    app = Flask(__name__, instance_relative_config=True)
+
+    app.config.from_mapping(
+        SECRET_KEY='dev',
+        SQLALCHEMY_DATABASE_URI='sqlite:///' + os.path.join(app.instance_path, 'db.sqlite3'),
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        # SQLALCHEMY_ECHO=True,
+        # word lists to train the PMI word segmentation for each language
+        PMI_WORDLISTS={
+            'rop': 'res/kriol.txt',
+        },
+        AUDIO_DIR=os.path.join(app.instance_path, 'audio'),
+        MAX_AUDIO_BYTES=1024 * 1024,
+        MAX_AUDIO_SECONDS=15,
+        AUDIO_BITRATE='24k',
+        AUDIO_CACHE_SECONDS=365 * 24 * 60 * 60,
+        # largest request body accepted, mostly base64 images in create_game
+        MAX_CONTENT_LENGTH=16 * 1024 * 1024,
+        # threads running request handlers when served with dhoyu.asgi
+        ASGI_THREADS=8,
+        # response compression (see compress.py)
+        COMPRESS_MIN_SIZE=500,
+        COMPRESS_LEVEL=6,
+        COMPRESS_SKIP_MIMETYPES=['audio/', 'image/', 'video/', 'application/zip'],
+        COMPRESS_CACHE_BYTES=32 * 1024 * 1024,
+        # per route rate limits (see ratelimit.py)
+        RATELIMIT_ENABLED=True,
+        RATELIMIT_STORAGE='sqlite',
+        RATELIMIT_DB=os.path.join(app.instance_path, 'ratelimit.sqlite3'),
+        # number of reverse proxies in front of the app which set X-Forwarded-For
+        RATELIMIT_PROXIES=0,
+        # requests handled at once by each process before shedding with a 503
+        # (None for no limit)
+        MAX_IN_FLIGHT=None,
+    )
+
+    if config is None:
+        app.config.from_pyfile('config.py', silent=True)
+    else:
+        app.config.from_mapping(config)
+
+    if 'gunicorn' in os.environ.get('SERVER_SOFTWARE', ''):
+        gunicorn_logger = logging.getLogger('gunicorn.error')
+        app.logger.handlers = gunicorn_logger.handlers
+        app.logger.setLevel(gunicorn_logger.level)
+
+    # ensure the instance folder exists
+    try:
+        os.makedirs(app.instance_path, exist_ok=True)
+    except OSError as e:
+        app.logger.error(e)
+        sys.exit(1)
+
+    pmi.WORDLISTS.update(app.config['PMI_WORDLISTS'])
+
+    # register the db instance
+    db.init_app(app)
+
+    from . import api
+    app.register_blueprint(api.bp)
+
+    from . import compress
+    compress.init_app(app)
+
+    from . import ratelimit
+    ratelimit.init_app(app)
+
+    # TODO, XXX: below is here for demo/marking purposes only. DO NOT ENABLE IN PRODUCTION
+    # put `export DEMO=` in .env to enable this
+    if 'DEMO' in os.environ:
+        from . import demo_views
+        app.register_blueprint(demo_views.bp)
+
+    from .commands import COMMANDS
+    for command in COMMANDS:
+        app.cli.add_command(command)
+
+    return app
+
+
+def preload(app):
+    '''
+    build all the read-only data (currently the PMI models) up front
+
+    Meant to be called once in the gunicorn master with `--preload` (see
+    dhoyu/wsgi.py), so forked workers share it copy-on-write instead of each
+    building their own.
+    '''
+    pmi.preload()
+
+    # workers mustn't share database connections made in the master
+    with app.app_context():
+        db.engine.dispose()
+
+    # move everything built so far out of the garbage collector's reach, so
+    # collections in the workers don't write to (and so copy) the shared pages
+    if hasattr(gc, 'freeze'):
+        gc.freeze()
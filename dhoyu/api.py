@@ -1,20 +1,26 @@
+import base64
+import binascii
 import functools
 import json
 import os
 import uuid
+from calendar import timegm
 from datetime import datetime, timedelta
 from pprint import pprint as pp
 
-from flask import (Blueprint, abort, g, jsonify, redirect, request,
-                   send_from_directory, url_for)
+from flask import (Blueprint, abort, current_app, g, jsonify, redirect, request,
+                   send_file, send_from_directory, url_for)
 from werkzeug.utils import secure_filename
 from werkzeug.exceptions import HTTPException
 
 import jwt
 
-from . import app, db
-from .decorators import token_required
-from .models import Game, Image, Language, User
+from . import compress, db, tools
+from .audio import AudioError, enqueue_transcode, get_path as get_audio_path, save_audio
+from .decorators import admin_required, token_required
+from .jobs import enqueue
+from .models import Audio, Card, Flag, Game, GameScore, Image, Language, Like, User
+from .ratelimit import rate_limit
 from .tools import get_card
 
 
@@ -25,13 +31,19 @@ bp = Blueprint('api', __name__, url_prefix='/api')
 # future if required
 @bp.app_errorhandler(HTTPException)
 def error_handler(exception):
-    return jsonify({
+    response = jsonify({
         'msg': exception.description,
-    }), exception.code
+    })
+    # set on rate limited (429) and overloaded (503) responses
+    retry_after = getattr(exception, 'retry_after', None)
+    if retry_after is not None:
+        response.headers['Retry-After'] = str(retry_after)
+    return response, exception.code
 
 
 # AKA login
 @bp.route('/token', methods=('POST', ))
+@rate_limit('10/minute', key='ip')
 def get_token():
     data = request.json
 
@@ -65,7 +77,7 @@ def get_token():
             'sub': username,
             'exp': expires,
         },
-        app.config['SECRET_KEY'],
+        current_app.config['SECRET_KEY'],
         algorithm='HS256', )
 
     return jsonify({
@@ -74,6 +86,7 @@ def get_token():
 
 
 @bp.route('/register', methods=('POST', ))
+@rate_limit('5/hour', key='ip')
 def register():
 
     data = request.json
@@ -138,6 +151,7 @@ def allowed_image_file(f) -> bool:
 
 @bp.route('/games', methods=('POST', ))
 @token_required
+@rate_limit('20/minute', key='user')
 def create_game():
 
     data = request.json
@@ -177,7 +191,17 @@ def create_game():
     public = bool(data.get('public', False))
 
     audio = data.get('audio', None)
-    # TODO: validate and use audio
+    if audio is not None:
+        audio_data = audio.get('data', None) if isinstance(audio, dict) else None
+        if not isinstance(audio_data, str) or not audio_data:
+            abort(400, 'invalid or rejected audio')
+        # check the size before decoding so huge uploads are rejected cheaply
+        if len(audio_data) * 3 // 4 > current_app.config['MAX_AUDIO_BYTES']:
+            abort(400, 'audio too large (max {} bytes)'.format(current_app.config['MAX_AUDIO_BYTES']))
+        try:
+            audio_data = base64.b64decode(audio_data, validate=True)
+        except binascii.Error:
+            abort(400, 'invalid base64 audio data')
 
     language = data.get('language', None)
     if not isinstance(language, str) or not language:
@@ -204,9 +228,17 @@ def create_game():
     for image in images:
         game.images.append(Image(image['data']))
 
+    if audio is not None:
+        try:
+            game.audios.append(save_audio(audio_data))
+        except AudioError as e:
+            abort(400, str(e))
+
     game.language_id = language.id
 
     db.session.add(game)
+    for audio in game.audios:
+        enqueue_transcode(audio)
     db.session.commit()
 
     # TODO: return created game id
@@ -237,13 +269,111 @@ def list_games():
     })
 
 
+@bp.route('/games/search', methods=('GET', ))
+@token_required
+@rate_limit('60/minute', key='user')
+def search_games():
+
+    q = request.args.get('q', '')
+    if not q.strip():
+        abort(400, 'missing search query "q"')
+
+    try:
+        page = max(1, int(request.args.get('page', 1)))
+        per_page = max(1, min(int(request.args.get('per_page', 20)), 100))
+    except ValueError:
+        abort(400, 'invalid page or per_page')
+
+    # fetch one extra to find out if there's another page
+    games = tools.search_games(q, g.user).options(
+            db.joinedload(Game.author), db.joinedload(Game.language)).limit(
+            per_page + 1).offset((page - 1) * per_page).all()
+
+    return jsonify({
+        'games': [
+            {
+                'id': game.id,
+                'word': game.word,
+                'public': game.public,
+                'language': game.language.name,
+                'can_delete': g.user.is_admin or game.author == g.user,
+                'author': game.author.username,
+            }
+            for game in games[:per_page]
+        ],
+        'page': page,
+        'has_more': len(games) > per_page,
+    })
+
+
+@bp.route('/games/trending', methods=('GET', ))
+@token_required
+def trending_games():
+    '''
+    games ordered by popularity, based on recent likes and plays
+    '''
+
+    try:
+        n = int(request.args.get('n', 20))
+    except ValueError:
+        abort(400, 'invalid n')
+    n = max(1, min(n, 100))
+
+    # scores are precomputed (see GameScore), so this just walks the score
+    # index from the top
+    games = Game.query.join(GameScore).filter(
+            db.or_(Game.public == True, Game.author == g.user)).options(
+            db.joinedload(Game.author), db.joinedload(Game.language)).order_by(
+            GameScore.score.desc()).limit(n).all()
+
+    return jsonify({
+        'games': [
+            {
+                'id': game.id,
+                'word': game.word,
+                'public': game.public,
+                'language': game.language.name,
+                'can_delete': g.user.is_admin or game.author == g.user,
+                'author': game.author.username,
+            }
+            for game in games
+        ],
+    })
+
+
 @bp.route('/games/<id_>', methods=('GET', ))
 @token_required
 def get_game(id_):
 
     game = Game.query.filter_by(id=id_).filter(
-            db.or_(Game.public == True, Game.author == g.user)).first_or_404()
+            db.or_(Game.public == True, Game.author == g.user))
+
+    if g.user.is_admin:
+        # load the flags along with who made them up front
+        game = game.options(db.selectinload(Game.flags).joinedload(Flag.user))
+
+    game = game.first_or_404()
+
+    # the details (including the order of the pieces) only differ by game
+    # version, what the user is allowed to see, and (for admins) the flags, so
+    # the built response can be cached on that
+    key = ('game', game.id, game.version, g.user.is_admin, g.user == game.author)
+    if g.user.is_admin:
+        # flags don't bump the version, so they don't invalidate the copies
+        # cached for everyone else
+        key += (game.n_flags, game.last_flagged)
+
+    cached = compress.cached_response(key)
+    if cached is not None:
+        return cached
+
+    return jsonify(get_game_details(game, game.get_segments()))
 
+
+def get_game_details(game: Game, pieces: list) -> dict:
+    '''
+    the full details of a game as shown to g.user
+    '''
     data = {
         'id': game.id,
         'author': game.author.username,
@@ -257,12 +387,17 @@ def get_game(id_):
             } for image in game.images
         ],
         'can_delete': False,
-        'pieces': game.get_segments(),
-        # 'audios': [
-        #     {
-        #         }
-        #     for audio in self.audios
-        # ],
+        'pieces': pieces,
+        'audios': [
+            {
+                'id': audio.id,
+                # versioned url, so clients can cache it forever
+                'url': url_for('api.get_audio', id_=audio.id, v=audio.etag[:12]),
+                'mimetype': audio.mimetype,
+                'duration': audio.duration,
+            }
+            for audio in game.audios
+        ],
     }
 
     if g.user.is_admin:
@@ -271,12 +406,66 @@ def get_game(id_):
             'text': flag.text,
             'user': flag.user.username,
             'date': flag.date,
+            'resolved': flag.resolved,
         } for flag in game.flags]
 
     if g.user == game.author:
         data['can_delete'] = True
 
-    return jsonify(data)
+    return data
+
+
+@bp.route('/games/batch', methods=('POST', ))
+@token_required
+@rate_limit('60/minute', key='user')
+def get_games_batch():
+    '''
+    the full details of several games at once, as from /games/<id_>
+    '''
+
+    data = request.json
+    if data is None:
+        abort(400, 'invalid json data')
+
+    # json data shape example
+    # {
+    #   "ids": [1, 5, "7"]
+    # }
+
+    ids = data.get('ids', None)
+    if not isinstance(ids, list) or not ids:
+        abort(400, 'invalid or missing ids list')
+
+    if len(ids) > 50:
+        abort(400, 'too many ids (max 50)')
+
+    try:
+        ids = [int(id_) for id_ in ids]
+    except (TypeError, ValueError):
+        abort(400, 'invalid game id')
+
+    # a fixed number of queries however many games: the games with authors and
+    # languages, then all their images, audios (and flags) in one go each
+    games = Game.query.filter(Game.id.in_(ids)).filter(
+            db.or_(Game.public == True, Game.author == g.user)).options(
+            db.joinedload(Game.author), db.joinedload(Game.language),
+            db.selectinload(Game.images), db.selectinload(Game.audios))
+
+    if g.user.is_admin:
+        games = games.options(db.selectinload(Game.flags).joinedload(Flag.user))
+
+    games = {game.id: game for game in games}
+
+    # in the order asked for, skipping any not found
+    games = [games[id_] for id_ in dict.fromkeys(ids) if id_ in games]
+    pieces = Game.get_segments_many(games)
+
+    return jsonify({
+        'games': [
+            get_game_details(game, game_pieces)
+            for game, game_pieces in zip(games, pieces)
+        ],
+    })
 
 
 @bp.route('/play', methods=('POST', ))
@@ -289,7 +478,8 @@ def log_play():
 
     # json data shape example
     # {
-    #   "id": "boring"
+    #   "id": "boring",
+    #   "result": "pass" // optional, "pass" or "fail"
     # }
 
     # retrieve and validate data
@@ -298,6 +488,10 @@ def log_play():
     if not isinstance(game_id, str) or not game_id:
         abort(400, 'invalid game id')
 
+    result = data.get('result', None)
+    if result not in (None, 'pass', 'fail'):
+        abort(400, 'invalid result (must be "pass" or "fail")')
+
     # TODO: or user is admin
     game = Game.query.filter_by(id=game_id).filter(
             db.or_(Game.public == True, Game.author == g.user)).one_or_none()
@@ -307,14 +501,63 @@ def log_play():
 
     card = get_card(g.user, game)
 
-
     card.add_play()
+    if result is not None:
+        card.review(result == 'pass')
     db.session.add(card)
+    GameScore.add(game.id, GameScore.PLAY_WEIGHT)
     db.session.commit()
 
     return jsonify({'msg': 'success'})
 
 
+@bp.route('/review', methods=('GET', ))
+@token_required
+def review_queue():
+    '''
+    the next games due for review by this user, soonest due first
+    '''
+
+    try:
+        n = int(request.args.get('n', 20))
+    except ValueError:
+        abort(400, 'invalid n')
+    n = max(1, min(n, 100))
+
+    # walks the (user_id, due) index, and pulls in each game with its images,
+    # author and language in the same query
+    cards = Card.query.join(Card.game).filter(
+            Card.user_id == g.user.id,
+            Card.due <= datetime.utcnow(),
+            db.or_(Game.public == True, Game.author == g.user)).options(
+            db.contains_eager(Card.game).joinedload(Game.images),
+            db.contains_eager(Card.game).joinedload(Game.author),
+            db.contains_eager(Card.game).joinedload(Game.language)).order_by(
+            Card.due).limit(n).all()
+
+    return jsonify({
+        'games': [
+            {
+                'id': card.game.id,
+                'word': card.game.word,
+                'public': card.game.public,
+                'language': card.game.language.name,
+                'author': card.game.author.username,
+                'images': [
+                    {
+                        'id': image.id,
+                        'data': image.get_data_uri(),
+                    } for image in card.game.images
+                ],
+                'pieces': card.game.get_segments(),
+                'due': timegm(card.due.utctimetuple()),
+                'interval': card.interval,
+                'n_plays': card.n_plays,
+            }
+            for card in cards
+        ],
+    })
+
 
 @bp.route('/games/<id_>', methods=('DELETE', ))
 @token_required
@@ -325,8 +568,212 @@ def delete_game(id_):
             db.or_(Game.public == True, Game.author == g.user)).first_or_404()
 
     if g.user.is_admin or game.author == g.user:
+        audio_files = [audio.filename for audio in game.audios]
         db.session.delete(game)
+        if audio_files:
+            enqueue('remove_audio_files', {'filenames': audio_files})
         db.session.commit()
         return jsonify({'msg': 'successfully deleted'})
     else:
         abort(401, 'you are not allowed to delete this game')
+
+
+@bp.route('/games/<id_>/like', methods=('POST', ))
+@token_required
+def like_game(id_):
+
+    game = Game.query.filter_by(id=id_).filter(
+            db.or_(Game.public == True, Game.author == g.user)).first_or_404()
+
+    # a single upsert, so two likes at once can't both count (or fail on the
+    # unique constraint)
+    now = datetime.utcnow()
+    inserted = db.session.execute(db.text(
+        'INSERT INTO likes (user_id, game_id, date) VALUES (:user_id, :game_id, :date) '
+        'ON CONFLICT (user_id, game_id) DO NOTHING'),
+        {'user_id': g.user.id, 'game_id': game.id, 'date': now}).rowcount
+    if not inserted:
+        db.session.rollback()
+        return jsonify({'msg': 'already liked'})
+
+    GameScore.add(game.id, GameScore.LIKE_WEIGHT, now)
+    db.session.commit()
+
+    return jsonify({'msg': 'success'})
+
+
+@bp.route('/games/<id_>/like', methods=('DELETE', ))
+@token_required
+def unlike_game(id_):
+
+    game = Game.query.filter_by(id=id_).filter(
+            db.or_(Game.public == True, Game.author == g.user)).first_or_404()
+
+    like = Like.query.filter_by(game=game, user=g.user).one_or_none()
+    if like is None:
+        return jsonify({'msg': 'not liked'})
+
+    # take away exactly what this like added when it was made
+    GameScore.add(game.id, -GameScore.LIKE_WEIGHT, like.date)
+    db.session.delete(like)
+    db.session.commit()
+
+    return jsonify({'msg': 'success'})
+
+
+@bp.route('/games/<id_>/flag', methods=('POST', ))
+@token_required
+@rate_limit('20/hour', key='user')
+def flag_game(id_):
+
+    game = Game.query.filter_by(id=id_).filter(
+            db.or_(Game.public == True, Game.author == g.user)).first_or_404()
+
+    data = request.json or {}
+
+    text = data.get('text', '')
+    if not isinstance(text, str):
+        abort(400, 'invalid text')
+    if len(text) > 512:
+        abort(400, 'text too long (max 512 characters)')
+
+    # one open report per user per game, so one user can't push a game up the
+    # moderation queue
+    if Flag.query.filter_by(game=game, user=g.user, resolved=False).first() is not None:
+        return jsonify({'msg': 'already flagged'})
+
+    flag = Flag(g.user, game)
+    flag.text = text
+    flag.date = datetime.utcnow()
+    db.session.add(flag)
+
+    # update the counts in sql so concurrent flags don't overwrite each other
+    Game.query.filter_by(id=game.id).update({
+        Game.n_flags: Game.n_flags + 1,
+        Game.last_flagged: flag.date,
+    }, synchronize_session=False)
+
+    db.session.commit()
+
+    return jsonify({'msg': 'success'})
+
+
+@bp.route('/admin/flags', methods=('GET', ))
+@token_required
+@admin_required
+def moderation_queue():
+    '''
+    flagged games, most flagged first, then most recently flagged
+    '''
+
+    try:
+        page = max(1, int(request.args.get('page', 1)))
+        per_page = max(1, min(int(request.args.get('per_page', 20)), 100))
+    except ValueError:
+        abort(400, 'invalid page or per_page')
+
+    # fetch one extra to find out if there's another page
+    games = Game.query.filter(Game.n_flags > 0).options(
+            db.joinedload(Game.author), db.joinedload(Game.language)).order_by(
+            Game.n_flags.desc(), Game.last_flagged.desc()).limit(
+            per_page + 1).offset((page - 1) * per_page).all()
+
+    return jsonify({
+        'games': [
+            {
+                'id': game.id,
+                'word': game.word,
+                'public': game.public,
+                'language': game.language.name,
+                'author': game.author.username,
+                'n_flags': game.n_flags,
+                'last_flagged': timegm(game.last_flagged.utctimetuple()),
+            }
+            for game in games[:per_page]
+        ],
+        'page': page,
+        'has_more': len(games) > per_page,
+    })
+
+
+@bp.route('/admin/games/<id_>/resolve', methods=('POST', ))
+@token_required
+@admin_required
+def resolve_flags(id_):
+    '''
+    mark all open flags on a game as dealt with, taking it off the queue
+    '''
+
+    game = Game.query.filter_by(id=id_).first_or_404()
+
+    Flag.query.filter_by(game_id=game.id, resolved=False).update(
+            {Flag.resolved: True}, synchronize_session=False)
+    game.n_flags = 0
+
+    db.session.commit()
+
+    return jsonify({'msg': 'success'})
+
+
+@bp.route('/games/<id_>/audio', methods=('PUT', ))
+@token_required
+@rate_limit('20/minute', key='user')
+def upload_audio(id_):
+    '''
+    set the audio for a game, with the raw audio file as the request body
+    '''
+
+    game = Game.query.filter_by(id=id_).filter(
+            db.or_(Game.public == True, Game.author == g.user)).first_or_404()
+
+    if game.author != g.user:
+        abort(401, 'you are not allowed to edit this game')
+
+    if (request.content_length or 0) > current_app.config['MAX_AUDIO_BYTES']:
+        abort(400, 'audio too large (max {} bytes)'.format(current_app.config['MAX_AUDIO_BYTES']))
+
+    try:
+        audio = save_audio(request.get_data(cache=False))
+    except AudioError as e:
+        abort(400, str(e))
+
+    # only one clip per game for now, replacing any previous one
+    old_files = []
+    for old in game.audios:
+        old_files.append(old.filename)
+        db.session.delete(old)
+    game.audios.append(audio)
+    game.bump_version()
+    enqueue_transcode(audio)
+    if old_files:
+        enqueue('remove_audio_files', {'filenames': old_files})
+    db.session.commit()
+
+    return jsonify({
+        'msg': 'success',
+        'id': audio.id,
+    })
+
+
+@bp.route('/audio/<id_>', methods=('GET', ))
+@token_required
+def get_audio(id_):
+    '''
+    stream an audio clip, with support for range requests and etags
+    '''
+
+    audio = Audio.query.filter_by(id=id_).join(Game).filter(
+            db.or_(Game.public == True, Game.author == g.user)).first_or_404()
+
+    try:
+        rv = send_file(get_audio_path(audio.filename), mimetype=audio.mimetype,
+                       conditional=True)
+    except FileNotFoundError:
+        abort(404, 'audio file missing')
+
+    # the file for an id only changes when it's transcoded, which changes the
+    # etag and so the `v` query param in the urls given out by get_game
+    rv.cache_control.public = False
+    rv.cache_control.private = True
+    rv.cache_control.max_age = current_app.config['AUDIO_CACHE_SECONDS']
+    return rv
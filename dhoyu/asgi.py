@@ -0,0 +1,208 @@
+'''
+asgi entrypoint, for serving lots of slow clients from one process
+
+    uvicorn dhoyu.asgi:app
+
+This serves exactly the same flask app (routes, JWT auth, error format) as
+dhoyu.wsgi, through BufferedWSGIApp below. Reading the request body and writing
+the response happen on the event loop, so a slow mobile connection only costs
+a socket and some memory while it uploads or downloads. A thread from the pool
+is only needed while the handler itself runs (database queries, password
+hashing, PMI segmentation), which is usually a few milliseconds.
+
+If MAX_IN_FLIGHT is set, requests beyond that many waiting for or running on
+the thread pool are answered straight away with a 503, instead of queueing.
+This is checked before the request body is received, so a shed upload isn't
+read at all.
+'''
+
+import asyncio
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from . import create_app, preload
+
+
+# returned by read_body when the client goes away before sending the whole body
+DISCONNECTED = object()
+
+
+class BufferedWSGIApp(object):
+    '''
+    ASGI app that runs a WSGI app in a thread pool
+
+    The whole request body is received before the WSGI app is called, and the
+    whole response is collected before any of it is sent, so the WSGI app never
+    waits on the client.
+
+    At most `max_in_flight` requests are queued for or running in the thread
+    pool, the rest get a 503.
+    '''
+
+    def __init__(self, wsgi_app, threads: int = 8, max_body: int = None,
+                 max_in_flight: int = None) -> None:
+        self.wsgi_app = wsgi_app
+        self.executor = ThreadPoolExecutor(max_workers=threads)
+        self.max_body = max_body
+        self.max_in_flight = max_in_flight
+        # only touched from the event loop, so needs no lock
+        self.in_flight = 0
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+
+        if scope['type'] != 'http':
+            raise ValueError('unsupported scope type {!r}'.format(scope['type']))
+
+        # shed before receiving the body, so a rejected upload costs nothing
+        if self.overloaded():
+            await self.send_overloaded(send)
+            return
+
+        body = await self.read_body(receive)
+        if body is DISCONNECTED:
+            # nobody to answer, and a partial body mustn't reach the app
+            return
+        if body is None:
+            await self.send_response(send, '413 REQUEST ENTITY TOO LARGE',
+                                     [('Content-Type', 'application/json')],
+                                     b'{"msg": "request body too large"}')
+            return
+
+        # the pool may have filled up while the body was uploading
+        if self.overloaded():
+            await self.send_overloaded(send)
+            return
+
+        environ = self.build_environ(scope, body)
+        loop = asyncio.get_event_loop()
+        self.in_flight += 1
+        try:
+            status, headers, content = await loop.run_in_executor(
+                    self.executor, self.run_wsgi, environ)
+        finally:
+            self.in_flight -= 1
+
+        await self.send_response(send, status, headers, content)
+
+    def overloaded(self) -> bool:
+        return bool(self.max_in_flight) and self.in_flight >= self.max_in_flight
+
+    async def send_overloaded(self, send) -> None:
+        await self.send_response(send, '503 SERVICE UNAVAILABLE',
+                                 [('Content-Type', 'application/json'), ('Retry-After', '1')],
+                                 b'{"msg": "server busy, try again shortly"}')
+
+    async def lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=True)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def read_body(self, receive):
+        '''
+        returns the request body, None if it's larger than max_body, or
+        DISCONNECTED if the client disconnected first
+        '''
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return DISCONNECTED
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if self.max_body is not None and size > self.max_body:
+                return None
+            chunks.append(chunk)
+            if not message.get('more_body', False):
+                break
+        return b''.join(chunks)
+
+    @staticmethod
+    def build_environ(scope, body: bytes) -> dict:
+        # PEP 3333 wants paths as latin-1 decoded bytes
+        path = scope['path'].encode('utf-8').decode('latin-1')
+        server = scope.get('server') or ('localhost', 80)
+        client = scope.get('client') or ('', 0)
+
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+            'PATH_INFO': path,
+            'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+            'SERVER_NAME': server[0],
+            'SERVER_PORT': str(server[1]),
+            'SERVER_PROTOCOL': 'HTTP/{}'.format(scope.get('http_version', '1.1')),
+            'REMOTE_ADDR': client[0],
+            'REMOTE_PORT': str(client[1]),
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+
+        for name, value in scope.get('headers', []):
+            name = name.decode('latin-1').upper().replace('-', '_')
+            value = value.decode('latin-1')
+            if name == 'CONTENT_TYPE':
+                environ['CONTENT_TYPE'] = value
+                continue
+            if name == 'CONTENT_LENGTH':
+                # we already know the real length
+                continue
+            key = 'HTTP_' + name
+            environ[key] = environ[key] + ',' + value if key in environ else value
+
+        return environ
+
+    def run_wsgi(self, environ: dict) -> tuple:
+        '''
+        call the WSGI app, returning (status, headers, body)
+        '''
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response['status'] = status
+            response['headers'] = headers
+
+        result = self.wsgi_app(environ, start_response)
+        try:
+            content = b''.join(result)
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+
+        return response['status'], response['headers'], content
+
+    @staticmethod
+    async def send_response(send, status: str, headers: list, content: bytes) -> None:
+        await send({
+            'type': 'http.response.start',
+            'status': int(status.split(' ', 1)[0]),
+            'headers': [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                        for name, value in headers],
+        })
+        await send({
+            'type': 'http.response.body',
+            'body': content,
+        })
+
+
+flask_app = create_app()
+preload(flask_app)
+
+app = BufferedWSGIApp(flask_app, threads=flask_app.config['ASGI_THREADS'],
+                      max_body=flask_app.config['MAX_CONTENT_LENGTH'],
+                      max_in_flight=flask_app.config['MAX_IN_FLIGHT'])
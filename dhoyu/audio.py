@@ -0,0 +1,186 @@
+'''
+storage for game audio clips
+
+Clips are stored as plain files in the AUDIO_DIR config directory (not in the
+database), named by the sha1 of their contents. Only formats whose duration can
+be read without extra dependencies are accepted: PCM WAV, and Ogg Vorbis/Opus.
+'''
+
+import hashlib
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+import wave
+
+from flask import current_app
+
+from . import db
+from .jobs import enqueue, job
+from .models import Audio
+
+
+class AudioError(ValueError):
+    '''
+    raised for audio data that is invalid or rejected
+    '''
+
+
+def probe(data: bytes) -> tuple:
+    '''
+    returns (mimetype, codec, duration in seconds) for a clip
+    raises AudioError if the format isn't supported
+    '''
+    if data[:4] == b'RIFF' and data[8:12] == b'WAVE':
+        try:
+            with wave.open(io.BytesIO(data)) as w:
+                return 'audio/wav', 'pcm', w.getnframes() / w.getframerate()
+        except (wave.Error, EOFError, ZeroDivisionError):
+            raise AudioError('invalid or unsupported wav audio')
+
+    if data[:4] == b'OggS':
+        return probe_ogg(data)
+
+    raise AudioError('unsupported audio format (must be wav or ogg)')
+
+
+def probe_ogg(data: bytes) -> tuple:
+    # the first page holds only the codec identification header
+    n_segments = data[26] if len(data) > 26 else 0
+    header = data[27 + n_segments:27 + n_segments + 19]
+
+    if header.startswith(b'OpusHead') and len(header) >= 12:
+        # opus granule positions are always at 48kHz, less the pre-skip
+        codec = 'opus'
+        rate = 48000
+        pre_skip = int.from_bytes(header[10:12], 'little')
+    elif header.startswith(b'\x01vorbis') and len(header) >= 16:
+        codec = 'vorbis'
+        rate = int.from_bytes(header[12:16], 'little')
+        pre_skip = 0
+    else:
+        raise AudioError('unsupported ogg audio (must be vorbis or opus)')
+
+    # the granule position of the last page is the total number of samples
+    last = data.rfind(b'OggS')
+    granule = int.from_bytes(data[last + 6:last + 14], 'little', signed=True)
+    if rate <= 0 or granule < 0:
+        raise AudioError('invalid ogg audio')
+
+    return 'audio/ogg', codec, max(0, granule - pre_skip) / rate
+
+
+def get_path(filename: str) -> str:
+    return os.path.join(current_app.config['AUDIO_DIR'], filename)
+
+
+def write_file(data: bytes, ext: str) -> tuple:
+    '''
+    saves data to the audio dir, returns (filename, etag)
+    '''
+    etag = hashlib.sha1(data).hexdigest()
+    filename = '{}.{}'.format(etag, ext)
+    path = get_path(filename)
+
+    # content addressed, so if it exists it's already the same data
+    if not os.path.exists(path):
+        os.makedirs(current_app.config['AUDIO_DIR'], exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=current_app.config['AUDIO_DIR'])
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp makes files only readable by us, but the web server (or a
+        # worker or backup running as someone else) may need to read it
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+
+    return filename, etag
+
+
+def save_audio(data: bytes) -> Audio:
+    '''
+    validates and stores a clip, returning a new (unsaved) Audio for it
+    raises AudioError if the clip is rejected
+    '''
+    if len(data) > current_app.config['MAX_AUDIO_BYTES']:
+        raise AudioError('audio too large (max {} bytes)'.format(current_app.config['MAX_AUDIO_BYTES']))
+
+    mimetype, codec, duration = probe(data)
+
+    if duration > current_app.config['MAX_AUDIO_SECONDS']:
+        raise AudioError('audio too long (max {} seconds)'.format(current_app.config['MAX_AUDIO_SECONDS']))
+
+    ext = 'wav' if mimetype == 'audio/wav' else 'ogg'
+    filename, etag = write_file(data, ext)
+
+    audio = Audio(filename, mimetype, len(data), duration, etag)
+    # opus is the format we transcode to, so there's nothing more to do
+    audio.transcoded = codec == 'opus'
+    return audio
+
+
+@job('remove_audio_files')
+def remove_unused_files(filenames) -> None:
+    '''
+    deletes audio files that are no longer referenced by any Audio
+    '''
+    for filename in set(filenames):
+        if Audio.query.filter_by(filename=filename).first() is None:
+            try:
+                os.remove(get_path(filename))
+            except FileNotFoundError:
+                pass
+
+
+def transcode(audio: Audio) -> bool:
+    '''
+    re-encode a clip as mono Ogg Opus, which is much smaller than wav and
+    plays on both android and ios. Needs `ffmpeg` on the PATH.
+    returns True if the clip was transcoded
+    '''
+    ffmpeg = shutil.which('ffmpeg')
+    if audio.transcoded or ffmpeg is None:
+        return False
+
+    with tempfile.NamedTemporaryFile(suffix='.ogg') as out:
+        subprocess.run([
+            ffmpeg, '-y', '-loglevel', 'error', '-i', get_path(audio.filename),
+            '-ac', '1', '-c:a', 'libopus', '-b:a', current_app.config['AUDIO_BITRATE'],
+            out.name,
+        ], check=True, timeout=60)
+        data = out.read()
+
+    _, _, duration = probe(data)
+    old_filename = audio.filename
+
+    audio.filename, audio.etag = write_file(data, 'ogg')
+    audio.mimetype = 'audio/ogg'
+    audio.size = len(data)
+    audio.duration = duration
+    audio.transcoded = True
+    audio.game.bump_version()
+    db.session.commit()
+
+    remove_unused_files([old_filename])
+    return True
+
+
+@job('transcode_audio')
+def transcode_job(audio_id: int) -> None:
+    audio = Audio.query.get(audio_id)
+    # the game may have been deleted since
+    if audio is not None:
+        transcode(audio)
+
+
+def enqueue_transcode(audio: Audio) -> None:
+    '''
+    queue a background job to transcode a newly added clip, if it needs it
+    '''
+    if not audio.transcoded:
+        # need the id for the job
+        db.session.flush()
+        # with the etag too, so a reused id (in tables made before ids were
+        # autoincrement) with a different clip still gets its own job
+        enqueue('transcode_audio', {'audio_id': audio.id},
+                key='transcode_audio:{}:{}'.format(audio.id, audio.etag))
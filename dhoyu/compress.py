@@ -0,0 +1,146 @@
+'''
+response compression
+
+Responses are compressed with brotli (if the `brotli` package is installed) or
+gzip, depending on the client's Accept-Encoding. Small responses, and media
+which is already compressed, are sent as is.
+
+Views with stable payloads can also cache the compressed bytes, so a hot
+response is only built and compressed once per version of its content:
+
+    key = ('game', game.id, game.version, ...)
+    cached = compress.cached_response(key)
+    if cached is not None:
+        return cached
+    ... build the response as usual ...
+
+Every distinct piece of content in the payload must be part of the key.
+'''
+
+import gzip
+import threading
+from collections import OrderedDict
+
+from flask import current_app, g, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def get_encodings() -> list:
+    if brotli is not None:
+        return ['br', 'gzip']
+    return ['gzip']
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    level = current_app.config['COMPRESS_LEVEL']
+    if encoding == 'br':
+        # brotli quality goes up to 11, gzip level to 9
+        return brotli.compress(data, quality=min(11, level + 2))
+    return gzip.compress(data, compresslevel=level)
+
+
+def choose_encoding() -> str:
+    '''
+    the best encoding the client accepts, or 'identity'
+    '''
+    return request.accept_encodings.best_match(get_encodings()) or 'identity'
+
+
+def should_compress(response) -> bool:
+    if response.direct_passthrough or response.is_streamed:
+        # files (eg. audio) sent with send_file
+        return False
+    if not 200 <= response.status_code < 300 or response.status_code in (204, 206):
+        return False
+    if 'Content-Encoding' in response.headers:
+        return False
+    mimetype = response.mimetype or ''
+    if mimetype.startswith(tuple(current_app.config['COMPRESS_SKIP_MIMETYPES'])):
+        return False
+    return True
+
+
+class ResponseCache(object):
+    '''
+    thread safe LRU cache of response bodies, limited by total size in bytes
+    '''
+
+    def __init__(self) -> None:
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry, max_size: int) -> None:
+        body = entry[0]
+        if len(body) > max_size:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.size -= len(self.entries.pop(key)[0])
+            self.entries[key] = entry
+            self.size += len(body)
+            while self.size > max_size:
+                _, old_entry = self.entries.popitem(last=False)
+                self.size -= len(old_entry[0])
+
+
+cache = ResponseCache()
+
+
+def cached_response(key):
+    '''
+    returns the cached response for `key` in the client's preferred encoding,
+    or None. On a miss, the response returned by the view is cached under `key`.
+    '''
+    encoding = choose_encoding()
+    entry = cache.get((key, encoding))
+
+    if entry is None:
+        g.compress_cache_key = key
+        return None
+
+    body, mimetype, content_encoding = entry
+    response = current_app.response_class(body, mimetype=mimetype)
+    if content_encoding != 'identity':
+        response.headers['Content-Encoding'] = content_encoding
+    response.vary.add('Accept-Encoding')
+    g.compress_cache_hit = True
+    return response
+
+
+def after_request(response):
+    if getattr(g, 'compress_cache_hit', False) or not should_compress(response):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    data = response.get_data()
+    encoding = choose_encoding()
+    content_encoding = 'identity'
+
+    if encoding != 'identity' and len(data) >= current_app.config['COMPRESS_MIN_SIZE']:
+        data = compress(data, encoding)
+        response.set_data(data)
+        response.headers['Content-Encoding'] = encoding
+        content_encoding = encoding
+
+    key = getattr(g, 'compress_cache_key', None)
+    if key is not None:
+        cache.set((key, encoding), (data, response.mimetype, content_encoding),
+                  current_app.config['COMPRESS_CACHE_BYTES'])
+
+    return response
+
+
+def init_app(app) -> None:
+    app.after_request(after_request)
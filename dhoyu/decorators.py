@@ -2,10 +2,10 @@
 from functools import wraps
 import re
 
-from flask import g, request, abort
+from flask import current_app, g, request, abort
 import jwt
 
-from . import db, app
+from . import db
 from .models import User
 
 TOKEN_RE = re.compile(r'^Bearer ([^\s]+)$')
@@ -31,7 +31,7 @@ def token_required(f):
             abort(401, 'JWT is required and was not found')
 
         try:
-            decoded = jwt.decode(token, app.config['SECRET_KEY'], algorithms='HS256')
+            decoded = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms='HS256')
         except Exception as e:
             return abort(401, 'invalid JWT {}'.format(str(e)))
 
@@ -54,3 +54,17 @@ def token_required(f):
         # if reached here, then g.user must be a valid User object
         return f(*args, **kwargs)
     return decorated
+
+
+def admin_required(f):
+    '''
+    wraps a route handler function, after token_required
+
+    aborts unless g.user is an admin
+    '''
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        if not g.user.is_admin:
+            abort(401, 'only admins are allowed to do this')
+        return f(*args, **kwargs)
+    return decorated
@@ -2,11 +2,9 @@
 
 import sqlite3
 import os
-from flask import (Blueprint, abort, Response, jsonify)
+from flask import (Blueprint, abort, current_app, Response, jsonify)
 from werkzeug.exceptions import HTTPException
 
-from . import app
-
 bp = Blueprint('demo', __name__, url_prefix='/demo')
 
 @bp.app_errorhandler(HTTPException)
@@ -24,7 +22,7 @@ def get_db_dump():
     Only works if the default database is used
     '''
 
-    db_path = os.path.join(app.instance_path, 'db.sqlite3')
+    db_path = os.path.join(current_app.instance_path, 'db.sqlite3')
     conn = sqlite3.connect(db_path)
     dump = '\n'.join(line for line in conn.iterdump())
 
@@ -0,0 +1,216 @@
+'''
+bulk import of games from a manifest file
+
+A manifest is either a JSON lines file (`.jsonl`), with one object per line:
+
+    {"word": "epul", "language": "rop", "author": "username1", "images": ["img/epul.jpg"], "public": true}
+
+or a CSV file (`.csv`) with a header row, where multiple images are separated
+by `;`:
+
+    word,language,author,images,public
+    epul,rop,username1,img/epul.jpg;img/epul2.jpg,true
+
+Image paths are relative to the directory containing the manifest.
+'''
+
+import base64
+import csv
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import db
+from .models import Game, Image, ImportProgress, Language, User
+
+
+class ManifestError(Exception):
+    '''
+    raised for an invalid manifest row; `line` is the 1-based row number
+    '''
+    def __init__(self, line: int, msg: str) -> None:
+        super().__init__('row {}: {}'.format(line, msg))
+        self.line = line
+
+
+TRUE_STRINGS = ('1', 'true', 'yes', 'y')
+
+
+def read_manifest(path: str):
+    '''
+    yields a dict for each game row in the manifest
+    '''
+    if path.endswith('.csv'):
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                images = row.get('images') or ''
+                row['images'] = [i.strip() for i in images.split(';') if i.strip()]
+                row['public'] = (row.get('public') or '').strip().lower() in TRUE_STRINGS
+                yield row
+    else:
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    # keep row numbers lined up with the file
+                    yield None
+                    continue
+                yield json.loads(line)
+
+
+def load_image(path: str) -> str:
+    '''
+    read an image file and return the base64 encoded data as stored in the db
+    '''
+    with open(path, 'rb') as f:
+        return base64.b64encode(f.read()).decode('ascii')
+
+
+def parse_public(n: int, value) -> bool:
+    if value is None or isinstance(value, bool):
+        return bool(value)
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_STRINGS
+    raise ManifestError(n, '"public" must be true or false')
+
+
+class GameImporter(object):
+    '''
+    imports games from a manifest in batches
+
+    Each batch is inserted in a single transaction, along with the number of
+    manifest rows done (in the `import_progress` table), so an import that fails
+    partway can be rerun and will continue from exactly the last committed
+    batch.
+    '''
+
+    def __init__(self, manifest_path: str, batch_size: int = 500, workers: int = 8) -> None:
+        self.manifest_path = os.path.abspath(manifest_path)
+        self.base_dir = os.path.dirname(self.manifest_path)
+        self.batch_size = batch_size
+        self.workers = workers
+
+        # caches so each batch doesn't look these up per row
+        self.users = {}
+        self.languages = {}
+
+        self.imported = 0
+
+    def get_user(self, username: str) -> User:
+        if username not in self.users:
+            self.users[username] = User.query.filter_by(username=username).first()
+        return self.users[username]
+
+    def get_language(self, code: str) -> Language:
+        if code not in self.languages:
+            self.languages[code] = Language.query.filter_by(code=code).first()
+        return self.languages[code]
+
+    def validate(self, n: int, row) -> dict:
+        '''
+        checks a manifest row, using the same rules as POST /api/games
+        '''
+        if not isinstance(row, dict):
+            raise ManifestError(n, 'invalid row')
+
+        word = row.get('word')
+        if not isinstance(word, str) or not word.strip():
+            raise ManifestError(n, '"word" empty or missing')
+
+        images = row.get('images')
+        if not isinstance(images, list) or not images:
+            raise ManifestError(n, 'at least one image must be supplied')
+        if len(images) > 4:
+            raise ManifestError(n, 'too many images (max 4)')
+
+        author = self.get_user(str(row.get('author', '')).lower().strip())
+        if author is None:
+            raise ManifestError(n, 'unknown author {!r}'.format(row.get('author')))
+
+        language = self.get_language(str(row.get('language', '')))
+        if language is None:
+            raise ManifestError(n, 'unknown language {!r}'.format(row.get('language')))
+
+        return {
+            'word': word.strip(),
+            'author': author,
+            'language': language,
+            'public': parse_public(n, row.get('public')),
+            'images': [os.path.join(self.base_dir, image) for image in images],
+        }
+
+    def load_images(self, rows: list, pool: ThreadPoolExecutor) -> list:
+        '''
+        reads and encodes the images for all rows in parallel
+        returns a list of lists of image data, one list per row
+        '''
+        paths = [path for row in rows for path in row['images']]
+        data = iter(pool.map(load_image, paths))
+        return [[next(data) for _ in row['images']] for row in rows]
+
+    def read_progress(self) -> int:
+        progress = ImportProgress.query.get(self.manifest_path)
+        return progress.rows_done if progress is not None else 0
+
+    def insert_batch(self, rows: list, images: list, n: int) -> None:
+        '''
+        insert a batch of games and record that rows up to `n` are done, in one
+        transaction
+        '''
+        games = []
+        for row, row_images in zip(rows, images):
+            game = Game(row['word'], row['author'], row['language'], row['public'])
+            for image_data in row_images:
+                game.images.append(Image(image_data))
+            games.append(game)
+
+        db.session.add_all(games)
+        db.session.merge(ImportProgress(self.manifest_path, n))
+        db.session.commit()
+
+    def flush(self, batch: list, n: int, pool: ThreadPoolExecutor) -> None:
+        '''
+        insert a batch of validated rows, then record that rows up to `n` are done
+        '''
+        images = self.load_images(batch, pool)
+        self.insert_batch(batch, images, n)
+        self.imported += len(batch)
+
+    def run(self, restart: bool = False, report=print) -> int:
+        '''
+        run the import, returns the number of games imported by this run
+        '''
+        done = 0 if restart else self.read_progress()
+        if done:
+            report('resuming after row {}'.format(done))
+
+        self.imported = 0
+        start = time.perf_counter()
+
+        batch = []
+        n = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            try:
+                for n, row in enumerate(read_manifest(self.manifest_path), start=1):
+                    if n <= done or row is None:
+                        continue
+                    batch.append(self.validate(n, row))
+                    if len(batch) >= self.batch_size:
+                        self.flush(batch, n, pool)
+                        batch = []
+                        elapsed = time.perf_counter() - start
+                        report('{} rows done, {} games imported ({:.0f} games/s)'.format(
+                            n, self.imported, self.imported / elapsed))
+
+                if batch:
+                    self.flush(batch, n, pool)
+            except Exception:
+                db.session.rollback()
+                raise
+
+        # finished cleanly, so the next run starts from scratch
+        ImportProgress.query.filter_by(manifest=self.manifest_path).delete()
+        db.session.commit()
+
+        return self.imported
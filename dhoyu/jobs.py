@@ -0,0 +1,208 @@
+'''
+a small persistent background job queue, stored in the `jobs` table
+
+Request handlers enqueue jobs in the same transaction as their own changes, so
+a job exists if and only if the request's write was committed. `flask worker`
+runs them on a thread pool, retrying failures with exponential backoff. Workers
+check for jobs left running by a worker that died (or hung) for longer than
+JOB_TIMEOUT once per poll interval, and queue them again (or fail them, if they
+have no attempts left).
+
+Job functions are registered with the `job` decorator:
+
+    @job('remove_audio_files')
+    def remove_audio_files(filenames):
+        ...
+
+and enqueued with keyword arguments that can be encoded as json:
+
+    enqueue('remove_audio_files', {'filenames': [...]})
+'''
+
+import json
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from flask import current_app
+
+from . import db
+from .models import Job
+
+
+# registered job functions by name
+HANDLERS = {}
+
+# seconds to wait before retrying a failed job, doubled for each attempt
+RETRY_DELAY = 10
+MAX_RETRY_DELAY = 60 * 60
+
+# a running job is assumed to belong to a dead worker after this long
+JOB_TIMEOUT = timedelta(minutes=30)
+
+
+def job(name: str):
+    '''
+    decorator to register a function as a job handler
+    '''
+    def register(f):
+        HANDLERS[name] = f
+        return f
+    return register
+
+
+def enqueue(name: str, payload: dict = None, key: str = None,
+            delay: float = 0, max_attempts: int = 5) -> None:
+    '''
+    add a job to the current session, to be committed by the caller
+
+    If `key` is given and a job with that key already exists (in any state),
+    nothing is added. This makes it safe to enqueue the same work more than
+    once, eg. from retried requests.
+    '''
+    if name not in HANDLERS:
+        raise ValueError('unknown job {!r}'.format(name))
+
+    now = datetime.utcnow()
+    db.session.execute(db.text(
+        'INSERT INTO jobs (name, payload, key, status, attempts, max_attempts, run_at, created, updated) '
+        'VALUES (:name, :payload, :key, \'queued\', 0, :max_attempts, :run_at, :now, :now) '
+        'ON CONFLICT (key) DO NOTHING'), {
+            'name': name,
+            'payload': json.dumps(payload or {}),
+            'key': key,
+            'max_attempts': max_attempts,
+            'run_at': now + timedelta(seconds=delay),
+            'now': now,
+        })
+
+
+def claim_job():
+    '''
+    mark the next ready job as running and return it, or None if there are none
+    '''
+    while True:
+        now = datetime.utcnow()
+        job_id = db.session.query(Job.id).filter(
+                Job.status == 'queued', Job.run_at <= now).order_by(
+                Job.run_at).limit(1).scalar()
+        if job_id is None:
+            db.session.commit()
+            return None
+
+        # another worker may have claimed it first, in which case try again
+        claimed = Job.query.filter_by(id=job_id, status='queued').update({
+            Job.status: 'running',
+            Job.locked_at: now,
+            Job.updated: now,
+            Job.attempts: Job.attempts + 1,
+        }, synchronize_session=False)
+        db.session.commit()
+
+        if claimed:
+            return Job.query.get(job_id)
+
+
+def run_job(job: Job) -> None:
+    '''
+    run a claimed job, recording the outcome
+    '''
+    try:
+        HANDLERS[job.name](**json.loads(job.payload))
+    except Exception:
+        db.session.rollback()
+        job = Job.query.get(job.id)
+        job.last_error = traceback.format_exc()
+        if job.attempts >= job.max_attempts:
+            job.status = 'failed'
+            current_app.logger.error('job %s (%s) failed: %s', job.id, job.name, job.last_error)
+        else:
+            delay = min(RETRY_DELAY * 2 ** (job.attempts - 1), MAX_RETRY_DELAY)
+            job.status = 'queued'
+            job.run_at = datetime.utcnow() + timedelta(seconds=delay)
+    else:
+        job.status = 'done'
+        job.last_error = None
+
+    job.locked_at = None
+    job.updated = datetime.utcnow()
+    db.session.commit()
+
+
+def requeue_stale_jobs() -> int:
+    '''
+    put jobs left running by a dead worker back in the queue, or mark them
+    failed if they've used up their attempts
+    returns the number requeued
+    '''
+    now = datetime.utcnow()
+    stale = Job.query.filter(Job.status == 'running', Job.locked_at < now - JOB_TIMEOUT)
+
+    failed = stale.filter(Job.attempts >= Job.max_attempts).update({
+        Job.status: 'failed',
+        Job.locked_at: None,
+        Job.updated: now,
+        Job.last_error: 'timed out (worker died or hung)',
+    }, synchronize_session=False)
+    if failed:
+        current_app.logger.error('%s timed out jobs failed', failed)
+
+    n = stale.update({
+        Job.status: 'queued',
+        Job.locked_at: None,
+        Job.updated: now,
+    }, synchronize_session=False)
+    db.session.commit()
+    return n
+
+
+def work(app, stop: threading.Event, poll_interval: float, burst: bool) -> int:
+    '''
+    run jobs until `stop` is set (or the queue is empty, if `burst`)
+    returns the number of jobs run
+    '''
+    n = 0
+    last_requeue = time.monotonic()
+    while not stop.is_set():
+        with app.app_context():
+            if time.monotonic() - last_requeue >= poll_interval:
+                requeue_stale_jobs()
+                last_requeue = time.monotonic()
+
+            job = claim_job()
+            if job is not None:
+                run_job(job)
+                n += 1
+            db.session.remove()
+
+        if job is None:
+            if burst:
+                break
+            stop.wait(poll_interval)
+    return n
+
+
+def run_worker(threads: int = 4, poll_interval: float = 1.0, burst: bool = False) -> int:
+    '''
+    run jobs on a pool of threads until interrupted
+    returns the number of jobs run
+    '''
+    # each thread needs its own app context (and so db session)
+    app = current_app._get_current_object()
+
+    requeue_stale_jobs()
+    db.session.remove()
+
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [pool.submit(work, app, stop, poll_interval, burst) for _ in range(threads)]
+        try:
+            while not all(f.done() for f in futures):
+                time.sleep(0.2)
+        except KeyboardInterrupt:
+            # let running jobs finish
+            stop.set()
+
+    return sum(f.result() for f in futures)
@@ -1,5 +1,6 @@
 import datetime
-from random import shuffle
+import sqlite3
+from random import Random
 
 from passlib.hash import pbkdf2_sha256
 
@@ -141,22 +142,52 @@ class Image(db.Model):
 
 
 class Audio(db.Model):
+    '''
+    an audio clip for a game. The audio itself is stored as a file in the
+    AUDIO_DIR config directory (see audio.py), not in the database.
+    '''
     __tablename__ = 'game_audios'
+    __table_args__ = (
+        # never reuse the id of a deleted clip, which jobs are keyed on (see
+        # audio.enqueue_transcode)
+        {'sqlite_autoincrement': True},
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    url = db.Column(db.String(512), nullable=False)
+
+    # name of the file in the audio dir
+    filename = db.Column(db.String(128), nullable=False, index=True)
+    mimetype = db.Column(db.String(64), nullable=False)
+    size = db.Column(db.Integer, nullable=False)
+    # in seconds
+    duration = db.Column(db.Float, nullable=False)
+    # sha1 of the file contents
+    etag = db.Column(db.String(40), nullable=False)
+    # whether it's been converted to the compact format for serving
+    transcoded = db.Column(db.Boolean, default=False, nullable=False)
 
     game_id = db.Column(db.Integer, db.ForeignKey('games.id'), nullable=False)
 
-    def __init__(self, url: str):
-        self.url = url
+    def __init__(self, filename: str, mimetype: str, size: int, duration: float, etag: str) -> None:
+        self.filename = filename
+        self.mimetype = mimetype
+        self.size = size
+        self.duration = duration
+        self.etag = etag
 
     def __repr__(self):
-        return 'Image(url={!r})'.format(self.url)
+        return 'Audio(filename={!r})'.format(self.filename)
 
 
 class Game(db.Model):
     __tablename__ = 'games'
+    __table_args__ = (
+        # for the admin moderation queue, most flagged first
+        db.Index('ix_games_flag_queue', 'n_flags', 'last_flagged'),
+        # never reuse the id of a deleted game, which could still be in caches
+        # (see compress.py)
+        {'sqlite_autoincrement': True},
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     word = db.Column(db.String(128), nullable=False)
@@ -173,9 +204,23 @@ class Game(db.Model):
     # TODO: consider making this a one-to-one relationship
     audios = db.relationship('Audio', cascade='all', order_by=Audio.id, backref='game', lazy=True)
     flags = db.relationship('Flag', cascade='all', backref='game', lazy=True)
+    likes = db.relationship('Like', cascade='all', backref='game', lazy=True)
+    score = db.relationship('GameScore', cascade='all', uselist=False, backref='game', lazy=True)
 
     language_id = db.Column(db.Integer, db.ForeignKey('languages.id'), nullable=False)
 
+    # number of unresolved flags, and when the latest was made. Kept up to date
+    # when flags are made or resolved so the moderation queue doesn't need to
+    # count flags.
+    n_flags = db.Column(db.Integer, default=0, nullable=False)
+    last_flagged = db.Column(db.DateTime, nullable=True)
+
+    # bumped whenever anything shown in the game details changes, so cached
+    # copies of them can be told apart (see compress.py). Flags (only shown to
+    # admins) are the exception, as they're told apart by n_flags and
+    # last_flagged instead.
+    version = db.Column(db.Integer, default=1, nullable=False)
+
     def __init__(self, word: str, author: User, language: Language, public: bool = False):
         self.word = word
         self.author = author
@@ -189,9 +234,78 @@ class Game(db.Model):
         # use the pmi engine to segment the word
         # XXX: hardcoded to Kriol
         pieces = pmi.segment(self.word, 'rop', threshold)
-        shuffle(pieces)
+        self.shuffle_pieces(pieces)
         return pieces
 
+    @staticmethod
+    def get_segments_many(games: list, threshold: float = 0.4) -> list:
+        '''
+        get_segments for several games at once, returns a list of pieces for
+        each game
+        '''
+        # XXX: hardcoded to Kriol
+        all_pieces = pmi.segment_many([game.word for game in games], 'rop', threshold)
+        for game, pieces in zip(games, all_pieces):
+            game.shuffle_pieces(pieces)
+        return all_pieces
+
+    def shuffle_pieces(self, pieces: list) -> None:
+        '''
+        shuffle the pieces in place, the same way every time for a version of
+        the game, so its details can be cached
+        '''
+        Random('{}:{}'.format(self.id, self.version)).shuffle(pieces)
+
+        # don't show the puzzle already solved, if there's an order that isn't
+        for _ in range(len(pieces)):
+            if ''.join(pieces) != self.word:
+                break
+            pieces.append(pieces.pop(0))
+
+    def bump_version(self) -> None:
+        '''
+        mark the game details as changed, in sql so concurrent bumps all count
+        '''
+        self.version = Game.version + 1
+
+
+# search matches words case insensitively, so prefix scans (see
+# tools.search_games) need an index on the lowercased word
+db.Index('ix_games_word_lower', db.func.lower(Game.word))
+
+
+# full text index on game words for search (see tools.search_games). It's an
+# external content table over `games`, kept in sync by triggers, and uses the
+# trigram tokenizer so it can do substring and fuzzy matching. SQLite 3.34+
+# only; other databases fall back to a LIKE query. Created along with `games`,
+# or for an existing database by `flask rebuild-search`.
+GAMES_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS games_fts USING fts5("
+    "word, content='games', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS games_fts_insert AFTER INSERT ON games BEGIN "
+    "INSERT INTO games_fts(rowid, word) VALUES (new.id, new.word); END",
+    "CREATE TRIGGER IF NOT EXISTS games_fts_delete AFTER DELETE ON games BEGIN "
+    "INSERT INTO games_fts(games_fts, rowid, word) VALUES ('delete', old.id, old.word); END",
+    "CREATE TRIGGER IF NOT EXISTS games_fts_update AFTER UPDATE OF word ON games BEGIN "
+    "INSERT INTO games_fts(games_fts, rowid, word) VALUES ('delete', old.id, old.word); "
+    "INSERT INTO games_fts(rowid, word) VALUES (new.id, new.word); END",
+)
+
+def has_games_fts(bind) -> bool:
+    '''
+    whether the database can have the games_fts index
+    '''
+    # the trigram tokenizer was added in sqlite 3.34
+    return bind.dialect.name == 'sqlite' and sqlite3.sqlite_version_info >= (3, 34, 0)
+
+
+for ddl in GAMES_FTS_DDL:
+    db.event.listen(Game.__table__, 'after_create', db.DDL(ddl).execute_if(
+            callable_=lambda ddl, target, bind, **kw: has_games_fts(bind)))
+
+db.event.listen(Game.__table__, 'before_drop',
+        db.DDL('DROP TABLE IF EXISTS games_fts').execute_if(dialect='sqlite'))
+
 
 class Category(db.Model):
     __tablename__ = 'categories'
@@ -225,22 +339,66 @@ class Card(db.Model):
     learnt status, etc.
     '''
     __tablename__ = 'cards'
+    __table_args__ = (
+        # the review queue is always "this user's cards, soonest due first"
+        db.Index('ix_cards_user_due', 'user_id', 'due'),
+    )
+
+    # SRS tuning, loosely following SM-2
+    DEFAULT_EASE = 2.5
+    MIN_EASE = 1.3
+    # how soon a failed card comes back for another try
+    RELEARN_DELAY = datetime.timedelta(minutes=10)
 
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
     game_id = db.Column(db.Integer, db.ForeignKey('games.id'), primary_key=True)
 
     game = db.relationship('Game', lazy=True)
     n_plays = db.Column(db.Integer, nullable=False, default=0)
+    last_played = db.Column(db.DateTime, nullable=True)
 
-    # TODO: include metadata about reviews for SRS purposes
+    # SRS state: ease factor, current interval in days, number of passes in a
+    # row, and when the card is next due for review
+    ease = db.Column(db.Float, nullable=False, default=DEFAULT_EASE)
+    interval = db.Column(db.Integer, nullable=False, default=0)
+    streak = db.Column(db.Integer, nullable=False, default=0)
+    due = db.Column(db.DateTime, nullable=False, default=datetime.datetime.utcnow)
 
     def __init__(self, user: User, game: Game) -> None:
         self.game = game
         self.user = user
         self.n_plays = 0
+        self.ease = Card.DEFAULT_EASE
+        self.interval = 0
+        self.streak = 0
+        self.due = datetime.datetime.utcnow()
 
     def add_play(self) -> None:
         self.n_plays += 1
+        self.last_played = datetime.datetime.utcnow()
+
+    def review(self, passed: bool) -> None:
+        '''
+        schedule the next review based on whether this play was a pass or fail
+        '''
+        now = datetime.datetime.utcnow()
+
+        if not passed:
+            self.streak = 0
+            self.interval = 0
+            self.ease = max(Card.MIN_EASE, self.ease - 0.2)
+            self.due = now + Card.RELEARN_DELAY
+            return
+
+        if self.streak == 0:
+            self.interval = 1
+        elif self.streak == 1:
+            self.interval = 6
+        else:
+            self.interval = int(round(self.interval * self.ease))
+        self.streak += 1
+        self.ease += 0.1
+        self.due = now + datetime.timedelta(days=self.interval)
 
 
 class Flag(db.Model):
@@ -260,6 +418,11 @@ class Flag(db.Model):
     # date of report
     date = db.Column(db.DateTime, default=datetime.datetime.utcnow, nullable=False)
 
+    # set once an admin has dealt with the report
+    resolved = db.Column(db.Boolean, default=False, nullable=False)
+
+    user = db.relationship('User', lazy=True)
+
     def __init__(self, user: User, game: Game) -> None:
         self.game = game
         self.user = user
@@ -270,15 +433,126 @@ class Like(db.Model):
     user likes/thumbsup/upvotes for games
     '''
     __tablename__ = 'likes'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'game_id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
     game_id = db.Column(db.Integer, db.ForeignKey('games.id'), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
 
+    user = db.relationship('User', lazy=True)
+
     # date of like
     date = db.Column(db.DateTime, default=datetime.datetime.utcnow, nullable=False)
 
     def __init__(self, user: User, game: Game) -> None:
         self.game = game
         self.user = user
+
+
+class GameScore(db.Model):
+    '''
+    precomputed time-decayed popularity score for a game, for the trending feed
+
+    Each like or play adds `weight * 2 ** (age / HALF_LIFE)`, where age is the
+    time of the event since SCORE_EPOCH. Because every score decays at the same
+    rate, comparing these sums gives the same order as comparing decayed scores
+    at any point in time, so a score only needs updating when something
+    happens, never just because time passes.
+
+    NOTE: scores grow by 2x every HALF_LIFE. With the default 7 day half life
+    they stay well inside float range until the late 2030s; before then, move
+    SCORE_EPOCH forward and run `flask rebuild-scores`.
+    '''
+    __tablename__ = 'game_scores'
+
+    SCORE_EPOCH = datetime.datetime(2018, 1, 1)
+    HALF_LIFE = datetime.timedelta(days=7)
+
+    LIKE_WEIGHT = 3
+    PLAY_WEIGHT = 1
+
+    game_id = db.Column(db.Integer, db.ForeignKey('games.id'), primary_key=True)
+    score = db.Column(db.Float, nullable=False, default=0, index=True)
+
+    def __init__(self, game_id: int, score: float) -> None:
+        self.game_id = game_id
+        self.score = score
+
+    @staticmethod
+    def weigh(weight: float, when: datetime.datetime) -> float:
+        '''
+        the amount an event of `weight` at time `when` adds to a score
+        '''
+        return weight * 2 ** ((when - GameScore.SCORE_EPOCH) / GameScore.HALF_LIFE)
+
+    @staticmethod
+    def add(game_id: int, weight: float, when: datetime.datetime = None) -> None:
+        '''
+        add an event to a game's score (a negative weight takes one away)
+
+        This is done as a single upsert statement on the current session, so
+        concurrent updates to the same game don't clobber each other.
+        '''
+        if when is None:
+            when = datetime.datetime.utcnow()
+
+        db.session.execute(db.text(
+            'INSERT INTO game_scores (game_id, score) VALUES (:game_id, :score) '
+            'ON CONFLICT (game_id) DO UPDATE SET score = game_scores.score + excluded.score'),
+            {'game_id': game_id, 'score': GameScore.weigh(weight, when)})
+
+
+class Job(db.Model):
+    '''
+    a unit of background work, run by `flask worker` (see jobs.py)
+    '''
+    __tablename__ = 'jobs'
+    __table_args__ = (
+        # workers look for the next queued job that's ready to run
+        db.Index('ix_jobs_status_run_at', 'status', 'run_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    # name of the registered job function, and its json encoded kwargs
+    name = db.Column(db.String(64), nullable=False)
+    payload = db.Column(db.Text, nullable=False, default='{}')
+
+    # if set, only one job with this key is ever enqueued
+    key = db.Column(db.String(128), unique=True, nullable=True)
+
+    # queued, running, done or failed
+    status = db.Column(db.String(16), nullable=False, default='queued')
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=5)
+    last_error = db.Column(db.Text, nullable=True)
+
+    # not run before this time (used for retry backoff)
+    run_at = db.Column(db.DateTime, nullable=False, default=datetime.datetime.utcnow)
+    # when a worker started running it
+    locked_at = db.Column(db.DateTime, nullable=True)
+    created = db.Column(db.DateTime, nullable=False, default=datetime.datetime.utcnow)
+    updated = db.Column(db.DateTime, nullable=False, default=datetime.datetime.utcnow)
+
+    def __repr__(self):
+        return 'Job(id={!r}, name={!r}, status={!r})'.format(self.id, self.name, self.status)
+
+
+class ImportProgress(db.Model):
+    '''
+    how far `flask import-games` got through a manifest (see importer.py),
+    saved in the same transaction as each batch of games
+    '''
+    __tablename__ = 'import_progress'
+
+    # absolute path of the manifest
+    manifest = db.Column(db.String(1024), primary_key=True)
+    # number of manifest rows committed
+    rows_done = db.Column(db.Integer, nullable=False, default=0)
+
+    def __init__(self, manifest: str, rows_done: int = 0) -> None:
+        self.manifest = manifest
+        self.rows_done = rows_done
@@ -3,8 +3,12 @@
 
 import sys
 import math
+import logging
+import threading
 from collections import defaultdict
 
+logger = logging.getLogger(__name__)
+
 class PMI(object):
     def __init__(self):
         self.total = 0
@@ -46,6 +50,10 @@ class PMI(object):
         x = x.lower()
         y = y.lower()
 
+        # nothing to go on (eg. empty word list)
+        if not self.total or not self.total_pairs:
+            return -5
+
         p_x = self.letter_freqs.get(x, 0) / self.total
         p_y = self.letter_freqs.get(y, 0) / self.total
 
@@ -72,6 +80,14 @@ PMIs = {
     # 'en': PMI(),
 }
 
+# paths to the word list to train each language's PMI from, set by create_app
+WORDLISTS = {
+    # 'en': 'res/english.txt',
+}
+
+_lock = threading.Lock()
+
+
 def init_pmi(language, word_file_obj):
     pmi_machine = PMI()
 
@@ -81,20 +97,61 @@ def init_pmi(language, word_file_obj):
     PMIs[language] = pmi_machine
 
 
+def get_pmi(language):
+    '''
+    returns the PMI for a language, training it from its word list on first use
+
+    A missing word list is logged and treated as empty, rather than stopping
+    the server from starting.
+    '''
+    if language not in PMIs:
+        with _lock:
+            # another thread may have loaded it while we waited
+            if language not in PMIs:
+                path = WORDLISTS[language]
+                try:
+                    with open(path) as f:
+                        init_pmi(language, f)
+                except FileNotFoundError:
+                    logger.warning('word list %s for %r not found, word segmentation '
+                                   'will be poor', path, language)
+                    PMIs[language] = PMI()
+    return PMIs[language]
+
+
+def preload():
+    '''
+    train the PMIs for all configured languages now, rather than on first use
+    '''
+    for language in WORDLISTS:
+        get_pmi(language)
+
+
 def segment(word, language='en', threshold=0):
-    pmi_machine = PMIs[language]
-
-    probs = []
-    for i in range(0, len(word)-1):
-        p = pmi_machine.pmi(word[i], word[i+1])
-        probs.append(p)
-
-    pieces = []
-    last = 0
-    for i, p in enumerate(probs):
-        if p < threshold:
-            pieces.append(word[last:i+1])
-            last = i+1
-    pieces.append(word[last:])
-
-    return pieces
+    return segment_many([word], language, threshold)[0]
+
+
+def segment_many(words, language='en', threshold=0):
+    '''
+    segment several words, returns a list of pieces for each word
+
+    The pmi for each pair of letters is only worked out once for all the words.
+    '''
+    pmi_machine = get_pmi(language)
+    pair_pmis = {}
+
+    all_pieces = []
+    for word in words:
+        pieces = []
+        last = 0
+        for i in range(0, len(word)-1):
+            pair = word[i:i+2]
+            if pair not in pair_pmis:
+                pair_pmis[pair] = pmi_machine.pmi(word[i], word[i+1])
+            if pair_pmis[pair] < threshold:
+                pieces.append(word[last:i+1])
+                last = i+1
+        pieces.append(word[last:])
+        all_pieces.append(pieces)
+
+    return all_pieces
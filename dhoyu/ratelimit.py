@@ -0,0 +1,234 @@
+'''
+rate limiting and admission control
+
+Per route limits are set with the `rate_limit` decorator in the blueprint,
+using token buckets keyed by endpoint and either the client ip or the user:
+
+    @bp.route('/token', methods=('POST', ))
+    @rate_limit('10/minute', key='ip')
+    def get_token():
+        ...
+
+    @bp.route('/games', methods=('POST', ))
+    @token_required
+    @rate_limit('20/minute', key='user')  # after token_required, to have g.user
+    def create_game():
+        ...
+
+A client over its limit gets a 429 with a Retry-After header. The buckets are
+kept in a small sqlite database (RATELIMIT_DB), so limits hold across all the
+gunicorn workers on a host. Set RATELIMIT_STORAGE = 'memory' to keep them in
+process instead (eg. for a single process server).
+
+Separately, if MAX_IN_FLIGHT is set, a process won't handle more than that
+many requests at once, and answers any more straight away with a 503 rather
+than letting them queue.
+'''
+
+import math
+import os
+import sqlite3
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, g, request
+from werkzeug.exceptions import ServiceUnavailable, TooManyRequests
+
+
+PERIODS = {
+    'second': 1,
+    'minute': 60,
+    'hour': 60 * 60,
+    'day': 24 * 60 * 60,
+}
+
+
+class RateLimited(TooManyRequests):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__('too many requests, try again in {} seconds'.format(retry_after))
+        self.retry_after = retry_after
+
+
+class Overloaded(ServiceUnavailable):
+    def __init__(self) -> None:
+        super().__init__('server busy, try again shortly')
+        self.retry_after = 1
+
+
+def parse_limit(limit: str) -> tuple:
+    '''
+    parses eg. '10/minute' into (bucket capacity, tokens added per second)
+    '''
+    n, period = limit.split('/')
+    n = int(n)
+    return n, n / PERIODS[period]
+
+
+def refill(tokens: float, updated: float, capacity: int, rate: float, now: float) -> tuple:
+    '''
+    adds the tokens earned since `updated` to a bucket, then takes one if there
+    is one. returns (tokens left, seconds to wait until a token is available),
+    the wait being 0 if one was taken.
+    '''
+    tokens = min(capacity, tokens + (now - updated) * rate)
+    if tokens >= 1:
+        return tokens - 1, 0
+    return tokens, (1 - tokens) / rate
+
+
+class MemoryStore(object):
+    '''
+    token buckets in a dict, only shared between threads of one process
+
+    take returns the seconds to wait for a token, or 0 if one was taken.
+    '''
+
+    def __init__(self) -> None:
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def take(self, key: str, capacity: int, rate: float, now: float) -> float:
+        with self.lock:
+            tokens, updated = self.buckets.get(key, (capacity, now))
+            tokens, wait = refill(tokens, updated, capacity, rate, now)
+            self.buckets[key] = (tokens, now)
+            return wait
+
+
+class SQLiteStore(object):
+    '''
+    token buckets in a sqlite database, shared by all processes on the host
+    '''
+
+    # how often (in calls to take) to delete buckets that haven't been used in
+    # a day, so the table doesn't grow forever
+    PRUNE_EVERY = 10000
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.local = threading.local()
+        self.calls = 0
+
+    def connect(self) -> sqlite3.Connection:
+        # connections can't be shared across threads or forks
+        if getattr(self.local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=1, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=OFF')
+            conn.execute('CREATE TABLE IF NOT EXISTS buckets '
+                         '(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)')
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return self.local.conn
+
+    def take(self, key: str, capacity: int, rate: float, now: float) -> float:
+        conn = self.connect()
+
+        # lock for writing first, so the read-modify-write is atomic
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT tokens, updated FROM buckets WHERE key = ?',
+                               (key, )).fetchone()
+            tokens, updated = row if row is not None else (capacity, now)
+            tokens, wait = refill(tokens, updated, capacity, rate, now)
+            conn.execute('INSERT INTO buckets (key, tokens, updated) VALUES (?, ?, ?) '
+                         'ON CONFLICT (key) DO UPDATE SET tokens = excluded.tokens, '
+                         'updated = excluded.updated', (key, tokens, now))
+
+            self.calls += 1
+            if self.calls % SQLiteStore.PRUNE_EVERY == 0:
+                conn.execute('DELETE FROM buckets WHERE updated < ?', (now - PERIODS['day'], ))
+
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        return wait
+
+
+def get_store():
+    store = current_app.extensions.get('ratelimit')
+    if store is None:
+        if current_app.config['RATELIMIT_STORAGE'] == 'memory':
+            store = MemoryStore()
+        else:
+            store = SQLiteStore(current_app.config['RATELIMIT_DB'])
+        current_app.extensions['ratelimit'] = store
+    return store
+
+
+def get_client_ip() -> str:
+    '''
+    the client's ip, taking into account RATELIMIT_PROXIES reverse proxies
+    (eg. nginx) in front of the server which add X-Forwarded-For
+    '''
+    proxies = current_app.config['RATELIMIT_PROXIES']
+    if proxies:
+        route = request.access_route
+        if len(route) >= proxies:
+            return route[-proxies]
+    return request.remote_addr
+
+
+def rate_limit(limit: str, key: str = 'ip'):
+    '''
+    decorator to limit how often a route can be called, eg. '10/minute'
+
+    `key` is 'ip' to limit each client ip, or 'user' to limit each user (this
+    must then be applied after token_required)
+    '''
+    capacity, rate = parse_limit(limit)
+
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            if not current_app.config['RATELIMIT_ENABLED']:
+                return f(*args, **kwargs)
+
+            if key == 'user':
+                ident = 'user:{}'.format(g.user.id)
+            else:
+                ident = 'ip:{}'.format(get_client_ip())
+            bucket = '{}:{}'.format(request.endpoint, ident)
+
+            try:
+                wait = get_store().take(bucket, capacity, rate, time.time())
+            except sqlite3.Error as e:
+                # better to let requests through than fail them all
+                current_app.logger.warning('rate limit check failed: %s', e)
+                return f(*args, **kwargs)
+
+            if wait:
+                raise RateLimited(int(math.ceil(wait)))
+
+            return f(*args, **kwargs)
+        return decorated
+    return decorator
+
+
+_in_flight = {'n': 0}
+_in_flight_lock = threading.Lock()
+
+
+def admit() -> None:
+    limit = current_app.config['MAX_IN_FLIGHT']
+    if not limit:
+        return
+    with _in_flight_lock:
+        if _in_flight['n'] >= limit:
+            raise Overloaded()
+        _in_flight['n'] += 1
+    g.admitted = True
+
+
+def release(exception=None) -> None:
+    if g.pop('admitted', False):
+        with _in_flight_lock:
+            _in_flight['n'] -= 1
+
+
+def init_app(app) -> None:
+    app.before_request(admit)
+    app.teardown_request(release)
@@ -1,5 +1,9 @@
+from collections import defaultdict
 
-from .models import User, Card, Game
+from sqlalchemy.sql import column, table
+
+from . import db
+from .models import GAMES_FTS_DDL, User, Card, Game, GameScore, Like, has_games_fts
 
 def get_card(user: User, game: Game) -> Card:
     '''
@@ -10,3 +14,97 @@ def get_card(user: User, game: Game) -> Card:
     if card is None:
         return Card(user, game)
     return card
+
+
+# the fts5 index created alongside the games table (see models.py). This is a
+# lightweight table construct, so it's not part of the metadata used by
+# create_all.
+games_fts = table('games_fts', column('rowid'), column('rank'))
+
+
+def search_games(q: str, user: User):
+    '''
+    returns a query for games visible to `user` matching the search string `q`,
+    best matches first
+
+    Words starting with `q` rank first, then the rest by the number of
+    trigrams they share with `q` (so close misspellings still match).
+    '''
+    q = q.lower().strip()
+    word = db.func.lower(Game.word)
+
+    games = Game.query.filter(db.or_(Game.public == True, Game.author == user))
+    prefix = db.case([(word.startswith(q, autoescape=True), 0)], else_=1)
+
+    if not has_games_fts(db.engine):
+        return games.filter(word.contains(q, autoescape=True)).order_by(prefix, word)
+
+    # trigram search needs at least 3 characters, so do a prefix scan of the
+    # lowercased word index for very short queries
+    if len(q) < 3:
+        return games.filter(word >= q, word < q + '\uffff').order_by(word)
+
+    trigrams = sorted(set(q[i:i+3] for i in range(len(q) - 2)))
+    match = ' OR '.join('"{}"'.format(t.replace('"', '""')) for t in trigrams)
+
+    return games.join(games_fts, games_fts.c.rowid == Game.id).filter(
+            db.text('games_fts MATCH :match').bindparams(match=match)).order_by(
+            prefix, games_fts.c.rank)
+
+
+def rebuild_search_index() -> int:
+    '''
+    create the search indexes if they're missing (eg. on a database made before
+    search was added), and rebuild the full text index from the games table
+    returns the number of games indexed
+    '''
+    if db.engine.dialect.name == 'sqlite':
+        # the inspector skips expression indexes (like lower(word)) on sqlite
+        existing = set(name for name, in db.session.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'games'"))
+    else:
+        existing = set(index['name'] for index in db.inspect(db.engine).get_indexes('games'))
+    db.session.commit()
+
+    for index in Game.__table__.indexes:
+        if index.name not in existing:
+            index.create(db.engine)
+
+    if has_games_fts(db.engine):
+        for ddl in GAMES_FTS_DDL:
+            db.session.execute(ddl)
+        db.session.execute("INSERT INTO games_fts(games_fts) VALUES ('rebuild')")
+    db.session.commit()
+
+    return Game.query.count()
+
+
+def rebuild_scores() -> int:
+    '''
+    recompute every game's trending score from scratch from likes and plays
+    returns the number of games with a score
+
+    Scores are normally kept up to date incrementally as games are liked and
+    played. This is for backfilling, or fixing up scores after changing the
+    weights or epoch. Plays only record when a card was last played, so all
+    of a card's plays count as happening at that time.
+    '''
+    scores = defaultdict(float)
+
+    for game_id, date in db.session.query(Like.game_id, Like.date).yield_per(1000):
+        scores[game_id] += GameScore.weigh(GameScore.LIKE_WEIGHT, date)
+
+    plays = db.session.query(Card.game_id, Card.n_plays, Card.last_played).filter(
+            Card.last_played != None)
+    for game_id, n_plays, last_played in plays.yield_per(1000):
+        scores[game_id] += GameScore.weigh(GameScore.PLAY_WEIGHT * n_plays, last_played)
+
+    GameScore.query.delete()
+    # an insert with an empty list would add a single row of defaults
+    if scores:
+        db.session.execute(GameScore.__table__.insert(), [
+            {'game_id': game_id, 'score': score} for game_id, score in scores.items()
+        ])
+    db.session.commit()
+
+    return len(scores)
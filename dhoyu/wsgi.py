@@ -0,0 +1,13 @@
+'''
+wsgi entrypoint for production
+
+    gunicorn --preload -w 4 -b 127.0.0.1:8000 dhoyu.wsgi:app
+
+With `--preload`, this is imported once in the gunicorn master, so the
+expensive read-only data is built there and shared with all the workers.
+'''
+
+from . import create_app, preload
+
+app = create_app()
+preload(app)